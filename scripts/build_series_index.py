@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Build the local BM25 series search index from a series metadata CSV.
+
+Reads the same CSV as `scripts/index_opensearch.py` (or a `catalog.json.gz`
+written by `scripts/crawl_fred_catalog.py`) and writes the compact
+index that `fred_search_series` answers from (default location:
+`FRED_SERIES_INDEX_PATH`, or `.cache/retrieval_graph/fred_series_index.npz`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dotenv import load_dotenv
+
+from retrieval_graph.series_index import SeriesIndex, default_index_path
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default="seriesdatasample.csv",
+        help="Path to the series metadata CSV or crawled catalog.json.gz.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Where to write the index (default: FRED_SERIES_INDEX_PATH or the cache dir).",
+    )
+    parser.add_argument(
+        "--query",
+        action="append",
+        default=[],
+        help="Run a sample query against the freshly built index (repeatable).",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = SeriesIndex.from_file(args.csv_path)
+    output = args.output or default_index_path()
+    index.save(output)
+    print(
+        f"Indexed {len(index)} series ({len(index.terms)} terms) into {output} "
+        f"in {time.perf_counter() - started:.1f}s."
+    )
+
+    for query in args.query:
+        started = time.perf_counter()
+        hits = index.search(query)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"\n{query!r} ({elapsed_ms:.2f} ms)")
+        for hit in hits:
+            print(f"  {hit.score:8.2f}  {hit.series['id']:<16} {hit.series['title']}")
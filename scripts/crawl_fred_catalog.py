@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Crawl the full FRED series catalog into a columnar catalog file.
+
+Walks every release and pages through its series with bounded concurrency
+and a request rate limit, checkpointing per release so an interrupted run
+resumes where it stopped. The resulting `catalog.json.gz` can optionally be
+turned into the local series search index and loaded into the release
+calendar's series → release mapping.
+
+Environment variables:
+    FRED_API_KEY            (required)
+    FRED_CRAWL_CONCURRENCY  (optional, default 4)
+    FRED_CRAWL_RPS          (optional, default 1.5 requests per second)
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dotenv import load_dotenv
+
+from retrieval_graph.catalog_crawler import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_SECOND,
+    CatalogCrawler,
+    seed_release_calendar,
+)
+from retrieval_graph.fred_api import run_sync
+from retrieval_graph.release_calendar import get_release_calendar
+from retrieval_graph.series_index import SeriesIndex, default_index_path
+from retrieval_graph.utils import cache_path
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output-dir",
+        default=str(cache_path("fred_catalog")),
+        help="Directory for the checkpoint, per-release parts and catalog file.",
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND)
+    parser.add_argument(
+        "--build-index",
+        action="store_true",
+        help="Rebuild the local series search index from the crawled catalog.",
+    )
+    parser.add_argument(
+        "--seed-calendar",
+        action="store_true",
+        help="Load the series → release mapping into the release calendar.",
+    )
+    args = parser.parse_args()
+
+    crawler = CatalogCrawler(
+        args.output_dir, concurrency=args.concurrency, requests_per_second=args.rps
+    )
+    started = time.perf_counter()
+    try:
+        catalog_path = run_sync(crawler.arun())
+    finally:
+        stats = crawler.stats
+        print(
+            f"Crawled {stats.releases} releases ({stats.releases_skipped} resumed) "
+            f"with {stats.requests} requests in {time.perf_counter() - started:.0f}s."
+        )
+    print(f"Wrote {stats.series} series to {catalog_path}.")
+
+    if args.build_index:
+        index = SeriesIndex.from_file(catalog_path)
+        index.save(default_index_path())
+        print(f"Indexed {len(index)} series into {default_index_path()}.")
+    if args.seed_calendar:
+        calendar = get_release_calendar()
+        count = seed_release_calendar(catalog_path, calendar)
+        calendar.save()
+        print(f"Seeded {count} series → release mappings into {calendar.path}.")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare FOMC search latency and results of the SQLite and Postgres backends.
+
+Builds a throwaway in-memory SQLite index from a FRASER export, runs the same
+queries through `search_fomc_titles` on each backend and prints p50/p95
+latency plus how often both backends return the same top result. Postgres is
+skipped when `PG_HOST` is not set.
+
+Environment variables:
+    PG_HOST, PG_PORT, PG_NAME, PG_USER, PG_PASS   (optional)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+from retrieval_graph import fraser_tool
+from retrieval_graph.fomc_index import FomcIndex
+
+load_dotenv()
+
+DEFAULT_EXPORT = Path(__file__).parent / "output" / "title_677_items.json"
+DEFAULT_QUERIES = [
+    "Meeting, January 26-27, 2010",
+    "January 2010 meeting",
+    "march 2001 meeting",
+    "FOMC minutes september 1987",
+    "telephone conference",
+    "unscheduled meeting",
+    "notation vote",
+    "Memoranda of Discussion 1965",
+]
+
+
+def run(backend: str, queries: list[str], runs: int) -> tuple[list[float], dict]:
+    """Time every query `runs` times on `backend`; return samples and top ids."""
+    os.environ["FRASER_BACKEND"] = backend
+    top: dict[str, Any] = {}
+    samples = []
+    for query in queries:
+        fraser_tool.search_fomc_titles(query)  # warm up
+        for _ in range(runs):
+            start = time.perf_counter()
+            payload = fraser_tool.search_fomc_titles(query)
+            samples.append((time.perf_counter() - start) * 1000)
+        if payload.get("error"):
+            raise SystemExit(f"{backend}: {payload['error']}")
+        results = payload["results"]
+        top[query] = results[0]["id"] if results else None
+    return sorted(samples), top
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--export", type=Path, default=DEFAULT_EXPORT)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--query", action="append", dest="queries")
+    args = parser.parse_args()
+    queries = args.queries or DEFAULT_QUERIES
+
+    index = FomcIndex.from_export(args.export, ":memory:")
+    fraser_tool.get_fomc_index = lambda: index  # type: ignore[assignment]
+    backends = ["sqlite"] + (["postgres"] if os.getenv("PG_HOST") else [])
+
+    tops = {}
+    for backend in backends:
+        samples, tops[backend] = run(backend, queries, args.runs)
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(
+            f"{backend:>8}: p50 {statistics.median(samples):7.3f} ms  "
+            f"p95 {p95:7.3f} ms  ({len(samples)} searches)"
+        )
+    if len(tops) == 2:
+        same = sum(tops["sqlite"][q] == tops["postgres"][q] for q in queries)
+        print(f"same top result for {same}/{len(queries)} queries")
+        for query in queries:
+            if tops["sqlite"][query] != tops["postgres"][query]:
+                print(f"  differs: {query!r}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Compare the legacy and trigram-indexed FOMC title searches.
+
+For each table size, fills a temporary copy of `fomc_items` with the real
+FOMC titles from a FRASER export plus synthetic meeting documents, builds the
+same `title` column and trigram index as migration 0001_title_trigram, then
+prints the query plans and p50/p95 latency of both searches. Nothing is
+written to the real tables.
+
+Environment variables:
+    PG_HOST, PG_PORT, PG_NAME, PG_USER, PG_PASS
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+import psycopg2
+from dotenv import load_dotenv
+from psycopg2.extras import Json, execute_values
+
+from retrieval_graph.fraser_tool import TITLE_SIMILARITY_THRESHOLD
+from retrieval_graph.pg_pool import connection_kwargs
+
+load_dotenv()
+
+DEFAULT_SOURCE = Path(__file__).parent / "output" / "title_677_items.json"
+DEFAULT_QUERIES = [
+    "Meeting, January 26-27, 2010",
+    "march 2001 meeting",
+    "FOMC minutes september 1987",
+    "Memoranda of Discussion 1965",
+]
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]  # fmt: skip
+KINDS = ["Meeting", "Minutes", "Transcript", "Memoranda of Discussion", "Greenbook"]
+
+LEGACY_SQL = """
+    SELECT id, titleInfo->0->>'title' AS title, location
+    FROM fomc_items_bench
+    ORDER BY similarity(titleInfo->0->>'title', %(query)s) DESC
+    LIMIT 5
+"""
+INDEXED_SQL = """
+    SELECT id, title, location
+    FROM fomc_items_bench
+    WHERE title %% %(query)s
+    ORDER BY title <-> %(query)s
+    LIMIT 5
+"""
+
+
+def load_titles(path: Path) -> list[str]:
+    """Return the titles in a FRASER `title/{id}/items` export."""
+    records = json.loads(path.read_text())["records"]
+    return [r["titleInfo"][0]["title"] for r in records if r.get("titleInfo")]
+
+
+def synthetic_title(rng: random.Random) -> str:
+    """Return a plausible FOMC document title."""
+    month = rng.choice(MONTHS)
+    day = rng.randint(1, 27)
+    days = f"{day}-{day + 1}" if rng.random() < 0.4 else str(day)
+    return f"{rng.choice(KINDS)}, {month} {days}, {rng.randint(1936, 2025)}"
+
+
+def build_table(cur, titles: list[str], size: int, seed: int) -> None:
+    """(Re)create `fomc_items_bench` with `size` rows and the trigram index."""
+    rng = random.Random(seed)
+    rows = [
+        (
+            i,
+            Json([{"title": titles[i] if i < len(titles) else synthetic_title(rng)}]),
+            Json({"pdfUrl": [f"https://fraser.stlouisfed.org/docs/{i}.pdf"]}),
+        )
+        for i in range(size)
+    ]
+    cur.execute("DROP TABLE IF EXISTS fomc_items_bench")
+    cur.execute(
+        "CREATE TEMP TABLE fomc_items_bench "
+        "(id bigint PRIMARY KEY, titleInfo jsonb, location jsonb)"
+    )
+    execute_values(cur, "INSERT INTO fomc_items_bench VALUES %s", rows, page_size=5000)
+    cur.execute(
+        "ALTER TABLE fomc_items_bench ADD COLUMN title text "
+        "GENERATED ALWAYS AS (titleInfo->0->>'title') STORED"
+    )
+    cur.execute("CREATE INDEX ON fomc_items_bench USING gist (title gist_trgm_ops)")
+    cur.execute("ANALYZE fomc_items_bench")
+
+
+def explain(cur, sql: str, query: str) -> str:
+    """Return the indented `EXPLAIN ANALYZE` plan of `sql`."""
+    cur.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", {"query": query})
+    return "\n".join(f"    {row[0]}" for row in cur.fetchall())
+
+
+def latency_ms(cur, sql: str, queries: list[str], runs: int) -> tuple[float, float]:
+    """Return p50 and p95 latency of `sql` over `queries`, in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        for query in queries:
+            start = time.perf_counter()
+            cur.execute(sql, {"query": query})
+            cur.fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000,500000")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument("--query", action="append", dest="queries")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    titles = load_titles(args.source)
+    queries = args.queries or DEFAULT_QUERIES
+    conn = psycopg2.connect(**{**connection_kwargs(), "options": None})
+    with conn, conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cur.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, false)",
+            (str(TITLE_SIMILARITY_THRESHOLD),),
+        )
+        for size in (int(s) for s in args.sizes.split(",")):
+            build_table(cur, titles, size, args.seed)
+            print(f"\n=== {size:,} rows ===")
+            for label, sql in (("legacy", LEGACY_SQL), ("indexed", INDEXED_SQL)):
+                p50, p95 = latency_ms(cur, sql, queries, args.runs)
+                print(f"{label:>8}: p50 {p50:8.2f} ms  p95 {p95:8.2f} ms")
+                print(explain(cur, sql, queries[0]))
+    conn.close()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Build or refresh the embedded SQLite FOMC index.
+
+Sources (pick one):
+    --from-file PATH    a saved FRASER title/{id}/items JSON export
+                        (default: output/title_677_items.json)
+    --from-api          page through the FRASER API (needs FRASER_API_KEY)
+    --from-postgres     copy the Postgres fomc_items index (needs PG_*)
+
+Unchanged items are skipped, so re-running only applies edits. The index is
+written to FRASER_INDEX_PATH (default: fomc_index.sqlite in the cache dir).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+from dotenv import load_dotenv
+
+from retrieval_graph.fomc_index import FomcIndex
+from retrieval_graph.fraser_ingest import FOMC_TITLE_ID, iter_title_items
+
+load_dotenv()
+
+DEFAULT_EXPORT = Path(__file__).parent / "output" / "title_677_items.json"
+
+
+def postgres_records() -> Iterator[dict[str, Any]]:
+    """Yield the FRASER records stored in the Postgres `fomc_items` table."""
+    from psycopg2.extras import RealDictCursor
+
+    from retrieval_graph.pg_pool import get_pg_pool
+
+    with get_pg_pool().connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                "SELECT titleInfo, originInfo, location, recordInfo FROM fomc_items"
+            )
+            for row in cur:
+                yield {
+                    "titleInfo": row["titleinfo"],
+                    "originInfo": row["origininfo"],
+                    "location": row["location"],
+                    "recordInfo": row["recordinfo"],
+                }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--from-file", type=Path)
+    source.add_argument("--from-api", action="store_true")
+    source.add_argument("--from-postgres", action="store_true")
+    parser.add_argument("--title-id", type=int, default=FOMC_TITLE_ID)
+    parser.add_argument("--index", default=os.getenv("FRASER_INDEX_PATH"))
+    args = parser.parse_args()
+
+    index = FomcIndex(args.index)
+    if args.from_api:
+        changed = index.add(iter_title_items(args.title_id))
+    elif args.from_postgres:
+        changed = index.add(postgres_records())
+    else:
+        export = args.from_file or DEFAULT_EXPORT
+        changed = index.add(json.loads(export.read_text())["records"])
+    print(f"{changed} item(s) added or updated; {len(index)} in {index.path}")
@@ -1,35 +1,63 @@
+#!/usr/bin/env python3
+"""Load FRASER title items into the Postgres `fomc_items` index.
+
+Pages through the FRASER `title/{id}/items` API (or reads a saved export
+with `--from-file`) and upserts the records in COPY batches, rewriting only
+records whose content changed. Apply schema migrations first with
+`scripts/fraser/migrate.py`.
+
+Environment variables:
+    FRASER_API_KEY                          (required unless --from-file)
+    PG_HOST, PG_PORT, PG_NAME, PG_USER, PG_PASS
+"""
+
+from __future__ import annotations
+
+import argparse
 import json
-import psycopg2
+import logging
+import time
+from dataclasses import asdict
+from pathlib import Path
 
-# 1. Load your local JSON file
-with open("output/title_677_items.json", "r") as f:
-    data = json.load(f)
+import psycopg2
+from dotenv import load_dotenv
 
-# 2. Connect to your AWS PostgreSQL
-conn = psycopg2.connect(
-    host="fomc-db.c6voia0autyx.us-east-1.rds.amazonaws.com",
-    user="postgres",
-    password="Darky5657#",
-    dbname="fomc"
+from retrieval_graph.fraser_ingest import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    FOMC_TITLE_ID,
+    ingest,
+    iter_title_items,
 )
-cur = conn.cursor()
-
-# 3. Loop and insert
-for item in data["records"]:
-    cur.execute("""
-        INSERT INTO fomc_items (id, titleInfo, originInfo, location, recordInfo)
-        VALUES (%s, %s, %s, %s, %s)
-        ON CONFLICT (id) DO NOTHING;
-    """, (
-        item["recordInfo"]["recordIdentifier"][0],
-        json.dumps(item["titleInfo"]),
-        json.dumps(item.get("originInfo", {})),
-        json.dumps(item.get("location", {})),
-        json.dumps(item["recordInfo"])
-    ))
-
-conn.commit()
-cur.close()
-conn.close()
-
-print("✅ All FOMC items inserted.")
\ No newline at end of file
+from retrieval_graph.pg_pool import connection_kwargs
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--title-id", type=int, default=FOMC_TITLE_ID)
+    parser.add_argument(
+        "--from-file",
+        type=Path,
+        help="Read records from a saved title/{id}/items JSON export instead.",
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.from_file:
+        records = json.loads(args.from_file.read_text())["records"]
+    else:
+        records = iter_title_items(args.title_id, page_size=args.page_size)
+
+    started = time.perf_counter()
+    # No statement timeout: large merges can exceed the serving default.
+    conn = psycopg2.connect(**{**connection_kwargs(), "options": None})
+    try:
+        stats = ingest(conn, records, batch_size=args.batch_size)
+    finally:
+        conn.close()
+    print(json.dumps(asdict(stats)), f"in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Apply pending FRASER index schema migrations.
+
+Environment variables:
+    PG_HOST, PG_PORT, PG_NAME, PG_USER, PG_PASS
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import psycopg2
+from dotenv import load_dotenv
+
+from retrieval_graph.fraser_schema import MIGRATIONS, apply_migrations
+from retrieval_graph.pg_pool import connection_kwargs
+
+load_dotenv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--list", action="store_true", help="List known migrations and exit."
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for migration in MIGRATIONS:
+            print(migration.name)
+        raise SystemExit(0)
+
+    # No statement timeout: building indexes can take a while.
+    conn = psycopg2.connect(**{**connection_kwargs(), "options": None})
+    try:
+        applied = apply_migrations(conn)
+    finally:
+        conn.close()
+    print(f"Applied {len(applied)} migration(s): {', '.join(applied) or 'none'}")
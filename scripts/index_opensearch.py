@@ -25,6 +25,8 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 from opensearchpy import OpenSearch, helpers
 from tqdm import tqdm
 
+from retrieval_graph.catalog_crawler import iter_catalog_rows
+
 load_dotenv()
 
 DEFAULT_INDEX = "fred-series"
@@ -104,6 +106,15 @@ def build_content(row: dict[str, str]) -> str:
     return "\n".join(part for part in parts if part.strip())
 
 
+def iter_rows(path: str) -> Iterator[dict[str, str]]:
+    """Yield metadata rows from a CSV or a crawled `catalog.json.gz`."""
+    if path.endswith(".json.gz"):
+        yield from iter_catalog_rows(path)
+        return
+    with open(path, "r", encoding="utf-8-sig") as handle:
+        yield from csv.DictReader(handle)
+
+
 splitter = RecursiveCharacterTextSplitter(
     chunk_size=800,
     chunk_overlap=100,
@@ -117,37 +128,35 @@ def iter_documents(
     user_id: str,
     index_name: str,
 ) -> Iterator[dict[str, object]]:
-    with open(csv_path, "r", encoding="utf-8-sig") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            base = {
-                "series_id": row.get("series_id", "").strip(),
-                "title": row.get("title", "").strip(),
-                "frequency": row.get("frequency", "").strip(),
-                "frequency_short": row.get("frequency_short", "").strip(),
-                "units": row.get("units", "").strip(),
-                "units_short": row.get("units_short", "").strip(),
-                "season": row.get("season", "").strip(),
-                "season_short": row.get("season_short", "").strip(),
-                "period_description": row.get("period_description", "").strip(),
-                "user_id": user_id,
-                "data_type": "economic_series",
+    for row in iter_rows(csv_path):
+        base = {
+            "series_id": row.get("series_id", "").strip(),
+            "title": row.get("title", "").strip(),
+            "frequency": row.get("frequency", "").strip(),
+            "frequency_short": row.get("frequency_short", "").strip(),
+            "units": row.get("units", "").strip(),
+            "units_short": row.get("units_short", "").strip(),
+            "season": row.get("season", "").strip(),
+            "season_short": row.get("season_short", "").strip(),
+            "period_description": row.get("period_description", "").strip(),
+            "user_id": user_id,
+            "data_type": "economic_series",
+        }
+        content = build_content(row)
+        chunks = splitter.split_text(content) or [content]
+        for chunk_index, chunk in enumerate(chunks):
+            if not chunk.strip():
+                continue
+            doc = {
+                **base,
+                "content": chunk,
+                "chunk_index": chunk_index,
+            }
+            yield {
+                "_index": index_name,
+                "_id": str(uuid.uuid4()),
+                "_source": doc,
             }
-            content = build_content(row)
-            chunks = splitter.split_text(content) or [content]
-            for chunk_index, chunk in enumerate(chunks):
-                if not chunk.strip():
-                    continue
-                doc = {
-                    **base,
-                    "content": chunk,
-                    "chunk_index": chunk_index,
-                }
-                yield {
-                    "_index": index_name,
-                    "_id": str(uuid.uuid4()),
-                    "_source": doc,
-                }
 
 
 def bulk_index(
@@ -176,7 +185,7 @@ if __name__ == "__main__":
         "csv_path",
         nargs="?",
         default="seriesdatasample.csv",
-        help="Path to the CSV file containing series metadata.",
+        help="Path to the series metadata CSV or crawled catalog.json.gz.",
     )
     parser.add_argument(
         "--user-id",
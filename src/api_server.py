@@ -63,11 +63,45 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
+@app.on_event("startup")
+async def start_warmup():
+    """Preload caches for the hot series set without delaying startup."""
+    from retrieval_graph import webapp
+
+    await webapp.start_warmup()
+
+
 @app.get("/")
 async def root():
     return {"message": "LangGraph backend is running", "status": "healthy"}
 
 
+# The deployed LangGraph server mounts these handlers from `retrieval_graph.webapp`;
+# imported lazily so the package loads after `load_dotenv()` above.
+@app.get("/ready")
+async def ready():
+    """Report ready once the cache warm-up has finished or used up its budget."""
+    from retrieval_graph import webapp
+
+    return await webapp.ready()
+
+
+@app.get("/attachments/{digest}")
+async def get_attachment(digest: str, if_none_match: Optional[str] = Header(None)):
+    """Serve attachment bytes by content digest with strong, immutable caching."""
+    from retrieval_graph import webapp
+
+    return await webapp.get_attachment(digest, if_none_match)
+
+
+@app.get("/stats/tools")
+async def tool_stats():
+    """Report per-tool single-flight counters (calls, executions, coalesced)."""
+    from retrieval_graph import webapp
+
+    return await webapp.tool_stats()
+
+
 @app.post("/ask")
 async def ask(query: Query, current_user: dict = Depends(get_current_user)):
     user_id = current_user["id"]
@@ -0,0 +1,158 @@
+"""Content-addressed store for attachment bytes.
+
+Chart images used to travel as base64 data URIs inside `State.attachments`,
+which meant every reducer step, checkpoint and `/ask` response carried the
+full image. Attachments now carry only the SHA-256 digest of their bytes; the
+bytes themselves live on the local filesystem under
+`RETRIEVAL_GRAPH_CACHE_DIR/blobs/<digest[:2]>/<digest>.<ext>` and are served
+by `GET /attachments/{digest}` (`retrieval_graph.webapp`).
+
+Because a digest names exactly one byte sequence, blobs are immutable: the
+same chart stored twice is written once, and clients may cache responses
+forever. The store is bounded by `ATTACHMENT_STORE_MAX_BYTES`; when it grows
+past that, the least recently used blobs are deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from retrieval_graph.utils import cache_path
+
+DEFAULT_MAX_BYTES = int(os.getenv("ATTACHMENT_STORE_MAX_BYTES", str(512 * 1024 * 1024)))
+ATTACHMENT_URL_PREFIX = os.getenv("ATTACHMENT_URL_PREFIX", "/attachments")
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+_EXTENSIONS = {"image/png": ".png", "image/svg+xml": ".svg", "image/jpeg": ".jpg"}
+
+
+def is_digest(value: str) -> bool:
+    """Return whether `value` looks like a blob digest (lowercase SHA-256 hex)."""
+    return bool(_DIGEST.match(value))
+
+
+def attachment_url(digest: str) -> str:
+    """Return the API path that serves the blob with `digest`."""
+    return f"{ATTACHMENT_URL_PREFIX.rstrip('/')}/{digest}"
+
+
+@dataclass(frozen=True)
+class Blob:
+    """A stored blob on disk."""
+
+    digest: str
+    path: Path
+    media_type: str
+    size: int
+
+
+class BlobStore:
+    """Filesystem-backed, content-addressed blob store with an LRU size bound."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Open the store at `root`, indexing any blobs already on disk."""
+        self.root = Path(root) if root else cache_path("blobs")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, Blob] = OrderedDict()
+        self._total = 0
+        self._scan()
+
+    def _scan(self) -> None:
+        found = []
+        for path in self.root.glob("??/*"):
+            digest = path.stem
+            if not is_digest(digest) or not path.is_file():
+                continue
+            stat = path.stat()
+            media_type = (
+                mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            )
+            found.append((stat.st_mtime, Blob(digest, path, media_type, stat.st_size)))
+        for _, blob in sorted(found, key=lambda item: item[0]):
+            self._index[blob.digest] = blob
+            self._total += blob.size
+
+    def __len__(self) -> int:
+        """Return the number of stored blobs."""
+        return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored blobs."""
+        return self._total
+
+    def put(self, data: bytes, media_type: str) -> str:
+        """Store `data` (if not already present) and return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._index:
+                self._index.move_to_end(digest)
+                return digest
+            extension = (
+                _EXTENSIONS.get(media_type)
+                or mimetypes.guess_extension(media_type)
+                or ""
+            )
+            path = self.root / digest[:2] / f"{digest}{extension}"
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+            self._index[digest] = Blob(digest, path, media_type, len(data))
+            self._total += len(data)
+            self._evict(keep=digest)
+        return digest
+
+    def get(self, digest: str) -> Blob | None:
+        """Return the blob for `digest`, marking it recently used."""
+        with self._lock:
+            blob = self._index.get(digest)
+            if blob is None:
+                return None
+            if not blob.path.exists():
+                del self._index[digest]
+                self._total -= blob.size
+                return None
+            self._index.move_to_end(digest)
+        try:
+            os.utime(blob.path)
+        except OSError:
+            pass
+        return blob
+
+    def read(self, digest: str) -> bytes | None:
+        """Return the bytes stored under `digest`, if present."""
+        blob = self.get(digest)
+        return blob.path.read_bytes() if blob else None
+
+    def _evict(self, *, keep: str) -> None:
+        while self._total > self.max_bytes and len(self._index) > 1:
+            digest, blob = next(iter(self._index.items()))
+            if digest == keep:
+                break
+            del self._index[digest]
+            self._total -= blob.size
+            blob.path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def get_blob_store() -> BlobStore:
+    """Return the process-wide attachment store."""
+    return BlobStore(os.getenv("ATTACHMENT_STORE_PATH") or None)
@@ -0,0 +1,269 @@
+"""Crawl the full FRED series catalog into a columnar file.
+
+The crawler walks every release (`/fred/releases`) and pages through the
+series published in each one (`/fred/release/series`) on the shared
+`AsyncFredClient`, with at most `concurrency` requests in flight and no more
+than `requests_per_second` started per second. Crawl requests also draw from
+the shared FRED rate limit at `Priority.CRAWL`, so they yield to interactive
+tool calls and background refreshes.
+
+Progress is checkpointed per release under `output_dir`: each finished
+release's rows are written to `parts/<release_id>.json` and its id recorded
+in `checkpoint.json`, so an interrupted crawl resumes where it stopped. Once
+every release is done the parts are merged into `catalog.json.gz`, a
+columnar file (one list per column) that feeds:
+
+- `scripts/index_opensearch.py` (via `iter_catalog_rows`),
+- the local BM25 `SeriesIndex` (`SeriesIndex.build(iter_catalog_rows(...))`),
+- the series → release mapping of the `ReleaseCalendar` (`seed_release_calendar`).
+
+A series that appears in several releases is attributed to the first one
+(lowest release id).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
+
+from retrieval_graph.fred_api import AsyncFredClient, get_async_fred_client
+from retrieval_graph.rate_limiter import Priority, request_priority
+from retrieval_graph.release_catalog import ReleaseCatalog
+
+if TYPE_CHECKING:
+    from retrieval_graph.release_calendar import ReleaseCalendar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = int(os.getenv("FRED_CRAWL_CONCURRENCY", "4"))
+# FRED allows 120 requests per minute per API key.
+DEFAULT_REQUESTS_PER_SECOND = float(os.getenv("FRED_CRAWL_RPS", "1.5"))
+PAGE_SIZE = 1000
+CATALOG_FILENAME = "catalog.json.gz"
+
+# Catalog column -> FRED `release/series` field. Column names match the
+# series metadata CSV consumed by `index_opensearch.py` and `SeriesIndex`.
+CATALOG_COLUMNS = {
+    "series_id": "id",
+    "title": "title",
+    "frequency": "frequency",
+    "frequency_short": "frequency_short",
+    "units": "units",
+    "units_short": "units_short",
+    "season": "seasonal_adjustment",
+    "season_short": "seasonal_adjustment_short",
+    "observation_start": "observation_start",
+    "observation_end": "observation_end",
+    "last_updated": "last_updated",
+    "popularity": "popularity",
+    "notes": "notes",
+}
+
+
+class AsyncRateLimiter:
+    """Space request starts at least `1 / rate` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        """Allow `rate` acquisitions per second (`<= 0` disables limiting)."""
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request may start."""
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class CrawlStats:
+    """Counters reported at the end of a crawl."""
+
+    releases: int = 0
+    releases_skipped: int = 0
+    requests: int = 0
+    series: int = 0
+    failed_releases: dict[int, str] = field(default_factory=dict)
+
+
+class CatalogCrawler:
+    """Resumable, rate-limited crawler for the FRED series catalog."""
+
+    def __init__(
+        self,
+        output_dir: str | os.PathLike[str],
+        api: AsyncFredClient | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        """Prepare a crawl that checkpoints into `output_dir`."""
+        self.output_dir = Path(output_dir)
+        self.parts_dir = self.output_dir / "parts"
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_path = self.output_dir / "checkpoint.json"
+        self.catalog_path = self.output_dir / CATALOG_FILENAME
+        self._api = api
+        self.concurrency = max(1, concurrency)
+        self.page_size = page_size
+        self._rate = requests_per_second
+        self.stats = CrawlStats()
+
+    @property
+    def api(self) -> AsyncFredClient:
+        """FRED client used for the crawl."""
+        return self._api or get_async_fred_client()
+
+    def _read_checkpoint(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"releases": {}, "done": []}
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+
+    async def _get(
+        self, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        async with self._semaphore:
+            await self._limiter.acquire()
+            self.stats.requests += 1
+            return await fetch()
+
+    async def _crawl_release(self, release_id: int) -> list[dict[str, Any]]:
+        """Return every series record of one release, paging concurrently."""
+
+        def page(offset: int) -> Callable[[], Awaitable[dict[str, Any]]]:
+            return lambda: self.api.release_series(
+                release_id, limit=self.page_size, offset=offset
+            )
+
+        first = await self._get(page(0))
+        series = list(first.get("seriess", []))
+        count = int(first.get("count", len(series)))
+        rest = await asyncio.gather(
+            *(self._get(page(o)) for o in range(self.page_size, count, self.page_size))
+        )
+        for payload in rest:
+            series.extend(payload.get("seriess", []))
+        return series
+
+    async def arun(self) -> Path:
+        """Crawl (or resume crawling) and write the merged catalog file.
+
+        Returns:
+            Path: Location of the columnar catalog.
+
+        Raises:
+            RuntimeError: If some releases could not be crawled; rerunning
+                resumes from the checkpoint and retries only those.
+        """
+        with request_priority(Priority.CRAWL):
+            return await self._arun()
+
+    async def _arun(self) -> Path:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._limiter = AsyncRateLimiter(self._rate)
+        checkpoint = self._read_checkpoint()
+        if not checkpoint["releases"]:
+            catalog = ReleaseCatalog(self.api, page_size=self.page_size)
+            releases = await catalog.afetch_all()
+            checkpoint["releases"] = {str(r["id"]): r.get("name", "") for r in releases}
+            self._write_json(self.checkpoint_path, checkpoint)
+        done = set(checkpoint["done"])
+        todo = [int(rid) for rid in checkpoint["releases"] if int(rid) not in done]
+        self.stats.releases_skipped = len(done)
+
+        async def crawl_one(release_id: int) -> None:
+            try:
+                series = await self._crawl_release(release_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to crawl release %s: %s", release_id, exc)
+                self.stats.failed_releases[release_id] = str(exc)
+                return
+            self._write_json(self.parts_dir / f"{release_id}.json", series)
+            checkpoint["done"].append(release_id)
+            self._write_json(self.checkpoint_path, checkpoint)
+            self.stats.releases += 1
+
+        await asyncio.gather(*(crawl_one(rid) for rid in todo))
+        if self.stats.failed_releases:
+            raise RuntimeError(
+                f"{len(self.stats.failed_releases)} release(s) failed; "
+                "rerun to resume from the checkpoint."
+            )
+        self._merge(checkpoint)
+        return self.catalog_path
+
+    def _merge(self, checkpoint: dict[str, Any]) -> None:
+        columns: dict[str, list[Any]] = {c: [] for c in CATALOG_COLUMNS}
+        columns["release_id"] = []
+        seen: set[str] = set()
+        for release_id in sorted(int(r) for r in checkpoint["releases"]):
+            path = self.parts_dir / f"{release_id}.json"
+            for record in json.loads(path.read_text(encoding="utf-8")):
+                series_id = record.get("id")
+                if not series_id or series_id in seen:
+                    continue
+                seen.add(series_id)
+                for column, source in CATALOG_COLUMNS.items():
+                    columns[column].append(record.get(source))
+                columns["release_id"].append(release_id)
+        self.stats.series = len(seen)
+        data = {
+            "columns": columns,
+            "releases": checkpoint["releases"],
+            "crawled_at": time.time(),
+        }
+        tmp = self.catalog_path.with_name(f".{self.catalog_path.name}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as handle:
+            json.dump(data, handle, separators=(",", ":"))
+        os.replace(tmp, self.catalog_path)
+
+
+def read_catalog(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """Load a columnar catalog file written by `CatalogCrawler`."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def iter_catalog_rows(path: str | os.PathLike[str]) -> Iterator[dict[str, str]]:
+    """Yield catalog rows as CSV-style dicts (string values, "" for missing)."""
+    columns = read_catalog(path)["columns"]
+    names = list(columns)
+    for values in zip(*(columns[n] for n in names)):
+        yield {n: "" if v is None else str(v) for n, v in zip(names, values)}
+
+
+def seed_release_calendar(
+    path: str | os.PathLike[str], calendar: ReleaseCalendar
+) -> int:
+    """Load the catalog's series → release mapping into a `ReleaseCalendar`.
+
+    The mapping only serves invalidation and schedule lookups: the release
+    refresher re-fetches a seeded series at publication only if it is held in
+    the observation store.
+    """
+    catalog = read_catalog(path)
+    columns = catalog["columns"]
+    mapping = dict(zip(columns["series_id"], columns["release_id"]))
+    names = {int(rid): name for rid, name in catalog.get("releases", {}).items()}
+    calendar.seed(mapping, release_names=names)
+    return len(mapping)
@@ -0,0 +1,192 @@
+"""Local chart rendering for FRED series.
+
+Charts are drawn with matplotlib from observations we already hold (the
+observation store / `SeriesSnapshot`), so the chart path no longer depends on
+downloading `fredgraph.png`. Rendering runs in a dedicated worker process,
+which keeps matplotlib's CPU work and global state away from the event loop
+and the tool threads.
+
+Rendered images are cached by (series, date range, size, format, data
+vintage); a new observation or revision changes the vintage and therefore
+the key, so stale charts are never served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
+
+CHART_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+RENDER_TIMEOUT_SECONDS = float(os.getenv("FRED_CHART_RENDER_TIMEOUT", "30"))
+CHART_CACHE_MAX_BYTES = int(
+    os.getenv("FRED_CHART_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+
+@dataclass(frozen=True)
+class ChartSeries:
+    """Plain, picklable description of one line on a chart."""
+
+    series_id: str
+    title: str
+    units: str
+    dates: tuple[str, ...]
+    values: tuple[float, ...]
+
+    @property
+    def vintage(self) -> str:
+        """Digest identifying this exact set of observations."""
+        digest = hashlib.sha1(usedforsecurity=False)
+        digest.update(self.series_id.encode())
+        digest.update(repr((self.dates, self.values)).encode())
+        return digest.hexdigest()
+
+
+def render_chart(
+    series: Sequence[ChartSeries],
+    *,
+    width: int,
+    height: int,
+    fmt: str = "png",
+    title: str | None = None,
+) -> bytes:
+    """Draw one or more series as a line chart and return the encoded image.
+
+    Runs inside the renderer process; every argument must be picklable.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from datetime import date
+
+    import matplotlib.dates as mdates
+    import matplotlib.pyplot as plt
+
+    dpi = 100
+    fig, ax = plt.subplots(figsize=(width / dpi, height / dpi), dpi=dpi)
+    try:
+        for item in series:
+            xs = [date.fromisoformat(d) for d in item.dates]
+            label = f"{item.title} ({item.units})" if item.units else item.title
+            ax.plot(xs, item.values, linewidth=1.5, label=label)
+        if title is None:
+            title = series[0].title if len(series) == 1 else None
+        if title:
+            ax.set_title(title, fontsize=10)
+        if len(series) == 1 and series[0].units:
+            ax.set_ylabel(series[0].units, fontsize=9)
+        elif len(series) > 1:
+            ax.legend(fontsize=8, loc="best")
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        ax.xaxis.set_major_formatter(
+            mdates.ConciseDateFormatter(ax.xaxis.get_major_locator())
+        )
+        ax.grid(True, linewidth=0.3, alpha=0.6)
+        ax.tick_params(labelsize=8)
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+class ChartRenderer:
+    """Render charts in a worker process and cache the encoded bytes."""
+
+    def __init__(
+        self,
+        *,
+        max_cache_bytes: int = CHART_CACHE_MAX_BYTES,
+        executor: Executor | None = None,
+    ) -> None:
+        """Create a renderer; the worker process starts on first render.
+
+        Args:
+            max_cache_bytes (int): Upper bound on cached image bytes.
+            executor (Executor | None): Run renders here instead of a
+                dedicated worker process (e.g. a thread pool in tests).
+        """
+        self.max_cache_bytes = max_cache_bytes
+        self._pool: Executor | None = executor
+        self._cache: OrderedDict[tuple[Any, ...], bytes] = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> Executor:
+        """Single-process pool running `render_chart`."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+    @staticmethod
+    def cache_key(
+        series: Sequence[ChartSeries], *, width: int, height: int, fmt: str
+    ) -> tuple[Any, ...]:
+        """Return the cache key (series, range, size, format, data vintage)."""
+        return tuple(
+            (
+                s.series_id,
+                s.dates[0] if s.dates else None,
+                s.dates[-1] if s.dates else None,
+            )
+            for s in series
+        ) + (width, height, fmt, tuple(s.vintage for s in series))
+
+    def render(
+        self,
+        series: Sequence[ChartSeries],
+        *,
+        width: int,
+        height: int,
+        fmt: str = "png",
+    ) -> bytes:
+        """Return the encoded chart, rendering it in the worker process on a miss."""
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format '{fmt}'.")
+        if not series or not any(s.dates for s in series):
+            raise ValueError("No observations available to chart.")
+        key = self.cache_key(series, width=width, height=height, fmt=fmt)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        future = self.pool.submit(
+            render_chart, list(series), width=width, height=height, fmt=fmt
+        )
+        data = future.result(timeout=RENDER_TIMEOUT_SECONDS)
+
+        with self._lock:
+            self._cache[key] = data
+            self._cache_bytes += len(data)
+            while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+        return data
+
+
+@lru_cache(maxsize=1)
+def get_chart_renderer() -> ChartRenderer:
+    """Return the process-wide chart renderer."""
+    return ChartRenderer()
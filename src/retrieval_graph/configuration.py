@@ -99,3 +99,10 @@ class Configuration(IndexConfiguration):
             "description": "The language model used for processing and refining queries. Should be in the form: provider/model-name."
         },
     )
+
+    max_concurrent_tool_calls: int = field(
+        default=4,
+        metadata={
+            "description": "Maximum number of tool calls from a single model message that may run concurrently."
+        },
+    )
@@ -0,0 +1,137 @@
+"""Meeting dates for FRASER FOMC items and date intent in search queries.
+
+FOMC item titles name the meeting dates ("Meeting, January 26-27, 2010",
+"Meeting, January 31-February 1, 2012", "Telephone Conference, May 4,
+2020"). `item_dates` turns a FRASER record into a `(start, end)` date range,
+falling back to `originInfo.sortDate` when the title has no date, so
+ingestion can store it in the indexed `meeting_start`/`meeting_end` columns.
+
+`date_intent` recognises the same kind of phrase in a user query, plus
+"January 2010", ISO dates and bare years, and returns the range of days the
+query asks about.
+"""
+
+from __future__ import annotations
+
+import calendar
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Mapping
+
+_MONTHS = {
+    name.lower(): number for number, name in enumerate(calendar.month_name) if number
+}
+_MONTHS.update(
+    {name.lower(): number for number, name in enumerate(calendar.month_abbr) if number}
+)
+_MONTHS["sept"] = 9
+
+_MONTH = "(?:" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_DAY = r"\d{1,2}(?:st|nd|rd|th)?"
+_YEAR = r"(?:18|19|20)\d{2}"
+_TO = r"\s*(?:-|–|—|to|through|,?\s*and|&)\s*"
+
+# "January 26-27, 2010", "January 31-February 1, 2012",
+# "December 31, 1996-January 1, 1997", "October 22, 23, and 24, 1935",
+# "Jan 27 2010"
+_DAY_RANGE = re.compile(
+    rf"\b(?P<m1>{_MONTH})\s+(?P<d1>{_DAY})(?:,\s*{_DAY}(?!\d))*"
+    rf"(?:,?\s*(?P<y1>{_YEAR}))?"
+    rf"(?:{_TO}(?:(?P<m2>{_MONTH})\s+)?(?P<d2>{_DAY}))?"
+    rf",?\s*(?P<y2>{_YEAR})\b",
+    re.IGNORECASE,
+)
+_ISO_DATE = re.compile(r"\b(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})\b")
+_MONTH_YEAR = re.compile(rf"\b(?P<m>{_MONTH}),?\s+(?P<y>{_YEAR})\b", re.IGNORECASE)
+_YEAR_ONLY = re.compile(rf"\b(?P<y>{_YEAR})\b")
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """An inclusive range of days."""
+
+    start: date
+    end: date
+
+    def __str__(self) -> str:
+        """Format as `YYYY-MM-DD` or `YYYY-MM-DD..YYYY-MM-DD`."""
+        if self.start == self.end:
+            return self.start.isoformat()
+        return f"{self.start.isoformat()}..{self.end.isoformat()}"
+
+
+def _month(name: str) -> int:
+    return _MONTHS[name.lower().rstrip(".")]
+
+
+def _day(text: str) -> int:
+    return int(re.match(r"\d+", text).group())  # type: ignore[union-attr]
+
+
+def _day_range(match: re.Match[str]) -> DateRange | None:
+    m1 = _month(match["m1"])
+    m2 = _month(match["m2"]) if match["m2"] else m1
+    y2 = int(match["y2"])
+    y1 = int(match["y1"]) if match["y1"] else y2
+    d1 = _day(match["d1"])
+    d2 = _day(match["d2"]) if match["d2"] else d1
+    if not match["y1"] and m2 < m1:
+        # "December 31-January 1, 1997" spans a year boundary.
+        y1 -= 1
+    try:
+        start, end = date(y1, m1, d1), date(y2, m2, d2)
+    except ValueError:
+        return None
+    return DateRange(start, end) if start <= end else None
+
+
+def parse_title_dates(title: str) -> DateRange | None:
+    """Return the meeting dates named in an FOMC item title, if any."""
+    match = _DAY_RANGE.search(title or "")
+    return _day_range(match) if match else None
+
+
+def item_dates(record: Mapping[str, Any]) -> DateRange | None:
+    """Return the date range of a FRASER item record.
+
+    Uses the dates in the title, else `originInfo.sortDate` as a single day.
+    """
+    titles = record.get("titleInfo") or [{}]
+    dates = parse_title_dates(str(titles[0].get("title") or ""))
+    if dates:
+        return dates
+    sort_date = str((record.get("originInfo") or {}).get("sortDate") or "")
+    try:
+        day = date.fromisoformat(sort_date[:10])
+    except ValueError:
+        return None
+    return DateRange(day, day)
+
+
+def date_intent(query: str) -> DateRange | None:
+    """Return the range of days a search query refers to, if it names one.
+
+    The most specific phrase wins: a day or day range, then an ISO date, then
+    a month and year, then a bare year.
+    """
+    match = _DAY_RANGE.search(query)
+    if match:
+        return _day_range(match)
+    match = _ISO_DATE.search(query)
+    if match:
+        try:
+            day = date(int(match["y"]), int(match["m"]), int(match["d"]))
+        except ValueError:
+            return None
+        return DateRange(day, day)
+    match = _MONTH_YEAR.search(query)
+    if match:
+        year, month = int(match["y"]), _month(match["m"])
+        last = calendar.monthrange(year, month)[1]
+        return DateRange(date(year, month, 1), date(year, month, last))
+    match = _YEAR_ONLY.search(query)
+    if match:
+        year = int(match["y"])
+        return DateRange(date(year, 1, 1), date(year, 12, 31))
+    return None
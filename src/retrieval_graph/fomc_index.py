@@ -0,0 +1,260 @@
+"""Embedded SQLite index of FRASER FOMC items (Postgres-free backend).
+
+Dev machines and CI have no Postgres, and latency-sensitive deployments
+benefit from a local read replica. `FomcIndex` keeps the FOMC items in a
+SQLite file and answers the same two kinds of lookups as the Postgres
+backend in `fraser_tool`:
+
+- Queries naming a date use an index on `(meeting_start, meeting_end)`,
+  exactly like the Postgres date columns (see `fomc_dates`).
+- Other queries use an FTS5 table with the `trigram` tokenizer to collect
+  candidate titles sharing the query's rarest trigrams (BM25), then re-rank
+  them by pg_trgm-style `similarity` and drop those below the threshold.
+
+Build the index from a FRASER `title/{id}/items` export, the FRASER API or an
+existing Postgres index with `scripts/fraser/build_fomc_index.py`, or let
+`get_fomc_index()` load `FRASER_EXPORT_PATH` into an empty index.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from retrieval_graph.fomc_dates import DateRange, date_intent, item_dates
+from retrieval_graph.fraser_ingest import content_hash
+from retrieval_graph.utils import cache_path
+
+logger = logging.getLogger(__name__)
+
+# Candidates fetched from FTS5 per requested result before re-ranking.
+CANDIDATES_PER_RESULT = 20
+MIN_CANDIDATES = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    location TEXT NOT NULL,
+    meeting_start TEXT,
+    meeting_end TEXT,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_meeting_dates ON items (meeting_start, meeting_end);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, content='items', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    INSERT INTO items_fts (rowid, title) VALUES (new.id, new.title);
+END;
+"""
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the trigrams of `text` the way pg_trgm extracts them.
+
+    Each word is lower-cased and padded with two spaces in front and one
+    behind, so short words and word boundaries contribute trigrams too.
+    """
+    grams: set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Return pg_trgm `similarity(a, b)`: shared over distinct trigrams."""
+    left, right = trigrams(a), trigrams(b)
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def _match_expression(query: str) -> str | None:
+    """Return an FTS5 query matching any in-word trigram of `query`."""
+    grams = {
+        word[i : i + 3]
+        for word in _WORD.findall(query.lower())
+        for i in range(len(word) - 2)
+    }
+    return " OR ".join(f'"{g}"' for g in sorted(grams)) or None
+
+
+class FomcIndex:
+    """SQLite-backed FOMC item index with date and trigram title lookups."""
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Open (and if needed create) the index database.
+
+        Args:
+            path (str | os.PathLike[str] | None): SQLite file; defaults to
+                `fomc_index.sqlite` in the cache directory. Use `":memory:"`
+                for a throwaway index.
+        """
+        self.path = str(path) if path else str(cache_path("fomc_index.sqlite"))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    @classmethod
+    def from_export(
+        cls, export: str | os.PathLike[str], path: str | os.PathLike[str] | None = None
+    ) -> FomcIndex:
+        """Build an index from a saved FRASER `title/{id}/items` JSON export."""
+        index = cls(path)
+        index.add(json.loads(Path(export).read_text())["records"])
+        return index
+
+    def add(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """Insert or update FRASER item records; return how many changed."""
+        rows = []
+        for record in records:
+            identifiers = (record.get("recordInfo") or {}).get("recordIdentifier")
+            titles = record.get("titleInfo") or [{}]
+            if not identifiers:
+                continue
+            dates = item_dates(record)
+            rows.append(
+                (
+                    int(identifiers[0]),
+                    str(titles[0].get("title") or ""),
+                    json.dumps(record.get("location") or {}),
+                    dates.start.isoformat() if dates else None,
+                    dates.end.isoformat() if dates else None,
+                    content_hash(record),
+                )
+            )
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                """
+                INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    title = excluded.title,
+                    location = excluded.location,
+                    meeting_start = excluded.meeting_start,
+                    meeting_end = excluded.meeting_end,
+                    content_hash = excluded.content_hash
+                WHERE content_hash != excluded.content_hash
+                """,
+                rows,
+            )
+        return cursor.rowcount
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 5,
+        threshold: float = 0.2,
+        max_span_days: int = 7,
+    ) -> tuple[list[dict[str, Any]], DateRange | None]:
+        """Return matching items and the date range used, if any.
+
+        Rows have the `id`, `title` and `location` keys the Postgres backend
+        returns. Dated queries fall back to title similarity when no item
+        falls in the range.
+        """
+        dates = date_intent(query)
+        if dates:
+            rows = self._date_lookup(query, dates, limit, max_span_days)
+            if rows:
+                return rows, dates
+        return self._title_lookup(query, limit, threshold), None
+
+    def _date_lookup(
+        self, query: str, dates: DateRange, limit: int, max_span_days: int
+    ) -> list[dict[str, Any]]:
+        with self._lock:
+            found = self._conn.execute(
+                """
+                SELECT id, title, location, meeting_start FROM items
+                WHERE meeting_start BETWEEN date(?, ?) AND ?
+                  AND meeting_end >= ?
+                """,
+                (
+                    dates.start.isoformat(),
+                    f"-{max_span_days} days",
+                    dates.end.isoformat(),
+                    dates.start.isoformat(),
+                ),
+            ).fetchall()
+        ranked = sorted(
+            found, key=lambda r: (-similarity(r["title"], query), r["meeting_start"])
+        )
+        return [self._row(r) for r in ranked[:limit]]
+
+    def _title_lookup(
+        self, query: str, limit: int, threshold: float
+    ) -> list[dict[str, Any]]:
+        expression = _match_expression(query)
+        if expression is None:
+            return []
+        with self._lock:
+            candidates = self._conn.execute(
+                """
+                SELECT items.id, items.title, items.location
+                FROM items_fts JOIN items ON items.id = items_fts.rowid
+                WHERE items_fts MATCH ?
+                ORDER BY bm25(items_fts)
+                LIMIT ?
+                """,
+                (expression, max(limit * CANDIDATES_PER_RESULT, MIN_CANDIDATES)),
+            ).fetchall()
+        scored = [(similarity(r["title"], query), r) for r in candidates]
+        scored = [(s, r) for s, r in scored if s >= threshold]
+        scored.sort(key=lambda pair: (-pair[0], pair[1]["id"]))
+        return [self._row(r) for _, r in scored[:limit]]
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "location": json.loads(row["location"]),
+        }
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_fomc_index() -> FomcIndex:
+    """Return the shared FOMC index (`FRASER_INDEX_PATH`).
+
+    An empty index is filled from `FRASER_EXPORT_PATH` when that is set.
+    """
+    index = FomcIndex(os.getenv("FRASER_INDEX_PATH") or None)
+    export = os.getenv("FRASER_EXPORT_PATH")
+    if export and not len(index):
+        try:
+            index.add(json.loads(Path(export).read_text())["records"])
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to load FRASER export %s", export)
+    return index
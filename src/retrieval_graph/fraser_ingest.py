@@ -0,0 +1,210 @@
+"""Streaming, incremental ingestion of FRASER title items into `fomc_items`.
+
+`iter_title_items` pages through the FRASER `title/{id}/items` API, so the
+export never has to be held in memory. `ingest` loads the records in
+batches: each batch is written to a temporary staging table with `COPY` and
+merged into `fomc_items` with a single `INSERT ... ON CONFLICT DO UPDATE`.
+Rows carry a `content_hash` of their FRASER fields (migration
+0003_content_hash), and the merge only rewrites rows whose hash changed, so
+re-running the ingestion is cheap and picks up edited records.
+
+Command line: `scripts/fraser/index_fraser.py`.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping
+
+import httpx
+
+from retrieval_graph.fomc_dates import item_dates
+
+logger = logging.getLogger(__name__)
+
+FRASER_API_BASE = os.getenv("FRASER_API_BASE", "https://fraser.stlouisfed.org/api")
+FOMC_TITLE_ID = 677
+ITEM_FIELDS = "titleInfo!originInfo!location!recordInfo"
+DEFAULT_PAGE_SIZE = int(os.getenv("FRASER_PAGE_SIZE", "500"))
+DEFAULT_BATCH_SIZE = int(os.getenv("FRASER_INGEST_BATCH_SIZE", "1000"))
+
+# Columns written through the staging table, in COPY order.
+COLUMNS = (
+    "id",
+    "titleInfo",
+    "originInfo",
+    "location",
+    "recordInfo",
+    "meeting_start",
+    "meeting_end",
+    "content_hash",
+)
+_JSON_FIELDS = ("titleInfo", "originInfo", "location", "recordInfo")
+
+_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS fomc_items_staging AS
+    SELECT {", ".join(COLUMNS)} FROM fomc_items WITH NO DATA
+"""
+_COPY_SQL = (
+    f"COPY fomc_items_staging ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+)
+# `xmax = 0` only for freshly inserted rows; unchanged rows are skipped by
+# the `WHERE` and not returned at all.
+_MERGE_SQL = f"""
+WITH merged AS (
+    INSERT INTO fomc_items AS f ({", ".join(COLUMNS)})
+    SELECT DISTINCT ON (id) {", ".join(COLUMNS)}
+    FROM fomc_items_staging
+    ORDER BY id
+    ON CONFLICT (id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in COLUMNS[1:])},
+        updated_at = now()
+    WHERE f.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM merged
+"""
+
+
+@dataclass
+class IngestStats:
+    """Row counts of an ingestion run."""
+
+    seen: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    batches: int = 0
+
+
+def iter_title_items(
+    title_id: int = FOMC_TITLE_ID,
+    *,
+    api_key: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    base_url: str = FRASER_API_BASE,
+    client: httpx.Client | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield every item record of a FRASER title, one API page at a time.
+
+    Raises:
+        httpx.HTTPError: If a page cannot be fetched.
+    """
+    headers = {"X-API-Key": api_key or os.getenv("FRASER_API_KEY") or ""}
+    owned = client is None
+    client = client or httpx.Client(timeout=30.0)
+    try:
+        page = 1
+        while True:
+            response = client.get(
+                f"{base_url.rstrip('/')}/title/{title_id}/items",
+                headers=headers,
+                params={
+                    "format": "json",
+                    "fields": ITEM_FIELDS,
+                    "limit": page_size,
+                    "page": page,
+                },
+            )
+            response.raise_for_status()
+            body = response.json()
+            records = body.get("records") or []
+            yield from records
+            total = int(body.get("total") or 0)
+            if not records or page * page_size >= total:
+                return
+            page += 1
+    finally:
+        if owned:
+            client.close()
+
+
+def content_hash(record: Mapping[str, Any]) -> str:
+    """Return a stable hash of the fields stored for a record."""
+    canonical = json.dumps(
+        {field: record.get(field) or {} for field in _JSON_FIELDS},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def item_row(record: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Return the `COLUMNS` values for a record, or `None` if it has no id."""
+    identifiers = (record.get("recordInfo") or {}).get("recordIdentifier") or []
+    if not identifiers:
+        return None
+    dates = item_dates(record)
+    return (
+        identifiers[0],
+        *(json.dumps(record.get(field) or {}) for field in _JSON_FIELDS),
+        dates.start.isoformat() if dates else None,
+        dates.end.isoformat() if dates else None,
+        content_hash(record),
+    )
+
+
+def _copy_batch(cur: Any, rows: list[tuple[Any, ...]]) -> tuple[int, int]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # `None` becomes an empty unquoted field, which COPY reads as NULL.
+    writer.writerows(rows)
+    buffer.seek(0)
+    cur.execute("TRUNCATE fomc_items_staging")
+    cur.copy_expert(_COPY_SQL, buffer)
+    cur.execute(_MERGE_SQL)
+    inserted, updated = cur.fetchone()
+    return inserted, updated
+
+
+def ingest(
+    conn: Any,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> IngestStats:
+    """Upsert records into `fomc_items`, committing after every batch.
+
+    Args:
+        conn (Any): psycopg2 connection.
+        records (Iterable[Mapping[str, Any]]): FRASER item records, e.g. from
+            `iter_title_items`.
+        batch_size (int): Records per `COPY` and merge.
+    """
+    stats = IngestStats()
+    with conn.cursor() as cur:
+        cur.execute(_STAGING_SQL)
+        batch: list[tuple[Any, ...]] = []
+
+        def flush() -> None:
+            inserted, updated = _copy_batch(cur, batch)
+            conn.commit()
+            stats.inserted += inserted
+            stats.updated += updated
+            stats.unchanged += len(batch) - inserted - updated
+            stats.batches += 1
+            logger.info("FRASER batch %d: %s", stats.batches, stats)
+            batch.clear()
+
+        for record in records:
+            stats.seen += 1
+            row = item_row(record)
+            if row is None:
+                stats.skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    return stats
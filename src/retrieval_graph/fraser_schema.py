@@ -0,0 +1,128 @@
+"""Schema migrations for the FRASER Postgres index (`fomc_items`).
+
+Migrations are applied in order and recorded in `fraser_schema_migrations`,
+so `apply_migrations` is safe to run repeatedly (see
+`scripts/fraser/migrate.py`). Each migration runs in its own transaction.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from retrieval_graph.fomc_dates import item_dates
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One named, idempotent schema change.
+
+    `backfill`, if set, runs on the same cursor after `sql` to populate new
+    columns from existing rows.
+    """
+
+    name: str
+    sql: str
+    backfill: Callable[[Any], None] | None = None
+
+
+def _json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def backfill_meeting_dates(cur: Any) -> None:
+    """Fill `meeting_start`/`meeting_end` for rows that lack them."""
+    cur.execute(
+        "SELECT id, titleInfo, originInfo FROM fomc_items WHERE meeting_start IS NULL"
+    )
+    updates = []
+    for item_id, title_info, origin_info in cur.fetchall():
+        dates = item_dates(
+            {"titleInfo": _json(title_info), "originInfo": _json(origin_info)}
+        )
+        if dates:
+            updates.append((dates.start, dates.end, item_id))
+    cur.executemany(
+        "UPDATE fomc_items SET meeting_start = %s, meeting_end = %s WHERE id = %s",
+        updates,
+    )
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    # Searching used to evaluate `similarity(titleInfo->0->>'title', q)` for
+    # every row. A stored title column with a trigram GiST index lets the
+    # planner answer `title % q ORDER BY title <-> q LIMIT k` with an index
+    # (KNN) scan; GiST rather than GIN because only GiST supports `<->`.
+    Migration(
+        "0001_title_trigram",
+        """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        ALTER TABLE fomc_items
+            ADD COLUMN IF NOT EXISTS title text
+            GENERATED ALWAYS AS (titleInfo->0->>'title') STORED;
+        CREATE INDEX IF NOT EXISTS fomc_items_title_trgm
+            ON fomc_items USING gist (title gist_trgm_ops);
+        ANALYZE fomc_items;
+        """,
+    ),
+    # Most queries name a meeting date. Dates parsed from the title (see
+    # `fomc_dates.item_dates`) let those be answered with a range scan.
+    Migration(
+        "0002_meeting_dates",
+        """
+        ALTER TABLE fomc_items
+            ADD COLUMN IF NOT EXISTS meeting_start date,
+            ADD COLUMN IF NOT EXISTS meeting_end date;
+        CREATE INDEX IF NOT EXISTS fomc_items_meeting_dates
+            ON fomc_items (meeting_start, meeting_end);
+        """,
+        backfill=backfill_meeting_dates,
+    ),
+    # `fraser_ingest` skips records whose hash is unchanged; existing rows
+    # have no hash and are rewritten once by the next ingestion.
+    Migration(
+        "0003_content_hash",
+        """
+        ALTER TABLE fomc_items
+            ADD COLUMN IF NOT EXISTS content_hash text,
+            ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+        """,
+    ),
+)
+
+_LEDGER = """
+CREATE TABLE IF NOT EXISTS fraser_schema_migrations (
+    name text PRIMARY KEY,
+    applied_at timestamptz NOT NULL DEFAULT now()
+)
+"""
+
+
+def apply_migrations(conn: Any) -> list[str]:
+    """Apply pending migrations on a psycopg2 connection.
+
+    Returns:
+        list[str]: Names of the migrations applied by this call.
+    """
+    with conn.cursor() as cur:
+        cur.execute(_LEDGER)
+        cur.execute("SELECT name FROM fraser_schema_migrations")
+        done = {row[0] for row in cur.fetchall()}
+    conn.commit()
+
+    applied: list[str] = []
+    for migration in MIGRATIONS:
+        if migration.name in done:
+            continue
+        with conn.cursor() as cur:
+            cur.execute(migration.sql)
+            if migration.backfill:
+                migration.backfill(cur)
+            cur.execute(
+                "INSERT INTO fraser_schema_migrations (name) VALUES (%s)",
+                (migration.name,),
+            )
+        conn.commit()
+        applied.append(migration.name)
+    return applied
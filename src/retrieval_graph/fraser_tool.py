@@ -1,57 +1,104 @@
-"""Helpers for querying FRASER-derived data (e.g., Postgres FOMC index)."""
+"""Helpers for querying FRASER-derived data (e.g., Postgres FOMC index).
+
+Title searches use the pg_trgm index on `fomc_items.title` (see
+`fraser_schema`) and only return titles whose trigram similarity to the
+query is at least `FRASER_TITLE_SIMILARITY`. Queries that name a date are
+first answered from the indexed meeting date columns (see `fomc_dates`).
+
+`FRASER_BACKEND` selects where searches run: the Postgres index or the
+embedded SQLite index in `fomc_index` (same lookups and result shape).
+
+Queries borrow connections from the process-wide pools in `pg_pool` instead
+of connecting per call. `asearch_fomc_titles` uses the `asyncpg` pool when
+that driver is installed and otherwise runs the psycopg2 query on a worker
+thread, so it never blocks the caller's event loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Any
+from typing import Any, Iterable, Mapping
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from retrieval_graph.fomc_dates import DateRange, date_intent
+from retrieval_graph.fomc_index import get_fomc_index
+from retrieval_graph.pg_pool import asyncpg_available, get_async_pg_pool, get_pg_pool
 
-def _pg_connect():
-    return psycopg2.connect(
-        host=os.getenv("PG_HOST"),
-        dbname=os.getenv("PG_NAME"),
-        user=os.getenv("PG_USER"),
-        password=os.getenv("PG_PASS"),
-    )
+TITLE_SIMILARITY_THRESHOLD = float(os.getenv("FRASER_TITLE_SIMILARITY", "0.2"))
+# Longest FOMC meeting or conference, in days.
+MAX_MEETING_SPAN_DAYS = 7
 
+# `%` (similarity above `pg_trgm.similarity_threshold`) and `<->` (distance)
+# are served by the trigram index on the `title` column added by
+# `fraser_schema` migration 0001_title_trigram.
+_SET_THRESHOLD_SQL = "SELECT set_config('pg_trgm.similarity_threshold', %s, true)"
+_SEARCH_SQL = """
+    SELECT id, title, location
+    FROM fomc_items
+    WHERE title %% %(query)s
+    ORDER BY title <-> %(query)s
+    LIMIT %(limit)s
+"""
+# Items overlapping the requested days, via the (meeting_start, meeting_end)
+# index from migration 0002_meeting_dates. Bounding meeting_start from below
+# by the longest meeting span keeps this a range scan.
+_DATE_SQL = """
+    SELECT id, title, location
+    FROM fomc_items
+    WHERE meeting_start BETWEEN %(start)s::date - %(span)s AND %(end)s
+      AND meeting_end >= %(start)s
+    ORDER BY similarity(title, %(query)s) DESC, meeting_start
+    LIMIT %(limit)s
+"""
+# asyncpg uses numbered placeholders.
+_ASYNC_DATE_SQL = """
+    SELECT id, title, location
+    FROM fomc_items
+    WHERE meeting_start BETWEEN $1::date - $2::int AND $3
+      AND meeting_end >= $1
+    ORDER BY similarity(title, $4) DESC, meeting_start
+    LIMIT $5
+"""
+_ASYNC_SET_THRESHOLD_SQL = "SELECT set_config('pg_trgm.similarity_threshold', $1, true)"
+_ASYNC_SEARCH_SQL = """
+    SELECT id, title, location
+    FROM fomc_items
+    WHERE title % $1
+    ORDER BY title <-> $1
+    LIMIT $2
+"""
 
-def search_fomc_titles(query: str, *, limit: int = 5) -> dict[str, Any]:
-    """Run a fuzzy title search against the indexed FOMC items."""
-    if not query:
-        return {
-            "message": "No query provided for FRASER title search.",
-            "results": [],
-            "error": "missing_query",
-        }
 
-    try:
-        with _pg_connect() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT
-                    id,
-                    titleInfo->0->>'title' AS title,
-                    location
-                FROM fomc_items
-                ORDER BY similarity(titleInfo->0->>'title', %s) DESC
-                LIMIT %s
-                """,
-                (query, limit),
-            )
-            rows = cur.fetchall()
-    except Exception as exc:  # noqa: BLE001
-        return {
-            "message": f"Failed to search FOMC titles for '{query}'.",
-            "results": [],
-            "error": str(exc),
-        }
+def _missing_query() -> dict[str, Any]:
+    return {
+        "message": "No query provided for FRASER title search.",
+        "results": [],
+        "error": "missing_query",
+    }
+
+
+def _search_failed(query: str, exc: Exception) -> dict[str, Any]:
+    return {
+        "message": f"Failed to search FOMC titles for '{query}'.",
+        "results": [],
+        "error": str(exc),
+    }
+
 
+def _title_results(
+    query: str,
+    rows: Iterable[Mapping[str, Any]],
+    dates: DateRange | None = None,
+) -> dict[str, Any]:
     results: list[dict[str, Any]] = []
     for row in rows:
         location = row.get("location") or {}
+        if isinstance(location, str):
+            # asyncpg returns jsonb columns as text.
+            location = json.loads(location)
         pdf_urls = location.get("pdfUrl") or []
         results.append(
             {
@@ -61,7 +108,121 @@ def search_fomc_titles(query: str, *, limit: int = 5) -> dict[str, Any]:
             }
         )
 
+    if dates is not None:
+        return {
+            "message": f"Found {len(results)} FOMC items dated {dates} for '{query}'.",
+            "results": results,
+            "date_range": str(dates),
+        }
     return {
         "message": f"Found {len(results)} titles similar to '{query}'.",
         "results": results,
     }
+
+
+def fomc_backend() -> str:
+    """Return the configured FOMC search backend: `postgres` or `sqlite`.
+
+    `FRASER_BACKEND=auto` (the default) picks Postgres when `PG_HOST` is set
+    and the embedded index otherwise.
+    """
+    backend = os.getenv("FRASER_BACKEND", "auto").strip().lower()
+    if backend == "auto":
+        return "postgres" if os.getenv("PG_HOST") else "sqlite"
+    return backend
+
+
+def _search_sqlite(query: str, *, limit: int) -> dict[str, Any]:
+    try:
+        index = get_fomc_index()
+        if not len(index):
+            return {
+                "message": (
+                    "The local FOMC index is empty; build it with "
+                    "scripts/fraser/build_fomc_index.py."
+                ),
+                "results": [],
+                "error": "empty_index",
+            }
+        rows, dates = index.search(
+            query,
+            limit=limit,
+            threshold=TITLE_SIMILARITY_THRESHOLD,
+            max_span_days=MAX_MEETING_SPAN_DAYS,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return _search_failed(query, exc)
+
+    return _title_results(query, rows, dates)
+
+
+def search_fomc_titles(query: str, *, limit: int = 5) -> dict[str, Any]:
+    """Search the indexed FOMC items.
+
+    Queries naming a date ("January 26-27, 2010", "March 2001") are answered
+    by a lookup on the meeting date columns; the fuzzy title search is the
+    fallback when the query names no date or nothing matches it.
+    """
+    if not query:
+        return _missing_query()
+    if fomc_backend() == "sqlite":
+        return _search_sqlite(query, limit=limit)
+
+    dates = date_intent(query)
+    rows: list[Any] = []
+    try:
+        with get_pg_pool().connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if dates:
+                    cur.execute(
+                        _DATE_SQL,
+                        {
+                            "start": dates.start,
+                            "end": dates.end,
+                            "span": MAX_MEETING_SPAN_DAYS,
+                            "query": query,
+                            "limit": limit,
+                        },
+                    )
+                    rows = cur.fetchall()
+                if not rows:
+                    dates = None
+                    cur.execute(_SET_THRESHOLD_SQL, (str(TITLE_SIMILARITY_THRESHOLD),))
+                    cur.execute(_SEARCH_SQL, {"query": query, "limit": limit})
+                    rows = cur.fetchall()
+    except Exception as exc:  # noqa: BLE001
+        return _search_failed(query, exc)
+
+    return _title_results(query, rows, dates)
+
+
+async def asearch_fomc_titles(query: str, *, limit: int = 5) -> dict[str, Any]:
+    """Async `search_fomc_titles`; same arguments and result shape."""
+    if not query:
+        return _missing_query()
+    if fomc_backend() == "sqlite" or not asyncpg_available():
+        return await asyncio.to_thread(search_fomc_titles, query, limit=limit)
+
+    dates = date_intent(query)
+    rows: list[Any] = []
+    try:
+        async with get_async_pg_pool().connection() as conn, conn.transaction():
+            if dates:
+                rows = await conn.fetch(
+                    _ASYNC_DATE_SQL,
+                    dates.start,
+                    MAX_MEETING_SPAN_DAYS,
+                    dates.end,
+                    query,
+                    limit,
+                )
+            if not rows:
+                dates = None
+                await conn.execute(
+                    _ASYNC_SET_THRESHOLD_SQL, str(TITLE_SIMILARITY_THRESHOLD)
+                )
+                rows = await conn.fetch(_ASYNC_SEARCH_SQL, query, limit)
+    except Exception as exc:  # noqa: BLE001
+        return _search_failed(query, exc)
+
+    return _title_results(query, (dict(row) for row in rows), dates)
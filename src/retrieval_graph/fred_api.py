@@ -0,0 +1,341 @@
+"""Asyncio client for the FRED REST API.
+
+All FRED traffic goes through a single `AsyncFredClient`, which keeps a pooled
+set of keep-alive HTTPS connections for the lifetime of the process instead of
+opening fresh connections for every request.
+
+The client lives on a dedicated background event loop so that the synchronous
+`fetch_*` helpers in `fred_tool` (which run on worker threads) and async
+callers on other loops can share the same connection pool:
+
+- `run_sync(coro)` blocks the calling thread until `coro` finishes on the
+  FRED loop.
+- `await run_async(coro)` awaits it from any other running loop.
+
+Every request first takes a token from the process-shared
+`rate_limiter.SharedRateLimiter` (at the priority of the calling context), and
+a 429 response empties the shared bucket for the `Retry-After` period before
+the request is retried. Metadata endpoints are answered from the disk-backed
+`http_cache.ResponseCache` when possible (stale-while-revalidate, with stale
+responses served in a flagged degraded mode when FRED fails).
+
+Tests (or alternative deployments) can point the shared client at another
+endpoint with `set_async_fred_client(AsyncFredClient(base_url=...))`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Coroutine, TypeVar
+
+import httpx
+from dotenv import load_dotenv
+
+from retrieval_graph.http_cache import (
+    DegradedResponse,
+    ResponseCache,
+    get_response_cache,
+    record_degraded,
+)
+from retrieval_graph.rate_limiter import (
+    Priority,
+    SharedRateLimiter,
+    get_rate_limiter,
+    request_priority,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+FRED_API_BASE_URL = os.getenv("FRED_API_BASE_URL", "https://api.stlouisfed.org/fred")
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("FRED_HTTP_TIMEOUT", "10"))
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("FRED_HTTP_MAX_CONNECTIONS", "20"))
+DEFAULT_MAX_KEEPALIVE = int(os.getenv("FRED_HTTP_MAX_KEEPALIVE", "10"))
+RATE_LIMIT_RETRIES = int(os.getenv("FRED_RATE_LIMIT_RETRIES", "2"))
+DEFAULT_RETRY_AFTER_SECONDS = float(os.getenv("FRED_RETRY_AFTER_SECONDS", "5"))
+
+T = TypeVar("T")
+
+
+class AsyncFredClient:
+    """Pooled, keep-alive asyncio client for `api.stlouisfed.org/fred`."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        base_url: str = FRED_API_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        """Configure the client; the HTTP pool is created on first use.
+
+        `rate_limiter` and `response_cache` default to the process-shared
+        `get_rate_limiter()` and `get_response_cache()`.
+
+        Raises:
+            RuntimeError: If no API key is given and `FRED_API_KEY` is unset.
+        """
+        api_key = api_key or os.getenv("FRED_API_KEY")
+        if not api_key:
+            raise RuntimeError(
+                "FRED_API_KEY is required to call FRED tools but is not set."
+            )
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self._revalidating: set[str] = set()
+        self._background: set[asyncio.Task[None]] = set()
+        self._http: httpx.AsyncClient | None = None
+
+    @property
+    def rate_limiter(self) -> SharedRateLimiter | None:
+        """Token bucket every request draws from (`None` when disabled)."""
+        return self._rate_limiter or get_rate_limiter()
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Disk cache for metadata endpoints (`None` when disabled)."""
+        return self._response_cache or get_response_cache()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Underlying pooled `httpx.AsyncClient`."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Cancel background revalidations and close pooled connections."""
+        for task in list(self._background):
+            task.cancel()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def get_json(self, endpoint: str, **params: Any) -> dict[str, Any]:
+        """GET `endpoint` (e.g. `series/release`) and return the decoded JSON body.
+
+        Endpoints with a TTL in the response cache are served from it while
+        fresh; a stale entry is returned immediately and refreshed in the
+        background, and if FRED fails an expired entry is returned in degraded
+        mode (see `http_cache`).
+        """
+        query = {"api_key": self.api_key, "file_type": "json"}
+        query.update({k: v for k, v in params.items() if v is not None})
+        cache = self.response_cache
+        ttl = cache.ttl_for(endpoint) if cache is not None else None
+        if cache is None or ttl is None:
+            return await self._fetch_json(endpoint, query)
+
+        key = cache.key(endpoint, query)
+        # The cache is SQLite-backed; keep its I/O off the event loop.
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            age = cached.age()
+            if age < ttl:
+                return cached.payload
+            if age < ttl + cache.max_stale_seconds:
+                self._revalidate_in_background(endpoint, query, key)
+                return cached.payload
+        try:
+            payload = await self._fetch_json(endpoint, query)
+        except httpx.HTTPError as exc:
+            if cached is None or not _is_upstream_failure(exc):
+                raise
+            logger.warning(
+                "FRED %s failed (%s); serving cached response", endpoint, exc
+            )
+            record_degraded(DegradedResponse(endpoint, cached.fetched_at, str(exc)))
+            return cached.payload
+        await asyncio.to_thread(cache.put, key, endpoint, payload)
+        return payload
+
+    async def _fetch_json(self, endpoint: str, query: dict[str, Any]) -> dict[str, Any]:
+        limiter = self.rate_limiter
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            if limiter is not None:
+                await limiter.aacquire()
+            response = await self.http.get(f"/{endpoint.lstrip('/')}", params=query)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            retry_after = _retry_after_seconds(response)
+            if limiter is not None:
+                await asyncio.to_thread(limiter.penalize, retry_after)
+            else:
+                await asyncio.sleep(retry_after)
+        response.raise_for_status()
+        return response.json()
+
+    def _revalidate_in_background(
+        self, endpoint: str, query: dict[str, Any], key: str
+    ) -> None:
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        task = asyncio.get_running_loop().create_task(
+            self._revalidate(endpoint, query, key)
+        )
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _revalidate(self, endpoint: str, query: dict[str, Any], key: str) -> None:
+        try:
+            with request_priority(Priority.BACKGROUND):
+                payload = await self._fetch_json(endpoint, query)
+            cache = self.response_cache
+            if cache is not None:
+                await asyncio.to_thread(cache.put, key, endpoint, payload)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Background refresh of FRED %s failed: %s", endpoint, exc)
+        finally:
+            self._revalidating.discard(key)
+
+    async def series(self, series_id: str) -> dict[str, Any]:
+        """Return the metadata record for a series."""
+        payload = await self.get_json("series", series_id=series_id)
+        seriess = payload.get("seriess", [])
+        if not seriess:
+            raise ValueError(f"No series metadata returned for '{series_id}'.")
+        return seriess[0]
+
+    async def series_observations(
+        self, series_id: str, **params: Any
+    ) -> list[dict[str, Any]]:
+        """Return raw observation records (`date`/`value` strings) for a series."""
+        payload = await self.get_json(
+            "series/observations", series_id=series_id, **params
+        )
+        return payload.get("observations", [])
+
+    async def series_release(self, series_id: str) -> list[dict[str, Any]]:
+        """Return the release records a series belongs to."""
+        payload = await self.get_json("series/release", series_id=series_id)
+        return payload.get("releases", [])
+
+    async def release_dates(
+        self, release_id: int, **params: Any
+    ) -> list[dict[str, Any]]:
+        """Return release-date records for a release."""
+        payload = await self.get_json("release/dates", release_id=release_id, **params)
+        return payload.get("release_dates", [])
+
+    async def releases(self, **params: Any) -> dict[str, Any]:
+        """Return one page of the `/releases` listing."""
+        return await self.get_json("releases", **params)
+
+    async def release_series(self, release_id: int, **params: Any) -> dict[str, Any]:
+        """Return one page of the series published in a release."""
+        return await self.get_json("release/series", release_id=release_id, **params)
+
+    async def release_tables(self, release_id: int, **params: Any) -> dict[str, Any]:
+        """Return the table structure of a release."""
+        return await self.get_json("release/tables", release_id=release_id, **params)
+
+    async def series_search(
+        self, search_text: str, **params: Any
+    ) -> list[dict[str, Any]]:
+        """Return series matching a full-text query."""
+        payload = await self.get_json(
+            "series/search", search_text=search_text, **params
+        )
+        return payload.get("seriess", [])
+
+
+def _is_upstream_failure(exc: httpx.HTTPError) -> bool:
+    """Whether `exc` means FRED is unavailable (not that the request was bad)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+class _LoopThread:
+    """Background thread running the event loop that owns FRED connections."""
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="fred-io", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+
+_loop_thread = _LoopThread()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run `coro` on the FRED loop and block until it completes."""
+    if _loop_thread.in_loop_thread():
+        coro.close()
+        raise RuntimeError("run_sync cannot be called from the FRED event loop.")
+    return asyncio.run_coroutine_threadsafe(coro, _loop_thread.loop).result()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> Awaitable[T]:
+    """Schedule `coro` on the FRED loop and return an awaitable for the caller's loop."""
+    if _loop_thread.in_loop_thread():
+        return coro
+    return asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(coro, _loop_thread.loop)
+    )
+
+
+_client: AsyncFredClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_async_fred_client() -> AsyncFredClient:
+    """Return the shared FRED client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = AsyncFredClient()
+        return _client
+
+
+def set_async_fred_client(client: AsyncFredClient | None) -> None:
+    """Replace the shared FRED client (pass `None` to fall back to the default)."""
+    global _client
+    with _client_lock:
+        _client = client
@@ -1,114 +1,511 @@
-import base64
+from __future__ import annotations
+
+import asyncio
 import os
-from dataclasses import dataclass
-from datetime import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
 from functools import lru_cache
-from typing import Any
+from typing import Any, Iterable, Sequence
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
-import requests
 from dotenv import load_dotenv
-from fredapi import Fred
+
+from retrieval_graph.blob_store import attachment_url, get_blob_store
+from retrieval_graph.chart_renderer import ChartSeries, get_chart_renderer
+from retrieval_graph.fred_api import AsyncFredClient, get_async_fred_client, run_sync
+from retrieval_graph.observation_store import (
+    ObservationStore,
+    StoredSeries,
+    get_observation_store,
+    revision_window_start,
+)
+from retrieval_graph.rate_limiter import get_rate_limiter
+from retrieval_graph.release_calendar import (
+    ReleaseAwareCache,
+    ReleaseCalendar,
+    ReleaseRefresher,
+    get_release_calendar,
+    register_invalidation_hook,
+)
+from retrieval_graph.release_catalog import get_release_catalog
+from retrieval_graph.release_tables import (
+    DEFAULT_DEPTH,
+    DEFAULT_PAGE_SIZE,
+    ReleaseTableTree,
+)
+from retrieval_graph.series_analytics import (
+    DEFAULT_TRANSFORMS,
+    analyze,
+    downsample_indices,
+)
+from retrieval_graph.series_index import get_series_index
 
 load_dotenv()
 
 FRED_CHART_BASE_URL = "https://fred.stlouisfed.org/graph/fredgraph.png"
 DEFAULT_CHART_WIDTH = os.getenv("FRED_CHART_WIDTH", "670")
 DEFAULT_CHART_HEIGHT = os.getenv("FRED_CHART_HEIGHT", "445")
+# "local" renders from stored observations; "fred" downloads fredgraph.png.
+CHART_BACKEND = os.getenv("FRED_CHART_BACKEND", "local")
+CHART_HISTORY_POINTS = int(os.getenv("FRED_CHART_HISTORY_POINTS", "100000"))
+DEFAULT_MAX_POINTS = int(os.getenv("FRED_MAX_POINTS", "120"))
+# Fewest points a downsampled range may have (first, last and one between).
+MIN_MAX_POINTS = 3
+
+_chart_cache = ReleaseAwareCache("fred_chart")
+_search_cache = ReleaseAwareCache("fred_series_search")
+_table_cache = ReleaseAwareCache("fred_release_tables", max_entries=64)
 
 
-@dataclass(frozen=True)
 class SeriesSnapshot:
-    """Lightweight container for FRED series metadata and observations."""
+    """Compact container for FRED series metadata and observations.
+
+    Observations are stored as two parallel arrays, `ordinals` (proleptic
+    Gregorian day numbers, `array('i')`) and `values` (`array('d')`), i.e.
+    12 bytes per point instead of one dict per point. The `{"date", "value"}`
+    dict view is only built at the serialization boundary (`observations`,
+    `latest()`). Snapshots are treated as immutable: `tail()` and `between()`
+    return new snapshots.
+    """
+
+    __slots__ = (
+        "series_id",
+        "title",
+        "units",
+        "frequency",
+        "notes",
+        "ordinals",
+        "values",
+    )
+
+    def __init__(
+        self,
+        series_id: str,
+        title: str,
+        units: str,
+        frequency: str,
+        observations: Iterable[dict[str, Any]] = (),
+        notes: str | None = None,
+    ) -> None:
+        """Build a snapshot from `{"date", "value"}` points (chronological order)."""
+        self.series_id = series_id
+        self.title = title
+        self.units = units
+        self.frequency = frequency
+        self.notes = notes
+        # Materialize once: both arrays below iterate the observations.
+        observations = list(observations)
+        self.ordinals = array(
+            "i", (date.fromisoformat(o["date"]).toordinal() for o in observations)
+        )
+        self.values = array("d", (o["value"] for o in observations))
+
+    @classmethod
+    def from_pairs(
+        cls,
+        series_id: str,
+        title: str,
+        units: str,
+        frequency: str,
+        pairs: Iterable[tuple[str, float]],
+        notes: str | None = None,
+    ) -> SeriesSnapshot:
+        """Build a snapshot from chronological `(iso_date, value)` pairs."""
+        snapshot = cls(series_id, title, units, frequency, notes=notes)
+        for day, value in pairs:
+            snapshot.ordinals.append(date.fromisoformat(day).toordinal())
+            snapshot.values.append(value)
+        return snapshot
+
+    def _with_arrays(self, ordinals: array, values: array) -> SeriesSnapshot:
+        snapshot = SeriesSnapshot(
+            self.series_id, self.title, self.units, self.frequency, notes=self.notes
+        )
+        snapshot.ordinals, snapshot.values = ordinals, values
+        return snapshot
 
-    series_id: str
-    title: str
-    units: str
-    frequency: str
-    observations: list[dict[str, Any]]
-    notes: str | None = None
+    def __len__(self) -> int:
+        """Return the number of observations."""
+        return len(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare metadata and observations."""
+        if not isinstance(other, SeriesSnapshot):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short description (without the observations)."""
+        return f"SeriesSnapshot({self.series_id!r}, {self.title!r}, points={len(self)})"
+
+    @property
+    def dates(self) -> list[str]:
+        """ISO dates of the observations."""
+        return [date.fromordinal(o).isoformat() for o in self.ordinals]
+
+    @property
+    def observations(self) -> list[dict[str, Any]]:
+        """Return the `{"date", "value"}` dict view of every observation."""
+        return [
+            {"date": date.fromordinal(o).isoformat(), "value": v}
+            for o, v in zip(self.ordinals, self.values)
+        ]
+
+    def tail(self, count: int) -> SeriesSnapshot:
+        """Return a snapshot holding only the most recent `count` observations."""
+        start = max(len(self) - max(count, 0), 0)
+        return self._with_arrays(self.ordinals[start:], self.values[start:])
+
+    def between(
+        self, start: str | None = None, end: str | None = None
+    ) -> SeriesSnapshot:
+        """Return a snapshot restricted to `start <= date <= end` (ISO, inclusive)."""
+        lo = (
+            bisect_left(self.ordinals, date.fromisoformat(start).toordinal())
+            if start
+            else 0
+        )
+        hi = (
+            bisect_right(self.ordinals, date.fromisoformat(end).toordinal())
+            if end
+            else len(self)
+        )
+        return self._with_arrays(self.ordinals[lo:hi], self.values[lo:hi])
+
+    def select(self, indices: Iterable[int]) -> SeriesSnapshot:
+        """Return a snapshot holding only the observations at `indices` (ascending)."""
+        indices = list(indices)
+        return self._with_arrays(
+            array("i", (self.ordinals[i] for i in indices)),
+            array("d", (self.values[i] for i in indices)),
+        )
 
     def latest(self, count: int = 5) -> list[dict[str, Any]]:
         """Return the most recent `count` datapoints (chronological order)."""
-        return self.observations[-count:]
+        return self.tail(count).observations
 
 
 class FredClient:
-    """Thin wrapper around `fredapi.Fred` with helper formatting."""
+    """Series snapshot helper built on the shared `AsyncFredClient`.
 
-    def __init__(self) -> None:
-        api_key = os.getenv("FRED_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                "FRED_API_KEY is required to call FRED tools but is not set."
-            )
-        self._fred = Fred(api_key=api_key)
+    When an `ObservationStore` is attached, snapshots are served from the local
+    store and refreshed incrementally instead of re-downloading history.
+    """
 
-    def get_series_snapshot(
+    def __init__(
+        self,
+        api: AsyncFredClient | None = None,
+        *,
+        store: ObservationStore | None = None,
+        calendar: ReleaseCalendar | None = None,
+    ) -> None:
+        self._api = api or get_async_fred_client()
+        self._store = store
+        self._calendar = calendar
+
+    async def aget_series_snapshot(
         self, series_id: str, *, limit: int = 180, include_observations: bool = True
     ) -> SeriesSnapshot:
-        """Fetch recent datapoints and metadata for a series."""
-        info = self._fred.get_series_info(series_id)
-
-        observations: list[dict[str, Any]] = []
+        """Fetch recent datapoints and metadata for a series concurrently."""
         if include_observations:
-            data = self._fred.get_series(
-                series_id,
-                limit=limit,
-                sort_order="desc",
+            info, raw_observations = await asyncio.gather(
+                self._api.series(series_id),
+                self._api.series_observations(
+                    series_id, limit=limit, sort_order="desc"
+                ),
             )
-            for date, value in zip(data.index, data.values):
-                if value != value:  # filter NaNs
-                    continue
-                if hasattr(date, "strftime"):
-                    date_str = date.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date)
-                observations.append({"date": date_str, "value": float(value)})
-            observations.reverse()
-
-        return SeriesSnapshot(
-            series_id=series_id,
+        else:
+            info, raw_observations = await self._api.series(series_id), []
+
+        return SeriesSnapshot.from_pairs(
+            series_id,
             title=info.get("title", series_id),
             units=info.get("units", ""),
             frequency=info.get("frequency", ""),
-            observations=observations,
+            pairs=reversed(_parse_observations(raw_observations)),
             notes=info.get("notes"),
         )
 
+    def get_series_snapshot(
+        self, series_id: str, *, limit: int = 180, include_observations: bool = True
+    ) -> SeriesSnapshot:
+        """Fetch recent datapoints and metadata for a series."""
+        if self._store is None:
+            return run_sync(
+                self.aget_series_snapshot(
+                    series_id, limit=limit, include_observations=include_observations
+                )
+            )
+        snapshot = self.refresh_series(series_id)
+        return snapshot.tail(limit if include_observations else 0)
+
+    def refresh_series(self, series_id: str, *, force: bool = False) -> SeriesSnapshot:
+        """Bring the stored copy of a series up to date and return its full history.
+
+        Raises:
+            RuntimeError: If no observation store is attached.
+        """
+        store = self._store
+        if store is None:
+            raise RuntimeError("refresh_series requires an observation store.")
+        if not force and self._is_current(series_id):
+            cached = store.snapshot(series_id)
+            if cached is not None:
+                return cached
+
+        state = store.state(series_id)
+        update = run_sync(self._afetch_update(series_id, state))
+        return self._apply_update(store, series_id, *update)
+
+    async def _afetch_update(
+        self, series_id: str, state: StoredSeries | None
+    ) -> tuple[dict[str, Any], list[dict[str, Any]] | None, str | None]:
+        """Fetch series metadata and, only if it changed, the recent observations.
+
+        Returns the metadata, the raw observations (`None` if unchanged) and
+        the start of the refetched revision window (`None` for a full load).
+        """
+        info = await self._api.series(series_id)
+        if state is not None and state.last_updated == info.get("last_updated"):
+            return info, None, None
+        start = (
+            revision_window_start(state.last_date, info.get("frequency", ""))
+            if state
+            else None
+        )
+        raw_observations = await self._api.series_observations(
+            series_id, observation_start=start
+        )
+        return info, raw_observations, start
+
+    def _apply_update(
+        self,
+        store: ObservationStore,
+        series_id: str,
+        info: dict[str, Any],
+        raw_observations: list[dict[str, Any]] | None,
+        observation_start: str | None = None,
+    ) -> SeriesSnapshot:
+        """Record a fetched update in the store and return the full history."""
+        if raw_observations is None:
+            store.mark_checked(series_id)
+        else:
+            store.apply_refresh(
+                series_id,
+                info,
+                _parse_observations(raw_observations),
+                replace_from=observation_start,
+            )
+        if self._calendar is not None:
+            self._calendar.track(series_id)
+
+        snapshot = store.snapshot(series_id)
+        if snapshot is None:
+            raise RuntimeError(f"Series '{series_id}' missing from observation store.")
+        return snapshot
+
+    def get_series_snapshots(
+        self, series_ids: Sequence[str], *, limit: int = 180
+    ) -> list[SeriesSnapshot | Exception]:
+        """Fetch several series at once, issuing all network requests concurrently.
+
+        Series that are still current in the observation store are served
+        without any I/O. Failures are returned in place of the snapshot so one
+        bad series id does not sink the batch.
+        """
+        if self._store is None:
+
+            async def _gather() -> list[SeriesSnapshot | BaseException]:
+                return await asyncio.gather(
+                    *(self.aget_series_snapshot(s, limit=limit) for s in series_ids),
+                    return_exceptions=True,
+                )
+
+            return [_as_result(r) for r in run_sync(_gather())]
+
+        store = self._store
+        results: dict[str, SeriesSnapshot | Exception] = {}
+        stale: list[str] = []
+        for series_id in dict.fromkeys(series_ids):
+            cached = store.snapshot(series_id) if self._is_current(series_id) else None
+            if cached is not None:
+                results[series_id] = cached
+            else:
+                stale.append(series_id)
+
+        if stale:
+            states = {series_id: store.state(series_id) for series_id in stale}
+
+            async def _gather_updates() -> list[Any]:
+                return await asyncio.gather(
+                    *(self._afetch_update(s, states[s]) for s in stale),
+                    return_exceptions=True,
+                )
+
+            for series_id, update in zip(stale, run_sync(_gather_updates())):
+                if isinstance(update, BaseException):
+                    results[series_id] = _as_result(update)
+                    continue
+                try:
+                    results[series_id] = self._apply_update(store, series_id, *update)
+                except Exception as exc:  # noqa: BLE001
+                    results[series_id] = exc
+
+        return [
+            r if isinstance(r, Exception) else r.tail(limit)
+            for r in (results[s] for s in series_ids)
+        ]
+
+    def _is_current(self, series_id: str) -> bool:
+        """Return whether the stored copy can be served without asking FRED."""
+        store = self._store
+        if store is None:
+            return False
+        freshness = store.freshness(series_id)
+        if freshness is None:
+            return False
+        if self._calendar is not None:
+            checked_at, last_updated = freshness
+            current = self._calendar.is_current(
+                series_id, checked_at, last_updated=last_updated
+            )
+            if current is not None:
+                return current
+        return store.is_fresh(series_id)
+
+    def rewarm_after_release(self, series_id: str, published_at: float) -> bool:
+        """Refresh a series after a release and report whether the new data landed."""
+        self.refresh_series(series_id, force=True)
+        freshness = self._store.freshness(series_id) if self._store else None
+        last_updated = freshness[1] if freshness else None
+        release_day = datetime.fromtimestamp(published_at, tz=timezone.utc).date()
+        return bool(last_updated) and last_updated[:10] >= release_day.isoformat()
+
+
+def _as_result(result: Any) -> Any:
+    """Pass snapshots through; re-raise cancellations and other non-`Exception`s."""
+    if isinstance(result, BaseException) and not isinstance(result, Exception):
+        raise result
+    return result
+
+
+def _parse_observation_value(raw: Any) -> float | None:
+    """Convert a FRED observation value to float, dropping missing (".") and NaN values."""
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return None
+    if value != value:  # filter NaNs
+        return None
+    return value
+
+
+def _parse_observations(
+    raw_observations: list[dict[str, Any]],
+) -> list[tuple[str, float]]:
+    """Convert raw FRED observation records into `(date, value)` pairs."""
+    observations: list[tuple[str, float]] = []
+    for item in raw_observations:
+        value = _parse_observation_value(item.get("value"))
+        if value is None:
+            continue
+        observations.append((item.get("date", ""), value))
+    return observations
+
 
 @lru_cache(maxsize=1)
 def get_fred_client() -> FredClient:
-    """Return a cached FRED client."""
-    return FredClient()
+    """Return a cached FRED client backed by the shared observation store.
+
+    The first call also starts the background `ReleaseRefresher` unless
+    `FRED_RELEASE_REFRESHER=0`. It re-warms only series held in the store;
+    series the calendar merely maps are invalidated, not fetched.
+    """
+    store = get_observation_store()
+    calendar = get_release_calendar()
+    client = FredClient(store=store, calendar=calendar)
+    if store is not None:
+        register_invalidation_hook(store.invalidate)
+    if os.getenv("FRED_RELEASE_REFRESHER", "1").lower() not in {"0", "false", "no"}:
+        ReleaseRefresher(
+            calendar,
+            client.rewarm_after_release,
+            should_rewarm=store.holds if store is not None else None,
+        ).start()
+    return client
 
 
-def _build_chart_url(series_id: str, *, width: str, height: str) -> str:
+def _build_chart_url(
+    series_id: str,
+    *,
+    width: str,
+    height: str,
+    observation_start: str | None = None,
+    observation_end: str | None = None,
+) -> str:
     params = {"id": series_id, "width": width, "height": height}
+    if observation_start:
+        params["cosd"] = observation_start
+    if observation_end:
+        params["coed"] = observation_end
     return f"{FRED_CHART_BASE_URL}?{urlencode(params)}"
 
 
-def _download_chart_image(series_id: str) -> tuple[str, bytes]:
+def _download_chart_image(series_id: str, **range_params: str) -> tuple[str, bytes]:
     chart_url = _build_chart_url(
         series_id,
         width=DEFAULT_CHART_WIDTH,
         height=DEFAULT_CHART_HEIGHT,
+        **range_params,
     )
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        limiter.acquire()
     with urlopen(chart_url) as response:  # noqa: S310 - manual script context
         data = response.read()
     return chart_url, data
 
 
+def _chart_series(
+    snapshot: SeriesSnapshot,
+    *,
+    observation_start: str | None = None,
+    observation_end: str | None = None,
+) -> ChartSeries:
+    """Project a snapshot onto the picklable form the chart renderer consumes."""
+    window = snapshot.between(observation_start, observation_end)
+    return ChartSeries(
+        series_id=snapshot.series_id,
+        title=snapshot.title,
+        units=snapshot.units,
+        dates=tuple(window.dates),
+        values=tuple(window.values),
+    )
+
+
 def build_chart_attachment(
-    snapshot: SeriesSnapshot, chart_bytes: bytes, chart_url: str
+    snapshot: SeriesSnapshot,
+    chart_bytes: bytes,
+    chart_url: str | None,
+    *,
+    media_type: str = "image/png",
 ) -> dict[str, Any]:
-    """Generate a chart attachment payload using FRED-rendered image bytes."""
-    encoded = base64.b64encode(chart_bytes).decode("utf-8")
+    """Store rendered chart bytes and return an attachment that references them.
+
+    The attachment carries only the blob digest and its `/attachments` URL; the
+    image bytes stay in the blob store so state and responses remain small.
+    """
+    digest = get_blob_store().put(chart_bytes, media_type)
 
     return {
         "type": "image",
-        "source": f"data:image/png;base64,{encoded}",
+        "blob": digest,
+        "media_type": media_type,
+        "url": attachment_url(digest),
         "title": snapshot.title,
         "series_id": snapshot.series_id,
         "units": snapshot.units,
@@ -131,17 +528,105 @@ def build_series_datablock(
     }
 
 
-def fetch_chart(series_id: str) -> dict[str, Any]:
-    """Fetch a series and prepare an attachment-only response."""
+def build_columnar_datablock(
+    snapshots: Sequence[SeriesSnapshot], *, latest_points: int = 12
+) -> dict[str, Any]:
+    """Align the latest points of several series on one shared date axis.
+
+    The result has a single sorted `dates` list and, per series, a `values`
+    list of the same length (`None` where a series has no observation on that
+    date), which is far more compact in a prompt than per-point dicts.
+    """
+    recent = [s.latest(latest_points) for s in snapshots]
+    dates = sorted({o["date"] for points in recent for o in points})
+    series = []
+    for snapshot, points in zip(snapshots, recent):
+        by_date = {o["date"]: o["value"] for o in points}
+        series.append(
+            {
+                "series_id": snapshot.series_id,
+                "title": snapshot.title,
+                "units": snapshot.units,
+                "frequency": snapshot.frequency,
+                "values": [by_date.get(d) for d in dates],
+            }
+        )
+    return {"layout": "columnar", "dates": dates, "series": series}
+
+
+def fetch_chart(
+    series_id: str,
+    *,
+    overlay_series_ids: Sequence[str] = (),
+    observation_start: str | None = None,
+    observation_end: str | None = None,
+) -> dict[str, Any]:
+    """Render a chart for one series (plus optional overlays) as an attachment.
+
+    With the default `local` backend the chart is drawn from stored
+    observations in the renderer process; `FRED_CHART_BACKEND=fred` downloads
+    `fredgraph.png` instead. Successful charts are cached until the next
+    release of any charted series.
+    """
+    series_ids = list(dict.fromkeys([series_id, *(s for s in overlay_series_ids if s)]))
+    cache_key = (tuple(series_ids), observation_start, observation_end)
+    cached = _chart_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         client = get_fred_client()
-        snapshot = client.get_series_snapshot(series_id, include_observations=False)
-        chart_url, chart_bytes = _download_chart_image(series_id)
-        attachment = build_chart_attachment(snapshot, chart_bytes, chart_url)
-        return {
-            "message": f"Generated chart for {snapshot.title} ({series_id}).",
+        if CHART_BACKEND == "fred":
+            snapshot = client.get_series_snapshot(series_id, include_observations=False)
+            range_params = {
+                k: v
+                for k, v in (
+                    ("observation_start", observation_start),
+                    ("observation_end", observation_end),
+                )
+                if v
+            }
+            chart_url, chart_bytes = _download_chart_image(
+                ",".join(series_ids), **range_params
+            )
+            attachment = build_chart_attachment(snapshot, chart_bytes, chart_url)
+        else:
+            snapshots = [
+                client.get_series_snapshot(sid, limit=CHART_HISTORY_POINTS)
+                for sid in series_ids
+            ]
+            snapshot = snapshots[0]
+            chart_bytes = get_chart_renderer().render(
+                [
+                    _chart_series(
+                        s,
+                        observation_start=observation_start,
+                        observation_end=observation_end,
+                    )
+                    for s in snapshots
+                ],
+                width=int(DEFAULT_CHART_WIDTH),
+                height=int(DEFAULT_CHART_HEIGHT),
+            )
+            attachment = build_chart_attachment(snapshot, chart_bytes, None)
+        if len(series_ids) > 1:
+            attachment["series_ids"] = series_ids
+        label = ", ".join(series_ids)
+        payload = {
+            "message": f"Generated chart for {snapshot.title} ({label}).",
             "attachments": [attachment],
         }
+        _chart_cache.put(
+            cache_key,
+            payload,
+            series_ids,
+            loader=lambda: fetch_chart(
+                series_id,
+                overlay_series_ids=overlay_series_ids,
+                observation_start=observation_start,
+                observation_end=observation_end,
+            ),
+        )
+        return payload
     except Exception as exc:  # noqa: BLE001
         return {
             "message": f"Failed to generate chart for '{series_id}': {exc}",
@@ -150,154 +635,207 @@ def fetch_chart(series_id: str) -> dict[str, Any]:
         }
 
 
-def fetch_recent_data(series_id: str, *, latest_points: int = 12) -> dict[str, Any]:
-    """Fetch structured datapoints for a series."""
+def fetch_recent_data(
+    series_id: str,
+    *,
+    latest_points: int = 12,
+    observation_start: str | None = None,
+    observation_end: str | None = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+    downsample: str = "lttb",
+) -> dict[str, Any]:
+    """Fetch structured datapoints for a series.
+
+    Without a date range the latest `latest_points` observations are returned.
+    With `observation_start` and/or `observation_end`, the whole range is
+    returned, downsampled to at most `max_points` with a shape-preserving
+    method (`lttb` or `minmax`) when it is longer than that. `max_points` is
+    clamped to `[MIN_MAX_POINTS, DEFAULT_MAX_POINTS]` so the response stays
+    within the token budget.
+    """
+    max_points = min(max(max_points, MIN_MAX_POINTS), DEFAULT_MAX_POINTS)
     try:
-        snapshot = get_fred_client().get_series_snapshot(series_id)
-        datablock = build_series_datablock(snapshot, latest_points=latest_points)
+        if observation_start is None and observation_end is None:
+            snapshot = get_fred_client().get_series_snapshot(series_id)
+            datablock = build_series_datablock(snapshot, latest_points=latest_points)
+            return {
+                "message": (
+                    f"Retrieved {len(datablock['points'])} recent data points for "
+                    f"{snapshot.title} ({series_id})."
+                ),
+                "series_data": [datablock],
+            }
+
+        history = get_fred_client().get_series_snapshot(
+            series_id, limit=CHART_HISTORY_POINTS
+        )
+        snapshot = history.between(observation_start, observation_end)
+        original = len(snapshot)
+        if original > max_points:
+            snapshot = snapshot.select(
+                downsample_indices(
+                    snapshot.ordinals, snapshot.values, max_points, method=downsample
+                )
+            )
+        datablock = build_series_datablock(snapshot, latest_points=len(snapshot))
+        span = f"{observation_start or 'start'} to {observation_end or 'latest'}"
+        message = (
+            f"Retrieved {len(snapshot)} data points for {history.title} "
+            f"({series_id}) from {span}."
+        )
+        if len(snapshot) < original:
+            datablock["downsampled"] = {
+                "method": downsample,
+                "original_points": original,
+            }
+            message += f" Downsampled from {original} points ({downsample})."
+        return {"message": message, "series_data": [datablock]}
+    except Exception as exc:  # noqa: BLE001
         return {
-            "message": (
-                f"Retrieved {len(datablock['points'])} recent data points for "
-                f"{snapshot.title} ({series_id})."
-            ),
-            "series_data": [datablock],
+            "message": f"Failed to fetch recent data for '{series_id}': {exc}",
+            "series_data": [],
+            "error": str(exc),
+        }
+
+
+def fetch_recent_data_batch(
+    series_ids: Sequence[str], *, latest_points: int = 12
+) -> dict[str, Any]:
+    """Fetch several series concurrently and return one columnar datablock."""
+    series_ids = list(dict.fromkeys(s for s in series_ids if s))
+    if not series_ids:
+        return {
+            "message": "No series_ids were provided.",
+            "series_data": [],
+            "error": "series_ids is empty",
         }
+    try:
+        results = get_fred_client().get_series_snapshots(
+            series_ids, limit=latest_points
+        )
     except Exception as exc:  # noqa: BLE001
         return {
-            "message": f"Failed to fetch recent data for '{series_id}': {exc}",
+            "message": f"Failed to fetch recent data for {', '.join(series_ids)}: {exc}",
             "series_data": [],
             "error": str(exc),
         }
 
+    snapshots = [r for r in results if isinstance(r, SeriesSnapshot)]
+    errors = {
+        series_id: str(r)
+        for series_id, r in zip(series_ids, results)
+        if isinstance(r, Exception)
+    }
+    payload: dict[str, Any] = {"series_data": []}
+    if snapshots:
+        datablock = build_columnar_datablock(snapshots, latest_points=latest_points)
+        payload["series_data"] = [datablock]
+        message = (
+            f"Retrieved {len(datablock['dates'])} dates for "
+            f"{', '.join(s.series_id for s in snapshots)}."
+        )
+    else:
+        message = "Failed to fetch recent data for every requested series."
+    if errors:
+        failed = "; ".join(f"{k}: {v}" for k, v in errors.items())
+        message = f"{message} Failed: {failed}"
+        payload["errors"] = errors
+    payload["message"] = message
+    return payload
 
-# def fetch_release_schedule(release_id: int) -> dict[str, Any]:
-#     """Fetch scheduled release dates for a FRED release."""
-#     api_key = os.getenv("FRED_API_KEY")
-#     if not api_key:
-#         raise RuntimeError("FRED_API_KEY is required to call release schedule tool.")
-
-#     params: dict[str, Any] = {
-#         "api_key": api_key,
-#         "file_type": "json",
-#         "release_id": release_id,
-#         "include_release_dates_with_no_data": "true",
-#     }
-
-#     try:
-#         response = requests.get(
-#             "https://api.stlouisfed.org/fred/release/dates",
-#             params=params,
-#             timeout=10,
-#         )
-#         response.raise_for_status()
-#         payload = response.json()
-#         dates = payload.get("release_dates", [])
-
-#         year_candidates = [
-#             int(item["date"][:4])
-#             for item in dates
-#             if isinstance(item.get("date"), str) and item["date"][:4].isdigit()
-#         ]
-#         latest_year = max(year_candidates) if year_candidates else None
-#         filtered_dates = [
-#             item
-#             for item in dates
-#             if latest_year is None
-#             or (
-#                 isinstance(item.get("date"), str)
-#                 and item["date"].startswith(str(latest_year))
-#             )
-#         ]
-
-#         year_text = f" {latest_year}" if latest_year is not None else ""
-#         today_str = datetime.utcnow().strftime("%Y-%m-%d")
-#         return {
-#             "message": (
-#                 f"Retrieved {len(filtered_dates)} release dates for release {release_id}{year_text}. "
-#                 f"Today: {today_str}."
-#             ),
-#             "release_schedule": filtered_dates,
-#             "release_year": latest_year,
-#         }
-#     except Exception as exc:  # noqa: BLE001
-#         return {
-#             "message": f"Failed to fetch release schedule for '{release_id}': {exc}",
-#             "release_schedule": [],
-#             "error": str(exc),
-#         }
+
+def fetch_series_analytics(
+    series_id: str,
+    *,
+    transforms: Sequence[str] | None = None,
+    window: int | None = None,
+    observation_start: str | None = None,
+) -> dict[str, Any]:
+    """Compute YoY/MoM, rolling, z-score and extremum summaries over a series' history."""
+    try:
+        snapshot = get_fred_client().get_series_snapshot(
+            series_id, limit=CHART_HISTORY_POINTS
+        )
+        history = snapshot.between(observation_start)
+        summary = analyze(
+            history.dates,
+            history.values,
+            frequency=snapshot.frequency,
+            transforms=transforms or DEFAULT_TRANSFORMS,
+            window=window,
+        )
+        return {
+            "message": (
+                f"Computed analytics for {snapshot.title} ({series_id}) over "
+                f"{summary['observations']} observations."
+            ),
+            "analytics": {
+                "series_id": snapshot.series_id,
+                "title": snapshot.title,
+                "units": snapshot.units,
+                "frequency": snapshot.frequency,
+                **summary,
+            },
+        }
+    except Exception as exc:  # noqa: BLE001
+        return {
+            "message": f"Failed to compute analytics for '{series_id}': {exc}",
+            "analytics": None,
+            "error": str(exc),
+        }
 
 
 def fetch_series_release_schedule(series_id: str) -> dict[str, Any]:
-    """Resolve a series to its release and fetch the corresponding schedule."""
-    api_key = os.getenv("FRED_API_KEY")
-    if not api_key:
-        raise RuntimeError("FRED_API_KEY is required to call series release tool.")
+    """Resolve a series to its release and fetch the corresponding schedule.
+
+    Answers come from the local `ReleaseCalendar` index; FRED is only called
+    the first time a series is seen or when its release dates are a day old.
+    """
+    calendar = get_release_calendar()
 
     try:
-        response = requests.get(
-            "https://api.stlouisfed.org/fred/series/release",
-            params={
-                "series_id": series_id,
-                "api_key": api_key,
-                "file_type": "json",
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        data = response.json()
-        releases = data.get("releases", [])
-        if not releases:
+        release_id = calendar.ensure_series(series_id)
+        if release_id is None:
             return {
                 "message": f"No release found for series '{series_id}'.",
                 "release_schedule": [],
                 "error": f"No release metadata for {series_id}",
             }
-        release_meta = releases[0]
-        release_id = int(release_meta.get("id", 0))
-        release_name = release_meta.get("name", "Unknown release")
-
-        schedule_resp = requests.get(
-            "https://api.stlouisfed.org/fred/release/dates",
-            params={
-                "api_key": api_key,
-                "file_type": "json",
-                "release_id": release_id,
-                "include_release_dates_with_no_data": "true",
-            },
-            timeout=10,
-        )
-        schedule_resp.raise_for_status()
-        schedule_data = schedule_resp.json()
-        dates = schedule_data.get("release_dates", [])
-
-        year_candidates = [
-            int(item["date"][:4])
-            for item in dates
-            if isinstance(item.get("date"), str) and item["date"][:4].isdigit()
-        ]
-        latest_year = max(year_candidates) if year_candidates else None
-        filtered_dates = [
-            item
-            for item in dates
-            if latest_year is None
-            or (
-                isinstance(item.get("date"), str)
-                and item["date"].startswith(str(latest_year))
+        release_name = calendar.release_name(release_id) or "Unknown release"
+
+        today = datetime.utcnow().date()
+        all_dates = calendar.release_dates(release_id)
+        latest_year = all_dates[-1].year if all_dates else None
+        if latest_year is not None:
+            year_dates = calendar.release_dates_between(
+                release_id, date(latest_year, 1, 1), date(latest_year, 12, 31)
             )
+        else:
+            year_dates = []
+        filtered_dates = [
+            {
+                "release_id": release_id,
+                "release_name": release_name,
+                "date": d.isoformat(),
+            }
+            for d in year_dates
         ]
+        next_date = calendar.next_release_date(release_id, after=today)
 
-        today_str = datetime.utcnow().strftime("%Y-%m-%d")
+        today_str = today.strftime("%Y-%m-%d")
         year_text = f" {latest_year}" if latest_year is not None else ""
+        next_text = f" Next release: {next_date.isoformat()}." if next_date else ""
         message = (
             f"Series {series_id} belongs to release {release_name} ({release_id}). "
             f"Retrieved {len(filtered_dates)} release dates for release {release_id}{year_text}. "
-            f"Today: {today_str}."
+            f"Today: {today_str}.{next_text}"
         )
         return {
             "message": message,
             "release_schedule": filtered_dates,
             "release_year": latest_year,
             "release_info": {"id": release_id, "name": release_name},
+            "next_release_date": next_date.isoformat() if next_date else None,
             "series_id": series_id,
         }
     except Exception as exc:  # noqa: BLE001
@@ -308,111 +846,189 @@ def fetch_series_release_schedule(series_id: str) -> dict[str, Any]:
         }
 
 
-def fetch_release_structure_by_name(release_name: str) -> dict[str, Any]:
-    """Fetch release metadata (series count + table structure) by release name."""
-    api_key = os.getenv("FRED_API_KEY")
-    if not api_key:
-        raise RuntimeError("FRED_API_KEY is required to call release tools.")
+async def _fetch_release_tables(
+    release_id: int, element_ids: Sequence[int | None]
+) -> list[dict[str, Any]]:
+    api = get_async_fred_client()
+    return await asyncio.gather(
+        *(api.release_tables(release_id, element_id=e) for e in element_ids)
+    )
+
 
-    try:
-        releases_resp = requests.get(
-            "https://api.stlouisfed.org/fred/releases",
-            params={
-                "api_key": api_key,
-                "file_type": "json",
-                "limit": 1000,
-            },
-            timeout=10,
+def get_release_table_tree(
+    release_id: int,
+    element_id: int | None = None,
+    *,
+    depth: int = DEFAULT_DEPTH,
+    offset: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> ReleaseTableTree:
+    """Return the cached table tree of a release, expanded enough for a page.
+
+    Subtrees that the requested page needs but that have not been fetched yet
+    are requested concurrently (one `release/tables?element_id=` call each)
+    and merged into a copy of the cached tree, which then replaces it. The
+    tree is tagged with all of its series and dropped when the release
+    publishes; a tree without series yet is not cached.
+    """
+    cached = _table_cache.get(release_id)
+    page = {"depth": depth, "offset": offset, "limit": limit}
+    if (
+        cached is not None
+        and (element_id is None or element_id in cached.nodes)
+        and not cached.unexpanded(element_id, **page)
+    ):
+        return cached
+    # Concurrent callers may be rendering the cached tree: extend a private
+    # copy and swap it in.
+    tree = cached.copy() if cached is not None else ReleaseTableTree(release_id)
+    if element_id is not None and element_id not in tree.nodes:
+        tree.merge(
+            run_sync(_fetch_release_tables(release_id, [element_id]))[0],
+            element_id=element_id,
         )
-        releases_resp.raise_for_status()
-        releases_payload = releases_resp.json()
-        matched_release: dict[str, Any] | None = None
-        for item in releases_payload.get("releases", []):
-            if release_name.lower() in item.get("name", "").lower():
-                matched_release = item
-                break
+    # Each round expands one more level of the page; depth bounds the rounds.
+    for _ in range(depth + 1):
+        missing = tree.unexpanded(element_id, **page)
+        if not missing:
+            break
+        payloads = run_sync(_fetch_release_tables(release_id, missing))
+        for expanded, payload in zip(missing, payloads):
+            tree.merge(payload, element_id=expanded)
+    series_ids = tree.series_ids() or get_release_calendar().series_for(release_id)
+    if series_ids:
+        _tag_release_series(release_id, series_ids)
+        _table_cache.put(release_id, tree, series_ids)
+    return tree
+
+
+def _tag_release_series(release_id: int, series_ids: Sequence[str]) -> None:
+    """Record the release of table series so the tree expires when it publishes.
+
+    Every series in a release's tables belongs to that release, so only the
+    first is left for the refresher to resolve (which also loads the release
+    dates); the rest are seeded without a `series/release` request each.
+    Seeded series only drive invalidation: the refresher does not re-fetch
+    them at publication unless they are held in the observation store.
+    """
+    calendar = get_release_calendar()
+    calendar.seed(
+        {
+            series_id: release_id
+            for series_id in series_ids[1:]
+            if calendar.release_for(series_id) is None
+        }
+    )
+
+
+def fetch_release_structure_by_name(
+    release_name: str,
+    *,
+    element_id: int | None = None,
+    depth: int = DEFAULT_DEPTH,
+    offset: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> dict[str, Any]:
+    """Fetch one page of a release's table tree as a compact outline.
+
+    The name is resolved against the in-memory `ReleaseCatalog`. Instead of
+    the full `release/tables` payload, the result holds an outline of `limit`
+    children of `element_id` (the release root by default) starting at
+    `offset`, `depth` levels deep (see `release_tables`); the model drills
+    down by calling again with an `element_id` from the outline.
+    """
+    catalog = get_release_catalog()
+
+    try:
+        catalog.ensure_loaded()
+        matched_release = catalog.best_match(release_name)
 
         if not matched_release:
             return {
                 "message": f"No release found matching '{release_name}'.",
                 "release": None,
-                "series_metadata": None,
-                "tables": None,
+                "outline": None,
                 "error": f"No FRED release matched '{release_name}'.",
             }
 
         release_id = int(matched_release.get("id", 0))
         release_title = matched_release.get("name", release_name)
-
-        series_resp = requests.get(
-            "https://api.stlouisfed.org/fred/release/series",
-            params={
-                "api_key": api_key,
-                "file_type": "json",
-                "release_id": release_id,
-                "limit": 1,
-            },
-            timeout=10,
-        )
-        series_resp.raise_for_status()
-        series_payload = series_resp.json()
-
-        tables_resp = requests.get(
-            "https://api.stlouisfed.org/fred/release/tables",
-            params={
-                "api_key": api_key,
-                "file_type": "json",
-                "release_id": release_id,
-            },
-            timeout=10,
+        tree = get_release_table_tree(
+            release_id, element_id, depth=depth, offset=offset, limit=limit
         )
-        tables_resp.raise_for_status()
-        tables_payload = tables_resp.json()
+        page = tree.outline(element_id, depth=depth, offset=offset, limit=limit)
 
+        where = (
+            f"element {element_id} ({tree.nodes[element_id].name})"
+            if element_id is not None
+            else "the release root"
+        )
+        last = page.next_offset or page.total
         message = (
             f"Resolved release '{release_name}' to '{release_title}' "
-            f"(release_id={release_id}). Retrieved series metadata and table structure."
+            f"(release_id={release_id}). Table outline under {where}: "
+            f"items {min(page.offset + 1, last)}-{last} of {page.total}, "
+            f"{page.depth} level(s) deep."
         )
+        if page.next_offset is not None:
+            message += f" More items from offset={page.next_offset}."
         return {
             "message": message,
-            "release": matched_release,
-            "series_metadata": series_payload,
-            "tables": tables_payload,
+            "release": {"id": release_id, "name": release_title},
+            "element_id": element_id,
+            "depth": page.depth,
+            "offset": page.offset,
+            "total": page.total,
+            "next_offset": page.next_offset,
+            "outline": page.outline,
         }
     except Exception as exc:  # noqa: BLE001
         return {
             "message": f"Failed to fetch release structure for '{release_name}': {exc}",
             "release": None,
-            "series_metadata": None,
-            "tables": None,
+            "outline": None,
             "error": str(exc),
         }
 
 
 def search_series(query: str, *, limit: int = 5) -> dict[str, Any]:
-    """Search for series matching a query using FRED's search API."""
-    api_key = os.getenv("FRED_API_KEY")
-    if not api_key:
-        raise RuntimeError("FRED_API_KEY is required to search FRED series.")
+    """Search for series matching a query.
+
+    Answers from the local BM25 `SeriesIndex` when it has a hit and falls back
+    to FRED's search API otherwise. API results are cached until a release of
+    any returned series.
+    """
+    index = get_series_index()
+    if index is not None:
+        hits = index.search(query, limit=limit)
+        if hits:
+            return {
+                "message": f"Found {len(hits)} series for query '{query}'.",
+                "results": [{**h.series, "score": round(h.score, 3)} for h in hits],
+                "source": "local_index",
+            }
+
+    cache_key = (" ".join(query.lower().split()), limit)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    api = get_async_fred_client()
 
     try:
-        response = requests.get(
-            "https://api.stlouisfed.org/fred/series/search",
-            params={
-                "api_key": api_key,
-                "file_type": "json",
-                "search_text": query,
-                "limit": limit,
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        payload = response.json()
-        series = payload.get("seriess", [])
-        return {
+        series = run_sync(api.series_search(query, limit=limit))
+        payload = {
             "message": f"Found {len(series)} series for query '{query}'.",
             "results": series,
+            "source": "fred_api",
         }
+        if series:
+            _search_cache.put(
+                cache_key,
+                payload,
+                [item["id"] for item in series if item.get("id")],
+                loader=lambda: search_series(query, limit=limit),
+            )
+        return payload
     except Exception as exc:  # noqa: BLE001
         return {
             "message": f"Failed to search series for '{query}': {exc}",
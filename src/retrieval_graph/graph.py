@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any
 
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage, ToolMessage
@@ -13,17 +13,9 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 
-from retrieval_graph import retrieval
 from retrieval_graph.configuration import Configuration
-from retrieval_graph.fred_tool import (
-    fetch_chart,
-    fetch_recent_data,
-    fetch_series_release_schedule,
-    fetch_release_structure_by_name,
-    search_series,
-)
-from retrieval_graph.fraser_tool import search_fomc_titles
 from retrieval_graph.state import InputState, State
+from retrieval_graph.tools import TOOL_DEFINITIONS, registry
 from retrieval_graph.utils import format_docs, load_chat_model
 
 from langsmith import Client
@@ -36,151 +28,6 @@ print("Projects:", [p.name for p in client.list_projects()])
 
 MAX_TOOL_CALLS = 4
 
-TOOL_DEFINITIONS = [
-    {
-        "type": "function",
-        "function": {
-            "name": "retrieve_documents",
-            "description": (
-                "Use this tool to search the indexed knowledge base for information "
-                "relevant to the user's question. Provide a concise natural language query."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query to retrieve supporting documents.",
-                    }
-                },
-                "required": ["query"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fred_chart",
-            "description": (
-                "Render a chart for a FRED series and share the image with the user. "
-                "Call this when the user asks for a plot or visualization."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "series_id": {
-                        "type": "string",
-                        "description": "Exact FRED series identifier (e.g. CPIAUCSL).",
-                    }
-                },
-                "required": ["series_id"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fred_recent_data",
-            "description": (
-                "Fetch recent numeric datapoints for a FRED series and use them in analysis. "
-                "Call this when the user needs the latest figures or trends."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "series_id": {
-                        "type": "string",
-                        "description": "Exact FRED series identifier (e.g. UNRATE).",
-                    }
-                },
-                "required": ["series_id"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fred_series_release_schedule",
-            "description": (
-                "Resolve a FRED series to its release and return upcoming release dates."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "series_id": {
-                        "type": "string",
-                        "description": "FRED series identifier (e.g. UNRATE, CPIAUCSL).",
-                    }
-                },
-                "required": ["series_id"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fred_release_structure",
-            "description": (
-                "Fetch release metadata and table structure by release name (e.g. H.4.1)."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "release_name": {
-                        "type": "string",
-                        "description": "FRED release name to inspect (e.g. H.4.1).",
-                    }
-                },
-                "required": ["release_name"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fraser_search_fomc_titles",
-            "description": (
-                "Search the FRASER/Postgres FOMC catalog for meeting titles (e.g. 'Meeting, January 2010')."
-            ),
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Fuzzy title query, e.g. 'Meeting, January 26-27, 2010'.",
-                    }
-                },
-                "required": ["query"],
-            },
-        },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fred_search_series",
-            "description": "Search the FRED catalog for series matching a text query.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search text to find FRED series.",
-                    }
-                },
-                "required": ["query"],
-            },
-        },
-    },
-]
-
-
-def _summarize_documents(docs: Iterable[Document], *, max_docs: int = 3) -> str:
-    """Convert retrieved docs into a compact string for tool feedback."""
-    limited = list(docs)[:max_docs]
-    if not limited:
-        return "No documents were retrieved."
-    return format_docs(limited)
-
 
 async def call_model(
     state: State, *, config: RunnableConfig
@@ -211,10 +58,16 @@ async def call_model(
 async def call_tool(
     state: State, *, config: RunnableConfig
 ) -> dict[str, Any]:
-    """Execute tool calls emitted by the model."""
+    """Execute tool calls emitted by the model.
+
+    Calls from the same message run concurrently (bounded by
+    `Configuration.max_concurrent_tool_calls`), while the resulting
+    `ToolMessage`s keep the order of the originating tool calls.
+    """
     if not state.messages:
         return {}
 
+    configuration = Configuration.from_runnable_config(config)
     attachments: list[dict[str, Any]] = []
     series_data: list[dict[str, Any]] = []
     collected_docs: list[Document] = []
@@ -225,152 +78,50 @@ async def call_tool(
     last_message = state.messages[-1]
     tool_calls = getattr(last_message, "tool_calls", []) or []
 
+    # Admission is decided up front, in order, so the budget is charged exactly
+    # as if the calls had run one after another.
+    scheduled: list[dict[str, Any]] = []
+    limit_message: ToolMessage | None = None
     for tool_call in tool_calls:
-        name = tool_call.get("name")
-        args = tool_call.get("args") or {}
-        call_id = tool_call.get("id")
-
         if tool_call_count >= MAX_TOOL_CALLS:
             content = (
                 "Tool-call limit reached. Provide the best answer you can with the "
                 "information already collected."
             )
-            tool_messages.append(
-                ToolMessage(
-                    content=content,
-                    tool_call_id=call_id or "",
-                )
+            limit_message = ToolMessage(
+                content=content,
+                tool_call_id=tool_call.get("id") or "",
             )
             break
+        scheduled.append(tool_call)
+        if registry.counts_toward_limit(
+            tool_call.get("name"), tool_call.get("args") or {}
+        ):
+            tool_call_count += 1
+
+    semaphore = asyncio.Semaphore(max(1, configuration.max_concurrent_tool_calls))
+
+    async def _run_bounded(tool_call: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await registry.invoke(
+                tool_call.get("name"), tool_call.get("args") or {}, config
+            )
 
-        if name == "retrieve_documents":
-            query = args.get("query")
-            if not query:
-                content = "No query provided to retrieval tool."
-            else:
-                with retrieval.make_retriever(config) as retriever:
-                    docs = await retriever.ainvoke(query, config)
-                collected_docs.extend(docs)
-                collected_queries.append(query)
-                content = _summarize_documents(docs)
-        elif name == "fred_chart":
-            series_id = args.get("series_id")
-            if not series_id:
-                content = "A FRED series_id is required for chart generation."
-            else:
-                payload = fetch_chart(series_id)
-                attachments.extend(payload.get("attachments", []))
-                content = payload.get("message", f"Chart generated for {series_id}.")
-        elif name == "fred_recent_data":
-            series_id = args.get("series_id")
-            if not series_id:
-                content = "A FRED series_id is required to fetch recent data."
-            else:
-                payload = fetch_recent_data(series_id)
-                series_blocks = payload.get("series_data", [])
-                series_data.extend(series_blocks)
-                block_json = json.dumps(series_blocks, indent=2)
-                content = f"{payload.get('message', 'Retrieved series data.')}\n{block_json}"
-        # elif name == "fred_release_schedule":
-        #     release_id = args.get("release_id")
-        #     if release_id in (None, ""):
-        #         content = "A FRED release_id is required to fetch the release schedule."
-        #     else:
-        #         release_id_int = int(release_id)
-        #         payload = fetch_release_schedule(release_id_int)
-        #         schedule = payload.get("release_schedule", [])
-        #         message = payload.get(
-        #             "message",
-        #             f"Retrieved release schedule for {release_id_int}.",
-        #         )
-        #         content_lines = [message]
-        #         if schedule:
-        #             content_lines.append(json.dumps(schedule, indent=2))
-        #         elif payload.get("error"):
-        #             content_lines.append(f"Error: {payload['error']}")
-        #         else:
-        #             content_lines.append("No release dates returned.")
-        #         content = "\n".join(content_lines)
-        elif name == "fred_series_release_schedule":
-            series_id = args.get("series_id")
-            if not series_id:
-                content = (
-                    "A FRED series_id is required to fetch the series release schedule."
-                )
-            else:
-                payload = fetch_series_release_schedule(series_id)
-                schedule = payload.get("release_schedule", [])
-                message = payload.get(
-                    "message",
-                    f"Retrieved release schedule for {series_id}.",
-                )
-                lines = [message]
-                if schedule:
-                    lines.append(json.dumps(schedule, indent=2))
-                elif payload.get("error"):
-                    lines.append(f"Error: {payload['error']}")
-                else:
-                    lines.append("No release dates returned.")
-                content = "\n".join(lines)
-                tool_call_count += 1
-        elif name == "fred_release_structure":
-            release_name = args.get("release_name")
-            if not release_name:
-                content = (
-                    "A release_name is required to fetch release structure metadata."
-                )
-            else:
-                payload = fetch_release_structure_by_name(release_name)
-                message = payload.get(
-                    "message",
-                    f"Retrieved release structure for {release_name}.",
-                )
-                content = f"{message}\n{json.dumps(payload, indent=2)}"
-                tool_call_count += 1
-        elif name == "fraser_search_fomc_titles":
-            query = args.get("query")
-            if not query:
-                content = "A query is required to search FOMC titles."
-            else:
-                payload = search_fomc_titles(query)
-                message = payload.get(
-                    "message",
-                    f"Retrieved FOMC titles for '{query}'.",
-                )
-                content = f"{message}\n{json.dumps(payload, indent=2)}"
-        elif name == "fred_search_series":
-            query = args.get("query")
-            if not query:
-                content = "A search query is required to search FRED series."
-            else:
-                payload = search_series(query)
-                message = payload.get(
-                    "message",
-                    f"Retrieved search results for '{query}'.",
-                )
-                content = f"{message}\n{json.dumps(payload, indent=2)}"
-                tool_call_count += 1
-        elif name == "fraser_search_fomc_titles":
-            query = args.get("query")
-            if not query:
-                content = "A query is required to search FOMC titles."
-            else:
-                payload = search_fomc_titles(query)
-                message = payload.get(
-                    "message",
-                    f"Retrieved FOMC titles for '{query}'.",
-                )
-                content = f"{message}\n{json.dumps(payload, indent=2)}"
-                tool_call_count += 1
-        else:
-            content = f"Tool '{name}' is not implemented."
+    outcomes = await asyncio.gather(*(_run_bounded(tc) for tc in scheduled))
 
+    for tool_call, outcome in zip(scheduled, outcomes):
+        attachments.extend(outcome.get("attachments", []))
+        series_data.extend(outcome.get("series_data", []))
+        collected_docs.extend(outcome.get("docs", []))
+        collected_queries.extend(outcome.get("queries", []))
         tool_messages.append(
             ToolMessage(
-                content=content,
-                tool_call_id=call_id or "",
+                content=outcome["content"],
+                tool_call_id=tool_call.get("id") or "",
             )
         )
+    if limit_message is not None:
+        tool_messages.append(limit_message)
 
     updates: dict[str, Any] = {
         "messages": tool_messages,
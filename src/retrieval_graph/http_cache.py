@@ -0,0 +1,273 @@
+"""Disk-backed response cache for FRED REST endpoints.
+
+`AsyncFredClient.get_json` consults this cache for the metadata endpoints
+listed in `DEFAULT_TTLS` (`series/release`, `release/dates`,
+`release/tables`, `releases`, `series/search`). Observation and series
+metadata requests are not cached here; the `ObservationStore` owns those.
+
+Each endpoint has its own TTL. A response younger than its TTL is served
+as is. An older one, still within `FRED_HTTP_CACHE_MAX_STALE` seconds past
+its TTL, is also served immediately while the client refreshes it in the
+background (stale-while-revalidate). Older entries are refetched before
+answering.
+
+When FRED fails and a cached response exists, however old, the client serves
+it in degraded mode. It records a `DegradedResponse` in the current
+`track_degraded()` scope instead of raising, and `ToolRegistry` turns those
+records into an explicit notice on the tool output.
+
+Entries live in a SQLite database (`fred_http_cache.sqlite` in the cache
+directory), so every worker process shares them. The database is bounded by
+`FRED_HTTP_CACHE_MAX_BYTES`, and least recently used entries are evicted
+first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+from retrieval_graph.utils import cache_path
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+# Fresh lifetime per endpoint; endpoints not listed are never cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "series/release": 7 * DAY,
+    "release/dates": 12 * HOUR,
+    "release/tables": DAY,
+    "releases": DAY,
+    "series/search": HOUR,
+}
+DEFAULT_MAX_STALE_SECONDS = float(os.getenv("FRED_HTTP_CACHE_MAX_STALE", str(DAY)))
+DEFAULT_MAX_BYTES = int(os.getenv("FRED_HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Query parameters that do not change the response.
+_IGNORED_PARAMS = frozenset({"api_key", "file_type"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body and when it was fetched."""
+
+    endpoint: str
+    payload: dict[str, Any]
+    fetched_at: float
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the response was fetched."""
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+@dataclass(frozen=True)
+class DegradedResponse:
+    """A stale response served because the upstream request failed."""
+
+    endpoint: str
+    fetched_at: float
+    error: str
+
+
+_degraded: ContextVar[list[DegradedResponse] | None] = ContextVar(
+    "fred_degraded_responses", default=None
+)
+
+
+@contextmanager
+def track_degraded() -> Iterator[list[DegradedResponse]]:
+    """Collect the degraded responses served inside the block."""
+    events: list[DegradedResponse] = []
+    token = _degraded.set(events)
+    try:
+        yield events
+    finally:
+        _degraded.reset(token)
+
+
+def record_degraded(event: DegradedResponse) -> None:
+    """Note a degraded response in the enclosing `track_degraded` scope, if any."""
+    events = _degraded.get()
+    if events is not None:
+        events.append(event)
+
+
+def degraded_notice(events: list[DegradedResponse]) -> str:
+    """Describe degraded responses for the model in one line."""
+    oldest = min(e.fetched_at for e in events)
+    stamp = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime(oldest))
+    endpoints = ", ".join(sorted({e.endpoint for e in events}))
+    return (
+        f"[Degraded: FRED is unavailable; serving cached {endpoints} data "
+        f"fetched as early as {stamp}. Figures may be out of date.]"
+    )
+
+
+def _parse_ttls(spec: str) -> dict[str, float]:
+    """Parse `endpoint=seconds,...` overrides (`FRED_HTTP_CACHE_TTLS`)."""
+    ttls: dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        endpoint, _, seconds = item.partition("=")
+        ttls[endpoint.strip().strip("/")] = float(seconds)
+    return ttls
+
+
+class ResponseCache:
+    """SQLite-backed, LRU-bounded cache of FRED JSON responses."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        ttls: Mapping[str, float] | None = None,
+        max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Open (and if needed create) the cache database.
+
+        Args:
+            path (str | os.PathLike[str] | None): SQLite file; defaults to
+                `fred_http_cache.sqlite` in the cache directory.
+            ttls (Mapping[str, float] | None): Fresh lifetime per endpoint;
+                defaults to `DEFAULT_TTLS`. A TTL of `0` disables caching.
+            max_stale_seconds (float): How long past its TTL an entry is still
+                served while it is revalidated in the background.
+            max_bytes (int): Upper bound on stored (compressed) body bytes.
+        """
+        self.path = Path(path) if path else cache_path("fred_http_cache.sqlite")
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_stale_seconds = max_stale_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        """Return the TTL for `endpoint`, or `None` if it is not cached."""
+        ttl = self.ttls.get(endpoint.strip("/"))
+        return ttl if ttl else None
+
+    @staticmethod
+    def key(endpoint: str, params: Mapping[str, Any]) -> str:
+        """Return the cache key for a request (credentials excluded)."""
+        query = {
+            k: str(v)
+            for k, v in params.items()
+            if k not in _IGNORED_PARAMS and v is not None
+        }
+        return f"{endpoint.strip('/')}?{json.dumps(query, sort_keys=True)}"
+
+    def get(self, key: str, *, now: float | None = None) -> CachedResponse | None:
+        """Return the cached response for `key`, marking it recently used."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT endpoint, body, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        endpoint, body, fetched_at = row
+        try:
+            payload = json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            logger.warning("Dropping corrupt FRED cache entry %s", key)
+            self.delete(key)
+            return None
+        return CachedResponse(endpoint, payload, fetched_at)
+
+    def put(
+        self,
+        key: str,
+        endpoint: str,
+        payload: dict[str, Any],
+        *,
+        now: float | None = None,
+    ) -> None:
+        """Store a response and evict least recently used entries over the cap."""
+        now = time.time() if now is None else now
+        body = zlib.compress(json.dumps(payload, separators=(",", ":")).encode())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint.strip("/"), body, len(body), now, now),
+            )
+            self._evict(keep=key)
+
+    def _evict(self, *, keep: str) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses WHERE key != ? ORDER BY accessed_at",
+            (keep,),
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored (compressed) bodies."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache | None:
+    """Return the shared response cache, or `None` if `FRED_HTTP_CACHE=0`."""
+    if os.getenv("FRED_HTTP_CACHE", "1").lower() in {"0", "false", "no"}:
+        return None
+    ttls = {**DEFAULT_TTLS, **_parse_ttls(os.getenv("FRED_HTTP_CACHE_TTLS", ""))}
+    return ResponseCache(os.getenv("FRED_HTTP_CACHE_PATH") or None, ttls=ttls)
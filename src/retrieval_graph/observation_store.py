@@ -0,0 +1,280 @@
+"""Persistent local store for FRED series observations.
+
+Observations and series metadata are kept in a SQLite database keyed by
+`series_id`. `FredClient` consults the store before going to the network:
+
+- A series that is still current (no release of it has published since it
+  was last checked, per the `ReleaseCalendar`; or, for series whose release
+  is not known yet, checked within the recheck window) is served straight
+  from an in-process copy of the stored snapshot (no I/O at all). Up to
+  `FRED_STORE_MAX_SNAPSHOTS` copies are kept, least recently used first out.
+- Otherwise the client fetches the series metadata and compares its
+  `last_updated` stamp with the stored one. If nothing changed, only the
+  check time is bumped; if it changed, observations from a revision window
+  of `FRED_REVISION_LOOKBACK_PERIODS` periods before the last stored date
+  onward are requested and replace the stored rows in that window, so
+  revisions to recent prints (payrolls, GDP, CPI) are picked up.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from retrieval_graph.series_analytics import periods_per_year
+from retrieval_graph.utils import cache_path
+
+if TYPE_CHECKING:
+    from retrieval_graph.fred_tool import SeriesSnapshot
+
+DEFAULT_RECHECK_SECONDS = float(os.getenv("FRED_STORE_RECHECK_SECONDS", "900"))
+DEFAULT_MAX_SNAPSHOTS = int(os.getenv("FRED_STORE_MAX_SNAPSHOTS", "256"))
+REVISION_LOOKBACK_PERIODS = int(os.getenv("FRED_REVISION_LOOKBACK_PERIODS", "6"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    series_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    units TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    notes TEXT,
+    last_updated TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    series_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (series_id, date)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class StoredSeries:
+    """Refresh bookkeeping for a stored series."""
+
+    series_id: str
+    last_updated: str | None
+    last_date: str | None
+    checked_at: float
+
+
+class ObservationStore:
+    """SQLite-backed observation store with an in-memory snapshot layer."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        recheck_seconds: float = DEFAULT_RECHECK_SECONDS,
+        max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    ) -> None:
+        """Open (and if needed create) the store at `path`."""
+        self.path = Path(path) if path else cache_path("fred_observations.sqlite")
+        self.recheck_seconds = recheck_seconds
+        self.max_snapshots = max_snapshots
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._snapshots: OrderedDict[str, SeriesSnapshot] = OrderedDict()
+        self._freshness: dict[str, tuple[float, str | None]] = {}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def state(self, series_id: str) -> StoredSeries | None:
+        """Return refresh bookkeeping for a series, or `None` if never stored."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT s.last_updated, s.checked_at, MAX(o.date)
+                FROM series s
+                LEFT JOIN observations o ON o.series_id = s.series_id
+                WHERE s.series_id = ?
+                GROUP BY s.series_id
+                """,
+                (series_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return StoredSeries(
+            series_id=series_id,
+            last_updated=row[0],
+            last_date=row[2],
+            checked_at=row[1],
+        )
+
+    def freshness(self, series_id: str) -> tuple[float, str | None] | None:
+        """Return `(checked_at, last_updated)` for a stored series, from memory when possible."""
+        cached = self._freshness.get(series_id)
+        if cached is None:
+            state = self.state(series_id)
+            if state is None:
+                return None
+            cached = self._freshness[series_id] = (state.checked_at, state.last_updated)
+        return cached
+
+    def holds(self, series_id: str) -> bool:
+        """Return whether the series has ever been stored."""
+        return self.freshness(series_id) is not None
+
+    def is_fresh(self, series_id: str, *, now: float | None = None) -> bool:
+        """Return whether a series was checked against FRED within the recheck window."""
+        freshness = self.freshness(series_id)
+        if freshness is None:
+            return False
+        now = time.time() if now is None else now
+        return now - freshness[0] < self.recheck_seconds
+
+    def snapshot(self, series_id: str) -> SeriesSnapshot | None:
+        """Return the full stored history for a series, or `None` if absent."""
+        with self._lock:
+            cached = self._snapshots.get(series_id)
+            if cached is not None:
+                self._snapshots.move_to_end(series_id)
+                return cached
+
+        from retrieval_graph.fred_tool import SeriesSnapshot
+
+        with self._lock:
+            meta = self._conn.execute(
+                "SELECT title, units, frequency, notes FROM series WHERE series_id = ?",
+                (series_id,),
+            ).fetchone()
+            if meta is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT date, value FROM observations WHERE series_id = ? ORDER BY date",
+                (series_id,),
+            ).fetchall()
+        snapshot = SeriesSnapshot.from_pairs(
+            series_id,
+            title=meta[0],
+            units=meta[1],
+            frequency=meta[2],
+            pairs=rows,
+            notes=meta[3],
+        )
+        with self._lock:
+            self._snapshots[series_id] = snapshot
+            self._snapshots.move_to_end(series_id)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def mark_checked(self, series_id: str, *, now: float | None = None) -> None:
+        """Record that the series was confirmed unchanged upstream."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE series SET checked_at = ? WHERE series_id = ?",
+                (now, series_id),
+            )
+        freshness = self.freshness(series_id)
+        self._freshness[series_id] = (now, freshness[1] if freshness else None)
+
+    def apply_refresh(
+        self,
+        series_id: str,
+        info: dict[str, Any],
+        observations: Iterable[tuple[str, float]],
+        *,
+        replace_from: str | None = None,
+        now: float | None = None,
+    ) -> None:
+        """Upsert series metadata and freshly fetched observations.
+
+        Args:
+            series_id (str): FRED series identifier.
+            info (dict[str, Any]): Series metadata record from `/fred/series`.
+            observations (Iterable[tuple[str, float]]): Parsed `(date, value)` pairs.
+            replace_from (str | None): Start of the refetched window; stored
+                observations on or after it are replaced, so revised values
+                are updated and withdrawn ones dropped.
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO series
+                    (series_id, title, units, frequency, notes, last_updated, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(series_id) DO UPDATE SET
+                    title = excluded.title,
+                    units = excluded.units,
+                    frequency = excluded.frequency,
+                    notes = excluded.notes,
+                    last_updated = excluded.last_updated,
+                    checked_at = excluded.checked_at
+                """,
+                (
+                    series_id,
+                    info.get("title", series_id),
+                    info.get("units", ""),
+                    info.get("frequency", ""),
+                    info.get("notes"),
+                    info.get("last_updated"),
+                    now,
+                ),
+            )
+            if replace_from is not None:
+                self._conn.execute(
+                    "DELETE FROM observations WHERE series_id = ? AND date >= ?",
+                    (series_id, replace_from),
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)",
+                ((series_id, day, value) for day, value in observations),
+            )
+        self._freshness[series_id] = (now, info.get("last_updated"))
+        self._snapshots.pop(series_id, None)
+
+    def invalidate(self, series_id: str) -> None:
+        """Force the next lookup of `series_id` to re-check FRED."""
+        freshness = self.freshness(series_id)
+        if freshness is not None:
+            self._freshness[series_id] = (0.0, freshness[1])
+        self._snapshots.pop(series_id, None)
+
+
+def revision_window_start(
+    last_date: str | None,
+    frequency: str,
+    *,
+    periods: int = REVISION_LOOKBACK_PERIODS,
+) -> str | None:
+    """Return the first date to refetch so the last `periods` observations are revised.
+
+    Monthly and lower frequencies step back whole months (to the first of the
+    month); weekly and daily series step back days.
+    """
+    if not last_date:
+        return None
+    day = date.fromisoformat(last_date)
+    per_year = periods_per_year(frequency)
+    if per_year <= 12:
+        year, month = divmod(
+            day.year * 12 + day.month - 1 - periods * (12 // per_year), 12
+        )
+        return date(year, month + 1, 1).isoformat()
+    return (day - timedelta(days=periods * (365 // per_year))).isoformat()
+
+
+@lru_cache(maxsize=1)
+def get_observation_store() -> ObservationStore | None:
+    """Return the shared store, or `None` when disabled via `FRED_OBSERVATION_STORE=0`."""
+    if os.getenv("FRED_OBSERVATION_STORE", "1").lower() in {"0", "false", "no"}:
+        return None
+    return ObservationStore(os.getenv("FRED_STORE_PATH") or None)
@@ -0,0 +1,330 @@
+"""Process-wide Postgres connection pools for the FRASER tools.
+
+Opening a connection to RDS (TCP, TLS and auth) used to cost more than the
+FOMC title query itself, and `fraser_tool` did it on every call. `PgPool`
+keeps up to `PG_POOL_MAX` psycopg2 connections open for reuse:
+
+- `PG_POOL_MIN` connections are opened on first use and kept open.
+- Callers beyond `PG_POOL_MAX` wait up to `PG_POOL_ACQUIRE_TIMEOUT` seconds
+  for a connection, then get `PoolTimeout`.
+- A connection idle for longer than `PG_POOL_HEALTHCHECK_SECONDS` is pinged
+  (`SELECT 1`) before reuse and replaced if the ping fails. A connection
+  that is closed or errors while in use is discarded.
+- New connections use `PG_CONNECT_TIMEOUT` and a server-side
+  `PG_STATEMENT_TIMEOUT_MS`.
+
+`AsyncPgPool` is the asyncio counterpart built on `asyncpg` (an optional
+dependency: `pip install asyncpg`), so async callers can query without
+blocking their event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SIZE = int(os.getenv("PG_POOL_MIN", "1"))
+DEFAULT_MAX_SIZE = int(os.getenv("PG_POOL_MAX", "5"))
+DEFAULT_CONNECT_TIMEOUT = int(os.getenv("PG_CONNECT_TIMEOUT", "5"))
+DEFAULT_STATEMENT_TIMEOUT_MS = int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "5000"))
+DEFAULT_HEALTHCHECK_SECONDS = float(os.getenv("PG_POOL_HEALTHCHECK_SECONDS", "30"))
+DEFAULT_ACQUIRE_TIMEOUT = float(os.getenv("PG_POOL_ACQUIRE_TIMEOUT", "10"))
+
+
+class PoolTimeout(TimeoutError):
+    """No pooled connection became available in time."""
+
+
+def connection_kwargs() -> dict[str, Any]:
+    """Return psycopg2 connect arguments from `PG_*` environment variables."""
+    return {
+        "host": os.getenv("PG_HOST"),
+        "port": os.getenv("PG_PORT") or None,
+        "dbname": os.getenv("PG_NAME"),
+        "user": os.getenv("PG_USER"),
+        "password": os.getenv("PG_PASS"),
+        "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+        "options": f"-c statement_timeout={DEFAULT_STATEMENT_TIMEOUT_MS}",
+    }
+
+
+def _psycopg2_connect() -> Any:
+    import psycopg2
+
+    return psycopg2.connect(**connection_kwargs())
+
+
+@dataclass
+class PoolStats:
+    """Pool counters."""
+
+    size: int = 0
+    idle: int = 0
+    created: int = 0
+    discarded: int = 0
+    waits: int = 0
+
+
+class PgPool:
+    """Thread-safe, health-checked pool of DB-API connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any] = _psycopg2_connect,
+        *,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        healthcheck_seconds: float = DEFAULT_HEALTHCHECK_SECONDS,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+    ) -> None:
+        """Configure the pool; no connection is opened until first use.
+
+        Args:
+            connect (Callable[[], Any]): Opens a new connection.
+            min_size (int): Connections opened on first use and kept open.
+            max_size (int): Upper bound on open connections.
+            healthcheck_seconds (float): Ping connections idle at least this
+                long before handing them out.
+            acquire_timeout (float): Seconds to wait for a free connection.
+        """
+        self._connect = connect
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.healthcheck_seconds = healthcheck_seconds
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._size = 0
+        self._opened = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = PoolStats()
+
+    def _open_connection(self) -> Any:
+        conn = self._connect()
+        with self._cond:
+            self._stats.created += 1
+        return conn
+
+    def _fill(self) -> None:
+        """Open `min_size` connections (once)."""
+        with self._cond:
+            if self._opened:
+                return
+            self._opened = True
+            needed = max(0, self.min_size - self._size)
+            self._size += needed
+        for _ in range(needed):
+            try:
+                conn = self._open_connection()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def _healthy(self, conn: Any, idle_since: float) -> bool:
+        if getattr(conn, "closed", False):
+            return False
+        if time.monotonic() - idle_since < self.healthcheck_seconds:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            conn.rollback()
+        except Exception as exc:  # noqa: BLE001
+            logger.info("Discarding unhealthy Postgres connection: %s", exc)
+            return False
+        return True
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats.discarded += 1
+            self._cond.notify()
+
+    def getconn(self) -> Any:
+        """Check out a healthy connection, opening one if below `max_size`.
+
+        Raises:
+            PoolTimeout: If none is free within `acquire_timeout` seconds.
+            RuntimeError: If the pool has been closed.
+        """
+        self._fill()
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Postgres pool is closed.")
+                    if self._idle:
+                        conn, idle_since = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        conn = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(
+                            f"No Postgres connection free within {self.acquire_timeout}s."
+                        )
+                    self._stats.waits += 1
+                    self._cond.wait(remaining)
+            if conn is None:
+                try:
+                    return self._open_connection()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            if self._healthy(conn, idle_since):
+                return conn
+            self._discard(conn)
+
+    def putconn(self, conn: Any, *, broken: bool = False) -> None:
+        """Return a connection; broken or closed ones are discarded.
+
+        Any open transaction is rolled back, so callers that write must commit
+        before returning the connection.
+        """
+        if not broken and not getattr(conn, "closed", False):
+            try:
+                conn.rollback()
+            except Exception:  # noqa: BLE001
+                broken = True
+        if broken or getattr(conn, "closed", False) or self._closed:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of the block.
+
+        The connection is always returned: an ordinary error keeps it unless it
+        closed, while an interruption (cancellation, `KeyboardInterrupt`) may
+        leave a query in flight, so the connection is discarded.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        except Exception:
+            self.putconn(conn, broken=getattr(conn, "closed", False))
+            raise
+        except BaseException:
+            self.putconn(conn, broken=True)
+            raise
+        self.putconn(conn)
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict[str, int]:
+        """Return pool size and counters."""
+        with self._cond:
+            self._stats.size = self._size
+            self._stats.idle = len(self._idle)
+            return dict(vars(self._stats))
+
+
+@lru_cache(maxsize=1)
+def get_pg_pool() -> PgPool:
+    """Return the process-wide FRASER Postgres pool."""
+    return PgPool()
+
+
+class AsyncPgPool:
+    """Lazily created `asyncpg` pool, one per event loop."""
+
+    def __init__(
+        self,
+        *,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+    ) -> None:
+        """Configure the pool; connections open on first `acquire`."""
+        self.min_size = min_size
+        self.max_size = max(1, max_size, min_size)
+        self.acquire_timeout = acquire_timeout
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    async def _pool(self) -> Any:
+        import asyncpg
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+        if pool is None:
+            kwargs = connection_kwargs()
+            pool = await asyncpg.create_pool(
+                host=kwargs["host"],
+                port=kwargs["port"],
+                database=kwargs["dbname"],
+                user=kwargs["user"],
+                password=kwargs["password"],
+                min_size=self.min_size,
+                max_size=self.max_size,
+                timeout=DEFAULT_CONNECT_TIMEOUT,
+                command_timeout=DEFAULT_STATEMENT_TIMEOUT_MS / 1000,
+            )
+            with self._lock:
+                existing = self._pools.setdefault(loop, pool)
+            if existing is not pool:
+                await pool.close()
+                pool = existing
+        return pool
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Borrow an `asyncpg` connection for the duration of the block."""
+        pool = await self._pool()
+        async with pool.acquire(timeout=self.acquire_timeout) as conn:
+            yield conn
+
+
+def asyncpg_available() -> bool:
+    """Whether the optional `asyncpg` driver is installed."""
+    try:
+        import asyncpg  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def get_async_pg_pool() -> AsyncPgPool:
+    """Return the process-wide asyncio FRASER Postgres pool."""
+    return AsyncPgPool()
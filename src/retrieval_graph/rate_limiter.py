@@ -0,0 +1,277 @@
+"""Process-shared token bucket for the FRED API key.
+
+Every worker process uses the same `FRED_API_KEY`, and FRED enforces its
+request limit per key, so a per-process limiter is not enough. The bucket
+state lives in a small SQLite database (`fred_rate_limit.sqlite` in the cache
+directory by default); each acquisition refills and debits it inside a
+`BEGIN IMMEDIATE` transaction, which serializes workers on the same host
+without Redis or any other service.
+
+Requests carry a `Priority`:
+
+- `INTERACTIVE` (the default): tool calls a user is waiting on.
+- `BACKGROUND`: release refreshes and catalog reloads.
+- `CRAWL`: bulk catalog crawls.
+
+Lower classes may not spend the last `reserve` fraction of the bucket, and
+they also back off while a higher-priority request is waiting, so a crawl
+saturating the key cannot starve interactive calls. The priority is taken
+from a context variable, so background code wraps its work in
+`with request_priority(Priority.BACKGROUND): ...` and the FRED client picks
+it up, including on the shared FRED event loop (`run_sync`/`run_async` copy
+the caller's context).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterator, Sequence
+
+from retrieval_graph.utils import cache_path
+
+# FRED allows 120 requests per minute per API key; `0` disables limiting.
+DEFAULT_RATE_PER_MINUTE = 120.0
+DEFAULT_BURST = 10.0
+# Fraction of the bucket each priority class must leave untouched.
+DEFAULT_RESERVE = (0.0, 0.3, 0.5)
+# How long a waiting request blocks lower classes without re-registering.
+WAITER_TTL_SECONDS = 5.0
+MAX_SLEEP_SECONDS = 1.0
+
+
+class Priority(IntEnum):
+    """Request priority classes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    CRAWL = 2
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "fred_request_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Return the priority of FRED requests made from the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Tag FRED requests made inside the block with `priority`."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bucket (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    waiter TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+class SharedRateLimiter:
+    """Token bucket shared by every process that opens the same database."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        rate_per_minute: float = DEFAULT_RATE_PER_MINUTE,
+        burst: float = DEFAULT_BURST,
+        reserve: Sequence[float] = DEFAULT_RESERVE,
+        name: str = "fred",
+    ) -> None:
+        """Open (or create) the bucket database.
+
+        Args:
+            path (str | os.PathLike[str] | None): SQLite file holding the
+                bucket; defaults to `fred_rate_limit.sqlite` in the cache dir.
+            rate_per_minute (float): Sustained requests per minute.
+            burst (float): Bucket capacity (requests allowed back to back).
+            reserve (Sequence[float]): Per-`Priority` fraction of `burst` that
+                requests of that class may not consume.
+            name (str): Bucket name, so several limits can share one file.
+        """
+        self.path = str(path) if path else str(cache_path("fred_rate_limit.sqlite"))
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.reserve = tuple(reserve)
+        self.name = name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _floor(self, priority: Priority) -> float:
+        index = min(int(priority), len(self.reserve) - 1)
+        return self.burst * self.reserve[index]
+
+    def _refill(self, now: float) -> float:
+        row = self._conn.execute(
+            "SELECT tokens, updated FROM bucket WHERE name = ?", (self.name,)
+        ).fetchone()
+        if row is None:
+            return self.burst
+        tokens, updated = row
+        return min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+
+    def _store(self, tokens: float, now: float) -> None:
+        self._conn.execute(
+            "INSERT INTO bucket (name, tokens, updated) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, "
+            "updated = excluded.updated",
+            (self.name, tokens, now),
+        )
+
+    def try_acquire(
+        self,
+        priority: Priority | None = None,
+        *,
+        waiter: str | None = None,
+        now: float | None = None,
+    ) -> float:
+        """Take one token if `priority` may have it now.
+
+        On refusal, `waiter` (when given) is registered so lower classes yield
+        to it until it succeeds, calls `cancel`, or `WAITER_TTL_SECONDS` pass.
+
+        Returns:
+            float: `0.0` when a token was taken, else seconds to wait before
+                trying again.
+        """
+        priority = current_priority() if priority is None else priority
+        now = time.time() if now is None else now
+        floor = self._floor(priority)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens = self._refill(now)
+                self._conn.execute("DELETE FROM waiters WHERE expires < ?", (now,))
+                blocked = self._conn.execute(
+                    "SELECT 1 FROM waiters WHERE name = ? AND priority < ? LIMIT 1",
+                    (self.name, int(priority)),
+                ).fetchone()
+                if blocked is None and tokens - 1.0 >= floor:
+                    self._store(tokens - 1.0, now)
+                    if waiter:
+                        self._conn.execute(
+                            "DELETE FROM waiters WHERE waiter = ?", (waiter,)
+                        )
+                    self._conn.execute("COMMIT")
+                    return 0.0
+                self._store(tokens, now)
+                if waiter:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO waiters VALUES (?, ?, ?, ?)",
+                        (waiter, self.name, int(priority), now + WAITER_TTL_SECONDS),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        deficit = floor + 1.0 - tokens
+        wait = deficit / self.rate if deficit > 0 else 1.0 / self.rate
+        return min(max(wait, 0.005), MAX_SLEEP_SECONDS)
+
+    def cancel(self, waiter: str) -> None:
+        """Drop a waiter registration (e.g. after a timeout or cancellation)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM waiters WHERE waiter = ?", (waiter,))
+
+    def penalize(self, seconds: float, *, now: float | None = None) -> None:
+        """Empty the bucket for `seconds` (after FRED answered 429)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens = min(self._refill(now), -seconds * self.rate)
+                self._store(tokens, now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def acquire(
+        self, priority: Priority | None = None, *, timeout: float | None = None
+    ) -> None:
+        """Block the calling thread until a token is available.
+
+        Raises:
+            TimeoutError: If no token was granted within `timeout` seconds.
+        """
+        priority = current_priority() if priority is None else priority
+        waiter = uuid.uuid4().hex
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while wait := self.try_acquire(priority, waiter=waiter):
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    raise TimeoutError("Timed out waiting for the FRED rate limit.")
+                time.sleep(wait)
+        except BaseException:
+            self.cancel(waiter)
+            raise
+
+    async def aacquire(
+        self, priority: Priority | None = None, *, timeout: float | None = None
+    ) -> None:
+        """Wait (without blocking the event loop) until a token is available.
+
+        The SQLite bucket is queried on a worker thread, not on the loop.
+
+        Raises:
+            TimeoutError: If no token was granted within `timeout` seconds.
+        """
+        priority = current_priority() if priority is None else priority
+        waiter = uuid.uuid4().hex
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while wait := await asyncio.to_thread(
+                self.try_acquire, priority, waiter=waiter
+            ):
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    raise TimeoutError("Timed out waiting for the FRED rate limit.")
+                await asyncio.sleep(wait)
+        except BaseException:
+            await asyncio.to_thread(self.cancel, waiter)
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> SharedRateLimiter | None:
+    """Return the shared FRED limiter, or `None` when limiting is disabled.
+
+    Configured with `FRED_RATE_LIMIT_PER_MINUTE` (`0` disables),
+    `FRED_RATE_LIMIT_BURST` and `FRED_RATE_LIMIT_PATH`.
+    """
+    rate = float(os.getenv("FRED_RATE_LIMIT_PER_MINUTE", str(DEFAULT_RATE_PER_MINUTE)))
+    if rate <= 0:
+        return None
+    return SharedRateLimiter(
+        os.getenv("FRED_RATE_LIMIT_PATH") or None,
+        rate_per_minute=rate,
+        burst=float(os.getenv("FRED_RATE_LIMIT_BURST", str(DEFAULT_BURST))),
+    )
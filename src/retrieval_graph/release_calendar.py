@@ -0,0 +1,588 @@
+"""Release-calendar-aware caching for FRED data.
+
+FRED series only change when their release publishes, so instead of guessing
+TTLs every cached value is considered current until the next publication of
+the release its series belongs to.
+
+- `ReleaseCalendar` maps series to releases and releases to sorted release
+  dates, and derives publication instants from them (release date at
+  `FRED_RELEASE_PUBLISH_HOUR_UTC`).
+- `ReleaseAwareCache` is a small in-process cache whose entries are tagged
+  with series ids and expire at the next publication of any tagged series.
+- `ReleaseRefresher` is a background thread that wakes up at each
+  publication, invalidates every cache holding the affected series and
+  re-warms them, retrying for a while if FRED has not posted the new data yet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable
+
+from retrieval_graph.fred_api import AsyncFredClient, get_async_fred_client, run_sync
+from retrieval_graph.rate_limiter import Priority, request_priority
+from retrieval_graph.utils import cache_path
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_HOUR_UTC = int(os.getenv("FRED_RELEASE_PUBLISH_HOUR_UTC", "12"))
+RELEASE_RETRY_SECONDS = float(os.getenv("FRED_RELEASE_RETRY_SECONDS", "600"))
+RELEASE_WINDOW_SECONDS = float(os.getenv("FRED_RELEASE_WINDOW_SECONDS", "43200"))
+CALENDAR_REFRESH_SECONDS = float(os.getenv("FRED_CALENDAR_REFRESH_SECONDS", "86400"))
+UNTRACKED_MAX_AGE_SECONDS = float(os.getenv("FRED_STORE_RECHECK_SECONDS", "900"))
+
+
+def publication_instant(day: date, *, hour_utc: int = PUBLISH_HOUR_UTC) -> float:
+    """Return the epoch time at which data for a release date is assumed published."""
+    return datetime(
+        day.year, day.month, day.day, hour_utc, tzinfo=timezone.utc
+    ).timestamp()
+
+
+def _day_of(instant: float) -> str:
+    return datetime.fromtimestamp(instant, tz=timezone.utc).date().isoformat()
+
+
+class ReleaseCalendar:
+    """Local index of series → release and release → sorted release dates.
+
+    Series are resolved lazily (one `series/release` plus one `release/dates`
+    request the first time a series is seen) and release dates are reloaded
+    once they are older than `FRED_CALENDAR_REFRESH_SECONDS`. When a `path`
+    is given the index is persisted as JSON, so a restarted process answers
+    schedule questions without touching the network.
+
+    Release dates are kept as sorted `date.toordinal()` arrays, and every
+    query is a binary search over them.
+    """
+
+    def __init__(
+        self,
+        api: AsyncFredClient | None = None,
+        *,
+        path: str | os.PathLike[str] | None = None,
+        publish_hour_utc: int = PUBLISH_HOUR_UTC,
+    ) -> None:
+        """Create the calendar, loading a previously saved index from `path`."""
+        self._api = api
+        self.path = Path(path) if path else None
+        self.publish_hour_utc = publish_hour_utc
+        self._lock = threading.Lock()
+        self._series_release: dict[str, int | None] = {}
+        self._release_names: dict[int, str] = {}
+        self._release_days: dict[int, list[int]] = {}
+        self._release_instants: dict[int, list[float]] = {}
+        self._loaded_at: dict[int, float] = {}
+        self._pending: set[str] = set()
+        if self.path is not None and self.path.exists():
+            self._read(self.path)
+
+    @property
+    def api(self) -> AsyncFredClient:
+        """FRED client used to resolve releases."""
+        return self._api or get_async_fred_client()
+
+    def _set_release_days(
+        self, release_id: int, days: Iterable[int], loaded_at: float
+    ) -> None:
+        ordinals = sorted(set(days))
+        instants = [
+            publication_instant(date.fromordinal(o), hour_utc=self.publish_hour_utc)
+            for o in ordinals
+        ]
+        with self._lock:
+            self._release_days[release_id] = ordinals
+            self._release_instants[release_id] = instants
+            self._loaded_at[release_id] = loaded_at
+
+    def _read(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable release index at %s", path)
+            return
+        for release_id_str, release in data.get("releases", {}).items():
+            release_id = int(release_id_str)
+            self._release_names[release_id] = release.get("name", "")
+            self._set_release_days(
+                release_id,
+                (date.fromisoformat(d).toordinal() for d in release.get("dates", [])),
+                float(release.get("loaded_at", 0.0)),
+            )
+        self._series_release.update(data.get("series", {}))
+
+    def save(self) -> None:
+        """Persist the index to `path` (no-op when the calendar is memory-only)."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                "series": dict(self._series_release),
+                "releases": {
+                    str(rid): {
+                        "name": self._release_names.get(rid, ""),
+                        "loaded_at": self._loaded_at.get(rid, 0.0),
+                        "dates": [date.fromordinal(o).isoformat() for o in days],
+                    }
+                    for rid, days in self._release_days.items()
+                },
+            }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def track(self, series_id: str) -> None:
+        """Ask for `series_id` to be resolved by the background refresher."""
+        if series_id not in self._series_release:
+            with self._lock:
+                self._pending.add(series_id)
+
+    def pending(self) -> list[str]:
+        """Return and clear the series waiting to be resolved."""
+        with self._lock:
+            pending, self._pending = sorted(self._pending), set()
+        return pending
+
+    def seed(
+        self,
+        mapping: dict[str, int | None],
+        *,
+        release_names: dict[int, str] | None = None,
+    ) -> None:
+        """Bulk-load series → release assignments (e.g. from a crawled catalog)."""
+        with self._lock:
+            self._series_release.update(mapping)
+            for release_id, name in (release_names or {}).items():
+                self._release_names.setdefault(release_id, name)
+
+    async def aload_release(self, release_id: int, *, now: float | None = None) -> None:
+        """Fetch (or refetch) every known release date of a release."""
+        records = await self.api.release_dates(
+            release_id,
+            include_release_dates_with_no_data="true",
+            sort_order="asc",
+            limit=10000,
+        )
+        for record in records:
+            if record.get("release_name"):
+                self._release_names[release_id] = record["release_name"]
+                break
+        self._set_release_days(
+            release_id,
+            (
+                date.fromisoformat(r["date"]).toordinal()
+                for r in records
+                if isinstance(r.get("date"), str)
+            ),
+            time.time() if now is None else now,
+        )
+
+    async def aresolve(self, series_id: str) -> int | None:
+        """Resolve the release of a series and load its release dates."""
+        releases = await self.api.series_release(series_id)
+        release_id = int(releases[0]["id"]) if releases else None
+        if release_id is not None:
+            name = releases[0].get("name")
+            if name:
+                self._release_names[release_id] = name
+            if release_id not in self._release_days:
+                await self.aload_release(release_id)
+        with self._lock:
+            self._series_release[series_id] = release_id
+            self._pending.discard(series_id)
+        return release_id
+
+    def resolve(self, series_id: str) -> int | None:
+        """Blocking variant of `aresolve`."""
+        return run_sync(self.aresolve(series_id))
+
+    def ensure_series(self, series_id: str, *, now: float | None = None) -> int | None:
+        """Return the release of a series, hitting FRED only when unknown or stale.
+
+        Unknown series are resolved, and release dates older than
+        `FRED_CALENDAR_REFRESH_SECONDS` are reloaded; otherwise this is a
+        pure in-memory lookup. New information is persisted to `path`.
+        """
+        changed = False
+        if series_id not in self._series_release:
+            self.resolve(series_id)
+            changed = True
+        release_id = self.release_for(series_id)
+        if release_id is not None:
+            now = time.time() if now is None else now
+            loaded_at = self._loaded_at.get(release_id)
+            if loaded_at is None or now - loaded_at >= CALENDAR_REFRESH_SECONDS:
+                run_sync(self.aload_release(release_id, now=now))
+                changed = True
+        if changed:
+            self.save()
+        return release_id
+
+    def release_for(self, series_id: str) -> int | None:
+        """Return the resolved release id of a series, if known."""
+        release_id = self._series_release.get(series_id)
+        return release_id if isinstance(release_id, int) else None
+
+    def release_name(self, release_id: int) -> str | None:
+        """Return the name of a release, if known."""
+        return self._release_names.get(release_id)
+
+    def series_for(self, release_id: int) -> list[str]:
+        """Return the tracked series belonging to a release."""
+        with self._lock:
+            return sorted(
+                sid for sid, rid in self._series_release.items() if rid == release_id
+            )
+
+    def release_dates(self, release_id: int) -> list[date]:
+        """Return every known release date of a release, ascending."""
+        return [date.fromordinal(o) for o in self._release_days.get(release_id, [])]
+
+    def next_release_date(self, release_id: int, *, after: date) -> date | None:
+        """Return the first release date strictly after `after`."""
+        days = self._release_days.get(release_id, [])
+        idx = bisect_right(days, after.toordinal())
+        return date.fromordinal(days[idx]) if idx < len(days) else None
+
+    def previous_release_date(
+        self, release_id: int, *, on_or_before: date
+    ) -> date | None:
+        """Return the latest release date on or before `on_or_before`."""
+        days = self._release_days.get(release_id, [])
+        idx = bisect_right(days, on_or_before.toordinal())
+        return date.fromordinal(days[idx - 1]) if idx else None
+
+    def release_dates_between(
+        self, release_id: int, start: date, end: date
+    ) -> list[date]:
+        """Return release dates in the inclusive range `[start, end]`."""
+        days = self._release_days.get(release_id, [])
+        lo = bisect_left(days, start.toordinal())
+        hi = bisect_right(days, end.toordinal())
+        return [date.fromordinal(o) for o in days[lo:hi]]
+
+    def stale_releases(self, *, now: float | None = None) -> list[int]:
+        """Return releases whose dates were loaded more than a day ago."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return [
+                rid
+                for rid, loaded_at in self._loaded_at.items()
+                if now - loaded_at >= CALENDAR_REFRESH_SECONDS
+            ]
+
+    def last_publication(
+        self, release_id: int, *, now: float | None = None
+    ) -> float | None:
+        """Return the most recent publication instant at or before `now`."""
+        instants = self._release_instants.get(release_id) or []
+        now = time.time() if now is None else now
+        idx = bisect_right(instants, now)
+        return instants[idx - 1] if idx else None
+
+    def publications_between(self, start: float, end: float) -> list[tuple[float, int]]:
+        """Return `(instant, release_id)` pairs with `start < instant <= end`."""
+        with self._lock:
+            items = list(self._release_instants.items())
+        due: list[tuple[float, int]] = []
+        for release_id, instants in items:
+            idx = bisect_right(instants, start)
+            while idx < len(instants) and instants[idx] <= end:
+                due.append((instants[idx], release_id))
+                idx += 1
+        return sorted(due)
+
+    def next_publication(self, *, after: float) -> float | None:
+        """Return the first publication instant of any loaded release after `after`."""
+        with self._lock:
+            items = list(self._release_instants.values())
+        upcoming = [
+            instants[idx]
+            for instants in items
+            if (idx := bisect_right(instants, after)) < len(instants)
+        ]
+        return min(upcoming) if upcoming else None
+
+    def is_current(
+        self,
+        series_id: str,
+        cached_at: float,
+        *,
+        now: float | None = None,
+        last_updated: str | None = None,
+    ) -> bool | None:
+        """Return whether data cached at `cached_at` is still current.
+
+        Returns `None` when the series' release is not known yet, so callers can
+        fall back to their own policy. Shortly after a publication, data whose
+        `last_updated` stamp predates the release day is rechecked every
+        `FRED_RELEASE_RETRY_SECONDS` until FRED posts the new values.
+        """
+        release_id = self._series_release.get(series_id)
+        if not isinstance(release_id, int) or release_id not in self._release_instants:
+            return None
+        now = time.time() if now is None else now
+        last = self.last_publication(release_id, now=now)
+        if last is None:
+            return True
+        if cached_at < last:
+            return False
+        if (
+            last_updated is not None
+            and now - last < RELEASE_WINDOW_SECONDS
+            and last_updated[:10] < _day_of(last)
+            and now - cached_at >= RELEASE_RETRY_SECONDS
+        ):
+            return False
+        return True
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    series_ids: tuple[str, ...]
+    stored_at: float
+    loader: Callable[[], Any] | None = None
+
+
+class ReleaseAwareCache:
+    """LRU cache whose entries expire when any tagged series gets a new release."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        calendar: ReleaseCalendar | None = None,
+        max_entries: int = 512,
+    ) -> None:
+        """Create the cache and register it for release invalidation."""
+        self.name = name
+        self.calendar = calendar
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def _calendar(self) -> ReleaseCalendar:
+        return self.calendar or get_release_calendar()
+
+    def get(self, key: Hashable, *, now: float | None = None) -> Any | None:
+        """Return the cached value for `key` if it is still current."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        now = time.time() if now is None else now
+        calendar = self._calendar()
+        for series_id in entry.series_ids:
+            current = calendar.is_current(series_id, entry.stored_at, now=now)
+            if current is None:
+                current = now - entry.stored_at < UNTRACKED_MAX_AGE_SECONDS
+            if not current:
+                with self._lock:
+                    self._entries.pop(key, None)
+                return None
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        series_ids: Iterable[str],
+        *,
+        loader: Callable[[], Any] | None = None,
+        now: float | None = None,
+    ) -> None:
+        """Store `value`; `loader` recomputes it when a tagged release publishes."""
+        tags = tuple(dict.fromkeys(series_ids))
+        calendar = self._calendar()
+        for series_id in tags:
+            calendar.track(series_id)
+        entry = _CacheEntry(
+            value=value,
+            series_ids=tags,
+            stored_at=time.time() if now is None else now,
+            loader=loader,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_series(self, series_id: str) -> list[Callable[[], Any]]:
+        """Drop entries tagged with `series_id` and return their re-warm loaders."""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if series_id in e.series_ids]
+            entries = [self._entries.pop(k) for k in keys]
+        return [e.loader for e in entries if e.loader is not None]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+
+_caches: list[ReleaseAwareCache] = []
+_invalidation_hooks: list[Callable[[str], None]] = []
+
+
+def register_invalidation_hook(hook: Callable[[str], None]) -> None:
+    """Call `hook(series_id)` whenever a series is invalidated by a release."""
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_series(series_id: str) -> list[Callable[[], Any]]:
+    """Invalidate a series everywhere and return loaders that re-warm dropped entries."""
+    for hook in _invalidation_hooks:
+        hook(series_id)
+    loaders: list[Callable[[], Any]] = []
+    for cache in list(_caches):
+        loaders.extend(cache.invalidate_series(series_id))
+    return loaders
+
+
+@dataclass
+class _PendingRefresh:
+    release_id: int
+    published_at: float
+    next_attempt: float
+    loaders: list[Callable[[], Any]] = field(default_factory=list)
+
+
+class ReleaseRefresher(threading.Thread):
+    """Background thread that invalidates and re-warms caches at each release.
+
+    `rewarm(series_id, published_at)` should refresh the series and return
+    `True` once the stored data reflects the release (its `last_updated` is on
+    or after the release day); otherwise it is retried every
+    `FRED_RELEASE_RETRY_SECONDS` while within `FRED_RELEASE_WINDOW_SECONDS`.
+
+    The calendar also maps series that were only seeded (from a crawled
+    catalog or a release table) so their cache entries can be invalidated.
+    When `should_rewarm` is given, series it rejects are invalidated at
+    publication but never passed to `rewarm`, so a release with hundreds of
+    mapped series only re-fetches the ones actually held locally.
+    """
+
+    def __init__(
+        self,
+        calendar: ReleaseCalendar,
+        rewarm: Callable[[str, float], bool],
+        *,
+        poll_seconds: float = 300.0,
+        should_rewarm: Callable[[str], bool] | None = None,
+    ) -> None:
+        """Create a daemon refresher; call `start()` to run it."""
+        super().__init__(name="fred-release-refresher", daemon=True)
+        self.calendar = calendar
+        self.rewarm = rewarm
+        self.should_rewarm = should_rewarm
+        self.poll_seconds = poll_seconds
+        self._stop_event = threading.Event()
+        self._last_tick = time.time()
+        self._retries: dict[str, _PendingRefresh] = {}
+
+    def stop(self) -> None:
+        """Ask the thread to exit after the current tick."""
+        self._stop_event.set()
+
+    def run(self) -> None:
+        """Tick until stopped, sleeping until the next publication or retry.
+
+        FRED requests made by the refresher run at `Priority.BACKGROUND`.
+        """
+        with request_priority(Priority.BACKGROUND):
+            while not self._stop_event.is_set():
+                try:
+                    wait = self.tick()
+                except Exception:  # noqa: BLE001
+                    logger.exception("Release refresher tick failed")
+                    wait = self.poll_seconds
+                self._stop_event.wait(wait)
+
+    def tick(self, *, now: float | None = None) -> float:
+        """Process due releases and return the number of seconds to sleep."""
+        now = time.time() if now is None else now
+        pending = self.calendar.pending()
+        stale = self.calendar.stale_releases(now=now)
+        for series_id in pending:
+            try:
+                self.calendar.resolve(series_id)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to resolve release for %s", series_id)
+                # Retry on the next tick instead of dropping it.
+                self.calendar.track(series_id)
+        for release_id in stale:
+            try:
+                run_sync(self.calendar.aload_release(release_id, now=now))
+            except Exception:  # noqa: BLE001
+                # Still stale, so the next tick retries it.
+                logger.exception("Failed to refresh release %s", release_id)
+        if pending or stale:
+            self.calendar.save()
+
+        for published_at, release_id in self.calendar.publications_between(
+            self._last_tick, now
+        ):
+            for series_id in self.calendar.series_for(release_id):
+                if self.should_rewarm is not None and not self.should_rewarm(series_id):
+                    # Mapped only: drop tagged entries, nothing to re-fetch.
+                    invalidate_series(series_id)
+                    continue
+                self._retries[series_id] = _PendingRefresh(
+                    release_id=release_id, published_at=published_at, next_attempt=now
+                )
+        self._last_tick = now
+
+        for series_id, pending in list(self._retries.items()):
+            if pending.next_attempt > now:
+                continue
+            # Invalidate on every attempt so entries refilled by user traffic
+            # before FRED posted the new values are not kept until next release.
+            pending.loaders.extend(invalidate_series(series_id))
+            try:
+                done = self.rewarm(series_id, pending.published_at)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to refresh %s after release", series_id)
+                done = False
+            if done:
+                for loader in pending.loaders:
+                    try:
+                        loader()
+                    except Exception:  # noqa: BLE001
+                        logger.exception(
+                            "Failed to re-warm cache entry for %s", series_id
+                        )
+            if done or now - pending.published_at >= RELEASE_WINDOW_SECONDS:
+                del self._retries[series_id]
+            else:
+                pending.next_attempt = now + RELEASE_RETRY_SECONDS
+
+        wake_times = [now + self.poll_seconds]
+        next_publication = self.calendar.next_publication(after=now)
+        if next_publication is not None:
+            wake_times.append(next_publication)
+        wake_times.extend(p.next_attempt for p in self._retries.values())
+        return max(0.0, min(wake_times) - now)
+
+
+@lru_cache(maxsize=1)
+def get_release_calendar() -> ReleaseCalendar:
+    """Return the process-wide release calendar, persisted in the cache directory."""
+    return ReleaseCalendar(path=cache_path("fred_release_index.json"))
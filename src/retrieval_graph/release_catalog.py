@@ -0,0 +1,200 @@
+"""In-memory catalog of FRED releases with name matching.
+
+`fetch_release_structure_by_name` used to download `/fred/releases` and scan
+it on every call. The catalog pages the full listing in once (concurrently,
+however many pages there are), keeps it in memory and refreshes it in the
+background once it is older than `FRED_RELEASE_CATALOG_REFRESH_SECONDS`.
+
+Names are matched on a compact normalized form (lowercase, alphanumerics
+only), so "H.4.1", "h41" and "H.41" all resolve to
+"H.4.1 Factors Affecting Reserve Balances". Candidates are ranked as exact
+match > prefix match > word-prefix match > substring match > fuzzy match.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any
+
+from retrieval_graph.fred_api import AsyncFredClient, get_async_fred_client, run_sync
+from retrieval_graph.rate_limiter import Priority, request_priority
+
+logger = logging.getLogger(__name__)
+
+CATALOG_REFRESH_SECONDS = float(
+    os.getenv("FRED_RELEASE_CATALOG_REFRESH_SECONDS", "86400")
+)
+RELEASES_PAGE_SIZE = 1000
+FUZZY_THRESHOLD = 0.6
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_release_name(name: str) -> str:
+    """Return the compact matching key for a release name (e.g. "H.4.1" -> "h41")."""
+    return _NON_ALNUM.sub("", name.lower())
+
+
+def _words(name: str) -> list[str]:
+    return [
+        normalize_release_name(w) for w in name.split() if normalize_release_name(w)
+    ]
+
+
+@dataclass(frozen=True)
+class ReleaseMatch:
+    """A catalog entry scored against a query."""
+
+    score: float
+    release: dict[str, Any]
+
+
+class ReleaseCatalog:
+    """Cached, periodically refreshed index of every FRED release."""
+
+    def __init__(
+        self,
+        api: AsyncFredClient | None = None,
+        *,
+        refresh_seconds: float = CATALOG_REFRESH_SECONDS,
+        page_size: int = RELEASES_PAGE_SIZE,
+    ) -> None:
+        """Create an empty catalog; it is populated on first lookup."""
+        self._api = api
+        self.refresh_seconds = refresh_seconds
+        self.page_size = page_size
+        self._releases: list[dict[str, Any]] = []
+        self._keys: list[str] = []
+        self._words: list[list[str]] = []
+        self._by_key: dict[str, list[int]] = {}
+        self._by_id: dict[int, dict[str, Any]] = {}
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def api(self) -> AsyncFredClient:
+        """FRED client used to page the releases listing."""
+        return self._api or get_async_fred_client()
+
+    async def afetch_all(self) -> list[dict[str, Any]]:
+        """Page through `/fred/releases`, fetching pages after the first concurrently."""
+        first = await self.api.releases(limit=self.page_size, offset=0)
+        releases = list(first.get("releases", []))
+        count = int(first.get("count", len(releases)))
+        offsets = range(self.page_size, count, self.page_size)
+        pages = await asyncio.gather(
+            *(self.api.releases(limit=self.page_size, offset=o) for o in offsets)
+        )
+        for page in pages:
+            releases.extend(page.get("releases", []))
+        return releases
+
+    def load(self, releases: list[dict[str, Any]], *, now: float | None = None) -> None:
+        """Replace the catalog contents and rebuild the name index."""
+        keys = [normalize_release_name(r.get("name", "")) for r in releases]
+        words = [_words(r.get("name", "")) for r in releases]
+        by_key: dict[str, list[int]] = {}
+        for idx, key in enumerate(keys):
+            by_key.setdefault(key, []).append(idx)
+        by_id = {int(r["id"]): r for r in releases if "id" in r}
+        with self._lock:
+            self._releases, self._keys, self._by_key = releases, keys, by_key
+            self._words = words
+            self._by_id = by_id
+            self._loaded_at = time.time() if now is None else now
+
+    def refresh(self) -> None:
+        """Reload the catalog from FRED (blocking)."""
+        self.load(run_sync(self.afetch_all()))
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _run() -> None:
+            try:
+                with request_priority(Priority.BACKGROUND):
+                    self.refresh()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to refresh FRED release catalog")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=_run, name="fred-release-catalog", daemon=True).start()
+
+    def ensure_loaded(self, *, now: float | None = None) -> None:
+        """Load the catalog if empty; schedule a background refresh if it is stale."""
+        if self._loaded_at is None:
+            self.refresh()
+            return
+        now = time.time() if now is None else now
+        if now - self._loaded_at >= self.refresh_seconds:
+            self._refresh_in_background()
+
+    def __len__(self) -> int:
+        """Return the number of releases in the catalog."""
+        return len(self._releases)
+
+    def get(self, release_id: int) -> dict[str, Any] | None:
+        """Return a release record by id."""
+        return self._by_id.get(release_id)
+
+    def search(self, query: str, *, limit: int = 5) -> list[ReleaseMatch]:
+        """Return the best-ranked releases for a name query (no network access)."""
+        key = normalize_release_name(query)
+        if not key:
+            return []
+        with self._lock:
+            releases, keys, by_key = self._releases, self._keys, self._by_key
+            words = self._words
+
+        scores: dict[int, float] = {idx: 1.0 for idx in by_key.get(key, [])}
+        query_words = _words(query)
+        for idx, candidate in enumerate(keys):
+            if idx in scores or not candidate:
+                continue
+            # Shorter names win ties so "H.4.1" prefers the base release.
+            brevity = len(key) / len(candidate) * 0.05
+            if candidate.startswith(key):
+                scores[idx] = 0.9 + brevity
+            elif query_words and _has_word_prefix(words[idx], query_words):
+                scores[idx] = 0.8 + brevity
+            elif key in candidate:
+                scores[idx] = 0.7 + brevity
+            else:
+                ratio = SequenceMatcher(None, key, candidate[: len(key) + 4]).ratio()
+                if ratio >= FUZZY_THRESHOLD:
+                    scores[idx] = 0.6 * ratio
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [ReleaseMatch(score=s, release=releases[i]) for i, s in ranked[:limit]]
+
+    def best_match(self, query: str) -> dict[str, Any] | None:
+        """Return the top-ranked release for `query`, if any."""
+        matches = self.search(query, limit=1)
+        return matches[0].release if matches else None
+
+
+def _has_word_prefix(words: list[str], query_words: list[str]) -> bool:
+    """Return whether `query_words` appear as consecutive word prefixes in `words`."""
+    for start in range(len(words) - len(query_words) + 1):
+        if all(words[start + i].startswith(q) for i, q in enumerate(query_words)):
+            return True
+    return False
+
+
+@lru_cache(maxsize=1)
+def get_release_catalog() -> ReleaseCatalog:
+    """Return the process-wide release catalog."""
+    return ReleaseCatalog()
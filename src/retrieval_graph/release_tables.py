@@ -0,0 +1,225 @@
+"""Release table trees with paged, depth-limited outline rendering.
+
+`/fred/release/tables` describes a release as a tree of elements (sections,
+groups and series lines). Large releases such as H.4.1 have hundreds of
+elements, far too many to hand the model at once. `ReleaseTableTree` keeps
+the parsed tree, and `outline()` renders only one page of children under an
+element, down to a fixed depth:
+
+    12886 Personal consumption expenditures
+      12887 Goods +3
+      12888 Services [DSERRL1A225NBEA]
+
+Each line is `<element_id> <name>`, followed by `[series_id]` for series
+lines and `+N` when the element has `N` children that were not expanded
+(`+?` when they have not been fetched yet). The model drills down by asking
+for an `element_id` it saw in the outline.
+
+FRED may return children nested under their parent or only one level at a
+time. `unexpanded()` lists the elements whose children are still unknown
+within the requested depth, so callers fetch just those subtrees
+(`release/tables?element_id=...`) and `merge` them in.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterable
+
+DEFAULT_DEPTH = 2
+DEFAULT_PAGE_SIZE = 40
+
+
+@dataclass
+class TableNode:
+    """One element of a release table."""
+
+    element_id: int
+    name: str
+    type: str = ""
+    series_id: str | None = None
+    parent_id: int | None = None
+    line: int = 0
+    children: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class OutlinePage:
+    """A rendered slice of the tree."""
+
+    element_id: int | None
+    depth: int
+    offset: int
+    total: int
+    next_offset: int | None
+    outline: str
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class ReleaseTableTree:
+    """Parsed `release/tables` elements for one release."""
+
+    def __init__(self, release_id: int) -> None:
+        """Create an empty tree; populate it with `merge`."""
+        self.release_id = release_id
+        self.name: str | None = None
+        self.nodes: dict[int, TableNode] = {}
+        self._roots: list[int] = []
+        # Elements (and the root, as `None`) whose children are known.
+        self._expanded: set[int | None] = set()
+
+    def __len__(self) -> int:
+        """Return the number of known elements."""
+        return len(self.nodes)
+
+    def copy(self) -> ReleaseTableTree:
+        """Return an independent copy, so a shared tree can be extended safely."""
+        clone = ReleaseTableTree(self.release_id)
+        clone.name = self.name
+        clone.nodes = {
+            i: replace(n, children=list(n.children)) for i, n in self.nodes.items()
+        }
+        clone._roots = list(self._roots)
+        clone._expanded = set(self._expanded)
+        return clone
+
+    def merge(self, payload: dict[str, Any], *, element_id: int | None = None) -> None:
+        """Add the elements of a `release/tables` response.
+
+        Args:
+            payload (dict[str, Any]): Response body.
+            element_id (int | None): The `element_id` the request asked for
+                (`None` for the release root); its children are now known.
+        """
+        if element_id is None:
+            self.name = payload.get("name") or self.name
+        elif not self._node(element_id).name:
+            self._node(element_id).name = str(payload.get("name") or "")
+        elements = payload.get("elements") or {}
+        values = elements.values() if isinstance(elements, dict) else elements
+        for element in values:
+            self._add(element, default_parent=element_id)
+        self._expanded.add(element_id)
+
+    def _add(self, element: dict[str, Any], *, default_parent: int | None) -> None:
+        element_id = _as_int(element.get("element_id"), -1)
+        if element_id < 0:
+            return
+        parent_raw = element.get("parent_id")
+        parent_id = default_parent if parent_raw is None else _as_int(parent_raw)
+        if parent_id == element_id:
+            parent_id = None
+        node = self.nodes.get(element_id)
+        if node is None:
+            node = self.nodes[element_id] = TableNode(element_id, "")
+        node.name = str(element.get("name") or node.name)
+        node.type = str(element.get("type") or node.type)
+        node.series_id = element.get("series_id") or node.series_id
+        node.parent_id = parent_id
+        node.line = _as_int(element.get("line"), node.line)
+        siblings = self._roots if parent_id is None else self._node(parent_id).children
+        if element_id not in siblings:
+            siblings.append(element_id)
+        children = element.get("children") or []
+        for child in children:
+            self._add(child, default_parent=element_id)
+        if children or node.type == "series":
+            self._expanded.add(element_id)
+
+    def _node(self, element_id: int) -> TableNode:
+        # Placeholders (a drilled-into element or a parent not seen yet) are
+        # attached to their own parent once its listing arrives, not to the roots.
+        node = self.nodes.get(element_id)
+        if node is None:
+            node = self.nodes[element_id] = TableNode(element_id, "")
+        return node
+
+    def children(self, element_id: int | None) -> list[TableNode]:
+        """Return the children of an element (or the roots), in table order."""
+        ids = self._roots if element_id is None else self.nodes[element_id].children
+        nodes = [self.nodes[i] for i in ids if i in self.nodes]
+        if element_id is None:
+            nodes = [n for n in nodes if n.parent_id is None]
+        return sorted(nodes, key=lambda n: (n.line, n.element_id))
+
+    def is_expanded(self, element_id: int | None) -> bool:
+        """Whether the children of an element are known."""
+        return element_id in self._expanded
+
+    def unexpanded(
+        self,
+        element_id: int | None = None,
+        *,
+        depth: int = DEFAULT_DEPTH,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list[int | None]:
+        """Return elements whose children must be fetched to render a page."""
+        if not self.is_expanded(element_id):
+            return [element_id]
+        missing: list[int | None] = []
+        frontier = self.children(element_id)[offset : offset + limit]
+        for _ in range(depth - 1):
+            missing.extend(
+                n.element_id for n in frontier if not self.is_expanded(n.element_id)
+            )
+            frontier = [c for n in frontier for c in self.children(n.element_id)]
+        return missing
+
+    def outline(
+        self,
+        element_id: int | None = None,
+        *,
+        depth: int = DEFAULT_DEPTH,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> OutlinePage:
+        """Render `limit` children of `element_id` (from `offset`) to `depth` levels.
+
+        Raises:
+            KeyError: If `element_id` is not part of this release's tables.
+        """
+        if element_id is not None and element_id not in self.nodes:
+            raise KeyError(element_id)
+        depth = max(1, depth)
+        siblings = self.children(element_id)
+        page = siblings[offset : offset + limit]
+        lines: list[str] = []
+        self._render(page, depth, 0, lines)
+        end = offset + len(page)
+        return OutlinePage(
+            element_id=element_id,
+            depth=depth,
+            offset=offset,
+            total=len(siblings),
+            next_offset=end if end < len(siblings) else None,
+            outline="\n".join(lines),
+        )
+
+    def _render(
+        self, nodes: Iterable[TableNode], depth: int, level: int, lines: list[str]
+    ) -> None:
+        for node in nodes:
+            text = f"{'  ' * level}{node.element_id} {node.name}"
+            if node.series_id:
+                text += f" [{node.series_id}]"
+            children = self.children(node.element_id)
+            if level + 1 < depth and children:
+                lines.append(text)
+                self._render(children, depth, level + 1, lines)
+                continue
+            if children:
+                text += f" +{len(children)}"
+            elif not self.is_expanded(node.element_id):
+                text += " +?"
+            lines.append(text)
+
+    def series_ids(self) -> list[str]:
+        """Return every series referenced by the tree."""
+        return [n.series_id for n in self.nodes.values() if n.series_id]
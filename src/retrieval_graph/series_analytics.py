@@ -0,0 +1,330 @@
+"""Vectorized transforms over FRED observation histories.
+
+These helpers let the `fred_series_analytics` tool answer the common
+"how much did X change" questions with exact numbers computed server-side,
+instead of handing the model a dozen raw points to do arithmetic on.
+
+Every transform takes ISO `dates` and a float array of `values` (ascending by
+date) and is computed with NumPy over the full history. Calendar-based
+changes (`yoy`, `mom`) look up the observation one year / one month earlier
+by date rather than by position, so they work for any frequency and skip
+gaps correctly.
+
+`downsample_indices` picks a shape-preserving subset of a long history (LTTB
+or per-bucket min/max) so date-range queries fit a fixed point budget.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date
+from typing import Any, Sequence
+
+import numpy as np
+
+TRANSFORMS = (
+    "pct_change",
+    "yoy",
+    "mom",
+    "rolling_mean",
+    "zscore",
+    "peaks_troughs",
+    "drawdown",
+    "annualized",
+)
+DEFAULT_TRANSFORMS = ("yoy", "mom", "rolling_mean", "zscore", "peaks_troughs")
+
+_PERIODS_PER_YEAR = {
+    "daily": 252,
+    "weekly": 52,
+    "biweekly": 26,
+    "monthly": 12,
+    "quarterly": 4,
+    "semiannual": 2,
+    "annual": 1,
+}
+
+
+def periods_per_year(frequency: str) -> int:
+    """Return observations per year for a FRED frequency label (e.g. "Monthly")."""
+    label = frequency.lower().replace("-", "").replace(" ", "")
+    for key, periods in _PERIODS_PER_YEAR.items():
+        if label.startswith(key):
+            return periods
+    return 12
+
+
+def _shift_months(day: date, months: int) -> date:
+    """Return `day` moved by `months`, clamping to the end of shorter months."""
+    year, month = divmod(day.year * 12 + day.month - 1 + months, 12)
+    last_day = calendar.monthrange(year, month + 1)[1]
+    return date(year, month + 1, min(day.day, last_day))
+
+
+def pct_change(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Return the percent change versus `periods` observations earlier."""
+    result = np.full(values.shape, np.nan)
+    if periods < len(values):
+        prior = values[:-periods]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[periods:] = (values[periods:] / prior - 1.0) * 100.0
+        result[periods:][prior == 0] = np.nan
+    return result
+
+
+def calendar_change(
+    dates: Sequence[str], values: np.ndarray, *, months: int, tolerance_days: int
+) -> np.ndarray:
+    """Return the percent change versus the observation `months` earlier by date.
+
+    The comparison point is the latest observation on or before the target
+    date, and only if it lies within `tolerance_days` of it.
+    """
+    days = [date.fromisoformat(d) for d in dates]
+    ordinals = np.fromiter((d.toordinal() for d in days), dtype=np.int64)
+    targets = np.fromiter(
+        (_shift_months(d, -months).toordinal() for d in days), dtype=np.int64
+    )
+    idx = np.searchsorted(ordinals, targets, side="right") - 1
+    valid = (idx >= 0) & (targets - ordinals[np.clip(idx, 0, None)] <= tolerance_days)
+    prior = np.where(valid, values[np.clip(idx, 0, None)], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = (values / prior - 1.0) * 100.0
+    result[prior == 0] = np.nan
+    return result
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Return the trailing `window`-observation mean (NaN until the window fills)."""
+    result = np.full(values.shape, np.nan)
+    if 0 < window <= len(values):
+        sums = np.cumsum(np.insert(values, 0, 0.0))
+        result[window - 1 :] = (sums[window:] - sums[:-window]) / window
+    return result
+
+
+def zscore(values: np.ndarray, window: int | None = None) -> float | None:
+    """Return the z-score of the latest value within the trailing `window` (or all)."""
+    sample = values[-window:] if window else values
+    if len(sample) < 2:
+        return None
+    std = float(np.std(sample, ddof=1))
+    if std == 0:
+        return None
+    return (float(sample[-1]) - float(np.mean(sample))) / std
+
+
+def annualized_rate(
+    values: np.ndarray, *, periods: int, periods_per_year: int
+) -> np.ndarray:
+    """Return the compound annualized percent change over `periods` observations."""
+    result = np.full(values.shape, np.nan)
+    if periods < len(values):
+        prior = values[:-periods]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = values[periods:] / prior
+            result[periods:] = (
+                np.power(ratio, periods_per_year / periods) - 1.0
+            ) * 100.0
+        result[periods:][(prior <= 0) | (ratio <= 0)] = np.nan
+    return result
+
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Return indices chosen by Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of `threshold - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the next bucket's average, which preserves the
+    visual shape (including peaks and troughs) of the series. Thresholds
+    below 3 keep only the endpoints.
+    """
+    n = len(x)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1], dtype=np.int64)
+    buckets = np.array_split(np.arange(1, n - 1), threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for i, bucket in enumerate(buckets):
+        following = buckets[i + 1] if i + 1 < len(buckets) else np.array([n - 1])
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[bucket] - y[anchor])
+            - (x[anchor] - x[bucket]) * (avg_y - y[anchor])
+        )
+        anchor = int(bucket[np.argmax(area)])
+        selected[i + 1] = anchor
+    return selected
+
+
+def minmax_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """Return indices of each bucket's minimum and maximum (at most `threshold`).
+
+    Thresholds below 4 (too few for one bucket's extremes plus the endpoints)
+    keep only the endpoints.
+    """
+    n = len(y)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 4:
+        return np.array([0, n - 1], dtype=np.int64)
+    picks = {0, n - 1}
+    for bucket in np.array_split(np.arange(n), max((threshold - 2) // 2, 1)):
+        picks.add(int(bucket[np.argmin(y[bucket])]))
+        picks.add(int(bucket[np.argmax(y[bucket])]))
+    return np.array(sorted(picks), dtype=np.int64)
+
+
+def downsample_indices(
+    x: Sequence[float], y: Sequence[float], max_points: int, *, method: str = "lttb"
+) -> np.ndarray:
+    """Return sorted indices of at most `max_points` shape-preserving samples.
+
+    Raises:
+        ValueError: If `method` is not one of `DOWNSAMPLE_METHODS`.
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    if method == "lttb":
+        return lttb_indices(xs, ys, max_points)
+    if method == "minmax":
+        return minmax_indices(ys, max_points)
+    raise ValueError(
+        f"Unknown downsampling method '{method}'. "
+        f"Choose from: {', '.join(DOWNSAMPLE_METHODS)}."
+    )
+
+
+def _point(dates: Sequence[str], values: np.ndarray, index: int) -> dict[str, Any]:
+    return {"date": dates[index], "value": _round(values[index])}
+
+
+def _round(value: float) -> float | None:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def _tail(dates: Sequence[str], series: np.ndarray, points: int) -> dict[str, Any]:
+    """Summarize a derived series as its latest value plus a short trailing tail."""
+    finite = np.flatnonzero(~np.isnan(series))
+    if not len(finite):
+        return {"latest": None, "recent": [], "recent_dates": []}
+    recent = finite[-points:]
+    return {
+        "latest": _point(dates, series, int(finite[-1])),
+        "recent": [_round(series[i]) for i in recent],
+        "recent_dates": [dates[i] for i in recent],
+    }
+
+
+def analyze(
+    dates: Sequence[str],
+    values: Sequence[float],
+    *,
+    frequency: str = "",
+    transforms: Sequence[str] = DEFAULT_TRANSFORMS,
+    window: int | None = None,
+    points: int = 6,
+) -> dict[str, Any]:
+    """Compute the requested transforms and return a compact summary.
+
+    Args:
+        dates (Sequence[str]): ISO observation dates, ascending.
+        values (Sequence[float]): Observation values aligned with `dates`.
+        frequency (str): FRED frequency label, used for rolling/annualized defaults.
+        transforms (Sequence[str]): Names from `TRANSFORMS`.
+        window (int | None): Rolling/z-score window; defaults to one year of observations.
+        points (int): Length of the trailing tail returned for derived series.
+
+    Raises:
+        ValueError: If a transform name is unknown.
+    """
+    unknown = [t for t in transforms if t not in TRANSFORMS]
+    if unknown:
+        raise ValueError(
+            f"Unknown transform(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(TRANSFORMS)}."
+        )
+    array = np.asarray(values, dtype=np.float64)
+    per_year = periods_per_year(frequency)
+    window = window or per_year
+    summary: dict[str, Any] = {
+        "observations": len(array),
+        "start": dates[0] if dates else None,
+        "end": dates[-1] if dates else None,
+        "latest": _point(dates, array, -1) if len(array) else None,
+    }
+    if not len(array):
+        return summary
+
+    for name in transforms:
+        if name == "pct_change":
+            summary[name] = _tail(dates, pct_change(array), points)
+        elif name == "yoy":
+            summary[name] = _tail(
+                dates,
+                calendar_change(dates, array, months=12, tolerance_days=7),
+                points,
+            )
+        elif name == "mom":
+            summary[name] = _tail(
+                dates,
+                calendar_change(dates, array, months=1, tolerance_days=3),
+                points,
+            )
+        elif name == "rolling_mean":
+            summary[name] = {
+                "window": window,
+                **_tail(dates, rolling_mean(array, window), points),
+            }
+        elif name == "zscore":
+            summary[name] = {
+                "window": window,
+                "latest": _round_or_none(zscore(array, window)),
+                "full_history": _round_or_none(zscore(array)),
+            }
+        elif name == "peaks_troughs":
+            recent = array[-window:]
+            offset = len(array) - len(recent)
+            summary[name] = {
+                "max": _point(dates, array, int(np.argmax(array))),
+                "min": _point(dates, array, int(np.argmin(array))),
+                "window_max": _point(dates, array, offset + int(np.argmax(recent))),
+                "window_min": _point(dates, array, offset + int(np.argmin(recent))),
+            }
+        elif name == "drawdown":
+            running_max = np.maximum.accumulate(array)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drawdowns = np.where(
+                    running_max > 0, (array / running_max - 1.0) * 100.0, np.nan
+                )
+            if np.all(np.isnan(drawdowns)):
+                summary[name] = None
+                continue
+            trough = int(np.nanargmin(drawdowns))
+            peak = int(np.argmax(array[: trough + 1]))
+            summary[name] = {
+                "current_pct": _round(drawdowns[-1]),
+                "max_pct": _round(drawdowns[trough]),
+                "peak": _point(dates, array, peak),
+                "trough": _point(dates, array, trough),
+            }
+        elif name == "annualized":
+            summary[name] = {
+                "periods_per_year": per_year,
+                "one_period": _tail(
+                    dates,
+                    annualized_rate(array, periods=1, periods_per_year=per_year),
+                    points,
+                ),
+            }
+    return summary
+
+
+def _round_or_none(value: float | None) -> float | None:
+    return None if value is None else round(value, 4)
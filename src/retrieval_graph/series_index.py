@@ -0,0 +1,274 @@
+"""In-process BM25 index over FRED series metadata.
+
+`search_series` used to call `/fred/series/search` for every query, and the
+model tends to rephrase the same search several times. This module builds an
+inverted index from the series metadata CSV (the same file
+`scripts/index_opensearch.py` ingests) and answers queries locally in a few
+milliseconds; `fred_tool.search_series` only goes to FRED when the index has
+no good hit.
+
+Documents are scored with Okapi BM25 over title, units, frequency,
+seasonality, notes/period description and series ID tokens. Fields are
+weighted by repeating their tokens (ID x3, title x2), and a query token that
+equals a series ID ranks that series first.
+
+The index is persisted as a compressed NumPy archive (term list, CSR-style
+postings, document lengths and a small metadata table), so it loads without
+re-tokenizing the catalog. Build it with `scripts/build_series_index.py`
+(from a CSV or a `catalog_crawler` catalog) or let `get_series_index()` build
+it from `FRED_SERIES_CSV` on first use.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from retrieval_graph.catalog_crawler import iter_catalog_rows
+from retrieval_graph.utils import cache_path
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFAULT_MIN_SCORE = float(os.getenv("FRED_SERIES_INDEX_MIN_SCORE", "1.0"))
+ID_MATCH_BONUS = 1000.0
+
+# Metadata kept per document and returned with each hit.
+DOC_FIELDS = ("id", "title", "frequency", "units", "seasonal_adjustment")
+# (CSV column, weight) pairs that contribute tokens.
+_WEIGHTED_FIELDS = (
+    ("series_id", 3),
+    ("title", 2),
+    ("units", 1),
+    ("units_short", 1),
+    ("frequency", 1),
+    ("frequency_short", 1),
+    ("season", 1),
+    ("notes", 1),
+    ("period_description", 1),
+)
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase `text` and split it into alphanumeric tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def _document_tokens(row: dict[str, str]) -> list[str]:
+    tokens: list[str] = []
+    for field_name, weight in _WEIGHTED_FIELDS:
+        tokens.extend(tokenize(row.get(field_name) or "") * weight)
+    return tokens
+
+
+def _doc_record(row: dict[str, str]) -> list[str]:
+    return [
+        (row.get("series_id") or "").strip(),
+        (row.get("title") or "").strip(),
+        (row.get("frequency") or "").strip(),
+        (row.get("units") or "").strip(),
+        (row.get("season") or "").strip(),
+    ]
+
+
+@dataclass(frozen=True)
+class SeriesHit:
+    """A scored search result."""
+
+    score: float
+    series: dict[str, Any]
+
+
+class SeriesIndex:
+    """Immutable BM25 inverted index over series metadata."""
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        offsets: np.ndarray,
+        doc_ids: np.ndarray,
+        term_freqs: np.ndarray,
+        doc_lengths: np.ndarray,
+        docs: Sequence[Sequence[str]],
+    ) -> None:
+        """Wrap prebuilt postings; use `build` or `load` to create an index.
+
+        Args:
+            terms (Sequence[str]): Vocabulary; term `i` owns postings
+                `offsets[i]:offsets[i + 1]`.
+            offsets (np.ndarray): CSR row pointers into `doc_ids`/`term_freqs`.
+            doc_ids (np.ndarray): Posting document numbers.
+            term_freqs (np.ndarray): Weighted term frequency per posting.
+            doc_lengths (np.ndarray): Weighted token count per document.
+            docs (Sequence[Sequence[str]]): Per-document values for `DOC_FIELDS`.
+        """
+        self.terms = list(terms)
+        self._term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.docs = [list(d) for d in docs]
+        self._by_series_id = {doc[0].lower(): i for i, doc in enumerate(self.docs)}
+        self._avg_length = float(doc_lengths.mean()) if len(doc_lengths) else 0.0
+        document_freqs = np.diff(offsets).astype(np.float64)
+        n = len(self.docs)
+        self._idf = np.log(1.0 + (n - document_freqs + 0.5) / (document_freqs + 0.5))
+
+    def __len__(self) -> int:
+        """Return the number of indexed series."""
+        return len(self.docs)
+
+    @classmethod
+    def build(cls, rows: Iterable[dict[str, str]]) -> SeriesIndex:
+        """Tokenize metadata rows (CSV `DictReader` records) into an index."""
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_lengths: list[int] = []
+        docs: list[list[str]] = []
+        for row in rows:
+            record = _doc_record(row)
+            if not record[0]:
+                continue
+            doc = len(docs)
+            docs.append(record)
+            tokens = _document_tokens(row)
+            doc_lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc, count))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings[t]) for t in terms])
+        doc_ids = np.empty(int(offsets[-1]), dtype=np.int32)
+        term_freqs = np.empty(int(offsets[-1]), dtype=np.uint16)
+        for i, term in enumerate(terms):
+            start, end = offsets[i], offsets[i + 1]
+            entries = postings[term]
+            doc_ids[start:end] = [d for d, _ in entries]
+            term_freqs[start:end] = [min(c, 65535) for _, c in entries]
+        return cls(
+            terms,
+            offsets,
+            doc_ids,
+            term_freqs,
+            np.asarray(doc_lengths, dtype=np.int32),
+            docs,
+        )
+
+    @classmethod
+    def from_csv(cls, path: str | os.PathLike[str]) -> SeriesIndex:
+        """Build an index from a series metadata CSV."""
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            return cls.build(csv.DictReader(handle))
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str]) -> SeriesIndex:
+        """Build an index from a metadata CSV or a crawled `catalog.json.gz`."""
+        if str(path).endswith(".json.gz"):
+            return cls.build(iter_catalog_rows(path))
+        return cls.from_csv(path)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index to a compressed `.npz` archive."""
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp.npz")
+        np.savez_compressed(
+            tmp,
+            terms=np.frombuffer(json.dumps(self.terms).encode(), dtype=np.uint8),
+            docs=np.frombuffer(json.dumps(self.docs).encode(), dtype=np.uint8),
+            offsets=self.offsets,
+            doc_ids=self.doc_ids,
+            term_freqs=self.term_freqs,
+            doc_lengths=self.doc_lengths,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> SeriesIndex:
+        """Load an index written by `save`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                json.loads(data["terms"].tobytes()),
+                data["offsets"],
+                data["doc_ids"],
+                data["term_freqs"],
+                data["doc_lengths"],
+                json.loads(data["docs"].tobytes()),
+            )
+
+    def _series(self, doc: int) -> dict[str, Any]:
+        return dict(zip(DOC_FIELDS, self.docs[doc]))
+
+    def search(
+        self, query: str, *, limit: int = 5, min_score: float = DEFAULT_MIN_SCORE
+    ) -> list[SeriesHit]:
+        """Return up to `limit` series ranked by BM25 score (no I/O)."""
+        tokens = tokenize(query)
+        if not tokens or not self.docs:
+            return []
+        scores = np.zeros(len(self.docs), dtype=np.float64)
+        for term in set(tokens):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end].astype(np.float64)
+            norm = BM25_K1 * (
+                1.0 - BM25_B + BM25_B * self.doc_lengths[docs] / self._avg_length
+            )
+            scores[docs] += self._idf[term_id] * tf * (BM25_K1 + 1.0) / (tf + norm)
+        for token in tokens:
+            doc = self._by_series_id.get(token)
+            if doc is not None:
+                scores[doc] += ID_MATCH_BONUS
+
+        candidates = np.flatnonzero(scores >= min_score)
+        if not len(candidates):
+            return []
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        ranked = sorted(candidates.tolist(), key=lambda d: (-scores[d], d))
+        return [
+            SeriesHit(score=float(scores[d]), series=self._series(d)) for d in ranked
+        ]
+
+
+def default_index_path() -> Path:
+    """Return where the series index is stored (`FRED_SERIES_INDEX_PATH`)."""
+    configured = os.getenv("FRED_SERIES_INDEX_PATH")
+    return Path(configured) if configured else cache_path("fred_series_index.npz")
+
+
+@lru_cache(maxsize=1)
+def get_series_index() -> SeriesIndex | None:
+    """Return the shared series index, or `None` when none is available.
+
+    Loads the persisted index if present; otherwise builds (and saves) one from
+    `FRED_SERIES_CSV` (a metadata CSV or crawled catalog) when that is set.
+    """
+    path = default_index_path()
+    try:
+        if path.exists():
+            return SeriesIndex.load(path)
+        csv_path = os.getenv("FRED_SERIES_CSV")
+        if csv_path and Path(csv_path).exists():
+            index = SeriesIndex.from_file(csv_path)
+            index.save(path)
+            return index
+    except Exception:  # noqa: BLE001
+        logger.exception("Failed to load FRED series index from %s", path)
+    return None
@@ -0,0 +1,162 @@
+"""Coalesce concurrent identical upstream calls.
+
+When a release drops, many conversations ask for the same series within
+seconds; without coalescing each `fetch_recent_data("PAYEMS")` becomes its
+own FRED request and each `search_fomc_titles` its own Postgres query.
+`SingleFlight.run(namespace, key, call)` lets the first caller for a key (the
+leader) start `call` as a task owned by the flight, and every caller that
+arrives before it finishes awaits the same result (or exception). Nothing
+is cached: once the flight lands, the next call for `key` goes upstream
+again.
+
+In-flight calls are tracked in a thread-safe table of
+`concurrent.futures.Future`s, so callers on different event loops (or
+threads running their own loops) share flights too. Per-namespace counters
+report how much fan-out was collapsed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class FlightStats:
+    """Counters for one namespace (e.g. one tool)."""
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+def normalize_args(args: dict[str, Any]) -> str:
+    """Return a canonical key for tool arguments.
+
+    Keys are sorted, `None`/empty values dropped and strings stripped and
+    case-folded (series IDs and search text are case-insensitive upstream).
+    """
+
+    def clean(value: Any) -> Any:
+        if isinstance(value, str):
+            return value.strip().casefold()
+        if isinstance(value, dict):
+            return {k: clean(v) for k, v in value.items() if v not in (None, "")}
+        if isinstance(value, (list, tuple)):
+            return [clean(v) for v in value]
+        return value
+
+    return json.dumps(clean(args), sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        """Create an empty flight table."""
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[str, Hashable], Future[Any]] = {}
+        self._stats: dict[str, FlightStats] = {}
+        self._tasks: set[asyncio.Future[None]] = set()
+
+    async def run(
+        self,
+        namespace: str,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Await `call()`, or the result of an identical call already running.
+
+        The call runs as a task owned by the flight, not by the caller that
+        started it, so cancelling any one caller (e.g. its client went away)
+        leaves the others waiting on the same result.
+
+        Args:
+            namespace (str): Counter bucket (typically the tool name); also
+                part of the flight key.
+            key (Hashable): Identity of the call within `namespace`.
+            call (Callable[[], Awaitable[T]]): Starts the upstream call; only
+                invoked by the leader.
+        """
+        flight_key = (namespace, key)
+        with self._lock:
+            self._stats.setdefault(namespace, FlightStats()).calls += 1
+        first_attempt = True
+        while True:
+            with self._lock:
+                stats = self._stats.setdefault(namespace, FlightStats())
+                future = self._inflight.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[flight_key] = Future()
+                    stats.executions += 1
+                elif first_attempt:
+                    stats.coalesced += 1
+            first_attempt = False
+            if leader:
+                self._launch(flight_key, future, call)
+            try:
+                # Shield so a cancelled caller does not cancel the shared flight.
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                cancelling = getattr(task, "cancelling", lambda: 0)()
+                if future.cancelled() and not cancelling:
+                    # The flight itself was cancelled (e.g. its event loop
+                    # shut down): start or join a new one.
+                    continue
+                raise
+
+    def _launch(
+        self,
+        flight_key: tuple[str, Hashable],
+        future: Future[Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> None:
+        async def fly() -> None:
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self._land(flight_key)
+                future.cancel()
+                raise
+            except BaseException as exc:
+                self._land(flight_key)
+                future.set_exception(exc)
+                if not isinstance(exc, Exception):
+                    raise
+                return
+            self._land(flight_key)
+            future.set_result(result)
+
+        task = asyncio.ensure_future(fly())
+        # Keep a strong reference until the flight lands.
+        with self._lock:
+            self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _land(self, flight_key: tuple[str, Hashable]) -> None:
+        # Remove before publishing so later callers start a fresh flight.
+        with self._lock:
+            self._inflight.pop(flight_key, None)
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently running."""
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return counters per namespace."""
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self._stats.clear()
@@ -189,7 +189,9 @@ class State(InputState):
     attachments: Annotated[list[dict[str, Any]], add_attachments] = field(
         default_factory=list
     )
-    """Out-of-band payloads (e.g., chart images) returned to clients without entering the LLM prompt."""
+    """Out-of-band payloads (e.g., chart images) returned to clients without entering the LLM prompt.
+
+    Image attachments reference their bytes by blob digest (see `blob_store`) rather than embedding them."""
 
     series_data: Annotated[list[dict[str, Any]], add_series_data] = field(
         default_factory=list
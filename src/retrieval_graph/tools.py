@@ -0,0 +1,689 @@
+"""Registry of the tools exposed to the agent.
+
+Each tool declares its JSON schema, budget accounting and handler in one
+place. The registry derives the OpenAI-style `TOOL_DEFINITIONS` bound to the
+chat model from those declarations and dispatches tool calls by name.
+
+Handlers may be coroutines or plain functions. Plain functions (the FRED
+helpers, which do blocking network I/O) run on a bounded thread pool so a
+slow upstream call never stalls the event loop. The FRASER search is a
+coroutine backed by a pooled Postgres connection.
+
+Malformed arguments (e.g. a non-numeric `max_points`) raise
+`ToolArgumentError`, which the registry turns into that call's outcome so
+one bad call never fails its siblings.
+
+Tools declared with `coalesce=True` go through a `SingleFlight`: concurrent
+calls with the same tool name and normalized arguments share one handler run
+and its outcome. `registry.single_flight.stats()` reports, per tool, how many
+calls were made, executed and coalesced.
+
+If a handler was answered from stale cached FRED responses because FRED was
+unavailable (see `http_cache`), its outcome content is prefixed with a
+degraded-mode notice and the details are listed under `degraded`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
+
+from retrieval_graph import retrieval
+from retrieval_graph.fraser_tool import asearch_fomc_titles
+from retrieval_graph.fred_tool import (
+    DEFAULT_MAX_POINTS,
+    MIN_MAX_POINTS,
+    fetch_chart,
+    fetch_recent_data,
+    fetch_recent_data_batch,
+    fetch_release_structure_by_name,
+    fetch_series_analytics,
+    fetch_series_release_schedule,
+    search_series,
+)
+from retrieval_graph.http_cache import (
+    DegradedResponse,
+    degraded_notice,
+    track_degraded,
+)
+from retrieval_graph.release_tables import DEFAULT_DEPTH
+from retrieval_graph.series_analytics import DOWNSAMPLE_METHODS, TRANSFORMS
+from retrieval_graph.single_flight import SingleFlight, normalize_args
+from retrieval_graph.utils import format_docs
+
+DEFAULT_TOOL_EXECUTOR_WORKERS = int(os.getenv("TOOL_EXECUTOR_MAX_WORKERS", "8"))
+
+ToolHandler = Callable[[dict[str, Any], RunnableConfig], Any]
+
+
+class ToolArgumentError(ValueError):
+    """A tool argument is malformed; its message becomes the tool outcome."""
+
+
+def _int_arg(
+    args: dict[str, Any],
+    name: str,
+    default: int,
+    *,
+    minimum: int | None = None,
+    maximum: int | None = None,
+) -> int:
+    """Return `args[name]` as an int (`default` when absent), clamped to bounds.
+
+    Models sometimes send numbers as strings (`"12"`), which are accepted.
+
+    Raises:
+        ToolArgumentError: If the value is not an integer.
+    """
+    value = args.get(name)
+    if value is None or value == "":
+        number = default
+    elif isinstance(value, bool) or (
+        isinstance(value, float) and not value.is_integer()
+    ):
+        raise ToolArgumentError(f"{name} must be an integer.")
+    else:
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ToolArgumentError(f"{name} must be an integer.") from None
+    if minimum is not None:
+        number = max(number, minimum)
+    if maximum is not None:
+        number = min(number, maximum)
+    return number
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Declaration of a single agent tool.
+
+    The handler receives the validated tool arguments and the runnable config
+    and returns an outcome dict with a `content` string plus optional
+    `attachments`, `series_data`, `docs` and `queries` side outputs.
+    """
+
+    name: str
+    description: str
+    parameters: dict[str, dict[str, Any]]
+    handler: ToolHandler
+    missing_argument_message: str
+    required: tuple[str, ...] = ()
+    counts_toward_limit: bool = False
+    coalesce: bool = False
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the handler is a coroutine function."""
+        return inspect.iscoroutinefunction(self.handler)
+
+    def definition(self) -> dict[str, Any]:
+        """Return the function-calling schema for this tool."""
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": {
+                    "type": "object",
+                    "properties": self.parameters,
+                    "required": list(self.required),
+                },
+            },
+        }
+
+    def has_required_args(self, args: dict[str, Any]) -> bool:
+        """Return whether every required argument is present and non-empty."""
+        return all(args.get(name) for name in self.required)
+
+    def counts(self, args: dict[str, Any]) -> bool:
+        """Return whether a call with `args` consumes one unit of the tool budget."""
+        return self.counts_toward_limit and self.has_required_args(args)
+
+
+class ToolRegistry:
+    """Name-indexed collection of tools with a shared blocking-call executor."""
+
+    def __init__(self, *, max_workers: int = DEFAULT_TOOL_EXECUTOR_WORKERS) -> None:
+        """Create an empty registry whose blocking pool has `max_workers` threads."""
+        self.max_workers = max_workers
+        self._tools: dict[str, ToolSpec] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self.single_flight = SingleFlight()
+
+    def register(self, spec: ToolSpec) -> ToolSpec:
+        """Add a tool, rejecting duplicate names."""
+        if spec.name in self._tools:
+            raise ValueError(f"Tool '{spec.name}' is already registered.")
+        self._tools[spec.name] = spec
+        return spec
+
+    def tool(
+        self,
+        *,
+        name: str,
+        description: str,
+        parameters: dict[str, dict[str, Any]],
+        missing_argument_message: str,
+        required: Iterable[str] | None = None,
+        counts_toward_limit: bool = False,
+        coalesce: bool = False,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        """Register the decorated function as the handler for a tool."""
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.register(
+                ToolSpec(
+                    name=name,
+                    description=description,
+                    parameters=parameters,
+                    handler=handler,
+                    missing_argument_message=missing_argument_message,
+                    required=tuple(parameters if required is None else required),
+                    counts_toward_limit=counts_toward_limit,
+                    coalesce=coalesce,
+                )
+            )
+            return handler
+
+        return decorator
+
+    def get(self, name: str | None) -> ToolSpec | None:
+        """Look up a tool by name."""
+        return self._tools.get(name or "")
+
+    @property
+    def definitions(self) -> list[dict[str, Any]]:
+        """Function-calling schemas for every registered tool."""
+        return [spec.definition() for spec in self._tools.values()]
+
+    def counts_toward_limit(self, name: str | None, args: dict[str, Any]) -> bool:
+        """Return whether a call consumes one unit of the tool-call budget."""
+        spec = self.get(name)
+        return spec is not None and spec.counts(args)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded pool used to run blocking tool handlers."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="tool"
+            )
+        return self._executor
+
+    async def invoke(
+        self, name: str | None, args: dict[str, Any], config: RunnableConfig
+    ) -> dict[str, Any]:
+        """Run a tool call and return its outcome dict."""
+        spec = self.get(name)
+        if spec is None:
+            return {"content": f"Tool '{name}' is not implemented."}
+        if not spec.has_required_args(args):
+            return {"content": spec.missing_argument_message}
+        if spec.coalesce:
+            return await self.single_flight.run(
+                spec.name,
+                normalize_args(args),
+                lambda: self._call(spec, args, config),
+            )
+        return await self._call(spec, args, config)
+
+    async def _call(
+        self, spec: ToolSpec, args: dict[str, Any], config: RunnableConfig
+    ) -> dict[str, Any]:
+        try:
+            if spec.is_async:
+                with track_degraded() as degraded:
+                    outcome = await spec.handler(args, config)
+            else:
+                loop = asyncio.get_running_loop()
+                outcome, degraded = await loop.run_in_executor(
+                    self.executor,
+                    functools.partial(_run_tracked, spec.handler, args, config),
+                )
+        except ToolArgumentError as exc:
+            # Report to the model instead of failing the sibling tool calls.
+            return {"content": str(exc)}
+        if not degraded:
+            return outcome
+        return {
+            **outcome,
+            "content": f"{degraded_notice(degraded)}\n{outcome['content']}",
+            "degraded": [asdict(event) for event in degraded],
+        }
+
+
+def _run_tracked(
+    handler: ToolHandler, args: dict[str, Any], config: RunnableConfig
+) -> tuple[dict[str, Any], list[DegradedResponse]]:
+    """Run a blocking handler, collecting degraded responses it was served."""
+    with track_degraded() as degraded:
+        return handler(args, config), degraded
+
+
+registry = ToolRegistry()
+
+
+def _summarize_documents(docs: Iterable[Document], *, max_docs: int = 3) -> str:
+    """Convert retrieved docs into a compact string for tool feedback."""
+    limited = list(docs)[:max_docs]
+    if not limited:
+        return "No documents were retrieved."
+    return format_docs(limited)
+
+
+@asynccontextmanager
+async def _open_retriever(config: RunnableConfig) -> AsyncIterator[Any]:
+    """Enter `retrieval.make_retriever` on a worker thread.
+
+    Building the embedding model and vector-store client does blocking I/O,
+    which must not run on the event loop.
+    """
+    manager = retrieval.make_retriever(config)
+    retriever = await asyncio.to_thread(manager.__enter__)
+    try:
+        yield retriever
+    except BaseException as exc:
+        if not await asyncio.to_thread(
+            manager.__exit__, type(exc), exc, exc.__traceback__
+        ):
+            raise
+    else:
+        await asyncio.to_thread(manager.__exit__, None, None, None)
+
+
+@registry.tool(
+    name="retrieve_documents",
+    description=(
+        "Use this tool to search the indexed knowledge base for information "
+        "relevant to the user's question. Provide a concise natural language query."
+    ),
+    parameters={
+        "query": {
+            "type": "string",
+            "description": "Search query to retrieve supporting documents.",
+        }
+    },
+    missing_argument_message="No query provided to retrieval tool.",
+)
+async def _retrieve_documents(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    query = args["query"]
+    async with _open_retriever(config) as retriever:
+        docs = await retriever.ainvoke(query, config)
+    return {
+        "content": _summarize_documents(docs),
+        "docs": docs,
+        "queries": [query],
+    }
+
+
+@registry.tool(
+    name="fred_chart",
+    description=(
+        "Render a chart for a FRED series and share the image with the user. "
+        "Call this when the user asks for a plot or visualization. Other series "
+        "can be overlaid on the same chart and the date range narrowed."
+    ),
+    parameters={
+        "series_id": {
+            "type": "string",
+            "description": "Exact FRED series identifier (e.g. CPIAUCSL).",
+        },
+        "overlay_series_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Optional additional series to draw on the same chart.",
+        },
+        "observation_start": {
+            "type": "string",
+            "description": "Optional first date to plot (YYYY-MM-DD).",
+        },
+        "observation_end": {
+            "type": "string",
+            "description": "Optional last date to plot (YYYY-MM-DD).",
+        },
+    },
+    required=["series_id"],
+    missing_argument_message="A FRED series_id is required for chart generation.",
+    coalesce=True,
+)
+def _fred_chart(args: dict[str, Any], config: RunnableConfig) -> dict[str, Any]:
+    series_id = args["series_id"]
+    payload = fetch_chart(
+        series_id,
+        overlay_series_ids=args.get("overlay_series_ids") or (),
+        observation_start=args.get("observation_start"),
+        observation_end=args.get("observation_end"),
+    )
+    return {
+        "content": payload.get("message", f"Chart generated for {series_id}."),
+        "attachments": payload.get("attachments", []),
+    }
+
+
+@registry.tool(
+    name="fred_recent_data",
+    description=(
+        "Fetch recent numeric datapoints for a FRED series and use them in analysis. "
+        "Call this when the user needs the latest figures or trends. Pass "
+        "observation_start/observation_end for a historical range; long ranges "
+        "are downsampled to max_points while keeping peaks and troughs."
+    ),
+    parameters={
+        "series_id": {
+            "type": "string",
+            "description": "Exact FRED series identifier (e.g. UNRATE).",
+        },
+        "observation_start": {
+            "type": "string",
+            "description": "Optional first date of the range (YYYY-MM-DD).",
+        },
+        "observation_end": {
+            "type": "string",
+            "description": "Optional last date of the range (YYYY-MM-DD).",
+        },
+        "max_points": {
+            "type": "integer",
+            "description": (
+                "Maximum points returned for a date range "
+                f"({MIN_MAX_POINTS}-{DEFAULT_MAX_POINTS}, default {DEFAULT_MAX_POINTS})."
+            ),
+        },
+        "downsample": {
+            "type": "string",
+            "enum": list(DOWNSAMPLE_METHODS),
+            "description": "Downsampling method for long ranges (default lttb).",
+        },
+    },
+    required=["series_id"],
+    missing_argument_message="A FRED series_id is required to fetch recent data.",
+    coalesce=True,
+)
+def _fred_recent_data(args: dict[str, Any], config: RunnableConfig) -> dict[str, Any]:
+    payload = fetch_recent_data(
+        args["series_id"],
+        observation_start=args.get("observation_start"),
+        observation_end=args.get("observation_end"),
+        max_points=_int_arg(
+            args,
+            "max_points",
+            DEFAULT_MAX_POINTS,
+            minimum=MIN_MAX_POINTS,
+            maximum=DEFAULT_MAX_POINTS,
+        ),
+        downsample=args.get("downsample") or "lttb",
+    )
+    series_blocks = payload.get("series_data", [])
+    block_json = json.dumps(series_blocks, indent=2)
+    return {
+        "content": f"{payload.get('message', 'Retrieved series data.')}\n{block_json}",
+        "series_data": series_blocks,
+    }
+
+
+MAX_BATCH_SERIES = int(os.getenv("FRED_MAX_BATCH_SERIES", "10"))
+
+
+@registry.tool(
+    name="fred_recent_data_batch",
+    description=(
+        "Fetch recent datapoints for several FRED series at once, aligned on a "
+        "shared date axis. Prefer this over repeated fred_recent_data calls when "
+        "comparing series."
+    ),
+    parameters={
+        "series_ids": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                f"Exact FRED series identifiers (up to {MAX_BATCH_SERIES}), "
+                "e.g. [UNRATE, CPIAUCSL]."
+            ),
+        },
+        "latest_points": {
+            "type": "integer",
+            "description": (
+                "Number of most recent observations per series "
+                f"(1-{DEFAULT_MAX_POINTS}, default 12)."
+            ),
+        },
+    },
+    required=["series_ids"],
+    missing_argument_message="A list of FRED series_ids is required to fetch data.",
+    coalesce=True,
+)
+def _fred_recent_data_batch(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    requested = args["series_ids"]
+    if not isinstance(requested, list) or not all(
+        isinstance(s, str) for s in requested
+    ):
+        return {
+            "content": (
+                "series_ids must be a JSON array of FRED series identifiers, "
+                'e.g. ["UNRATE", "CPIAUCSL"].'
+            )
+        }
+    latest_points = _int_arg(
+        args, "latest_points", 12, minimum=1, maximum=DEFAULT_MAX_POINTS
+    )
+    series_ids, truncated = requested[:MAX_BATCH_SERIES], requested[MAX_BATCH_SERIES:]
+    payload = fetch_recent_data_batch(series_ids, latest_points=latest_points)
+    if truncated:
+        payload["truncated"] = truncated
+        payload["message"] = (
+            f"{payload.get('message', 'Retrieved series data.')} Only the first "
+            f"{MAX_BATCH_SERIES} series were fetched; not fetched: "
+            f"{', '.join(truncated)}."
+        )
+    series_blocks = payload.get("series_data", [])
+    block_json = json.dumps(series_blocks, separators=(",", ":"))
+    outcome: dict[str, Any] = {
+        "content": f"{payload.get('message', 'Retrieved series data.')}\n{block_json}",
+        "series_data": series_blocks,
+    }
+    if truncated:
+        outcome["truncated"] = truncated
+    return outcome
+
+
+@registry.tool(
+    name="fred_series_analytics",
+    description=(
+        "Compute exact statistics over a FRED series' full history: percent "
+        "change, year-over-year, month-over-month, rolling means, z-scores, "
+        "peaks/troughs, drawdowns and annualized rates. Use this instead of "
+        "doing arithmetic on raw datapoints."
+    ),
+    parameters={
+        "series_id": {
+            "type": "string",
+            "description": "Exact FRED series identifier (e.g. CPIAUCSL).",
+        },
+        "transforms": {
+            "type": "array",
+            "items": {"type": "string", "enum": list(TRANSFORMS)},
+            "description": (
+                "Transforms to compute (default: yoy, mom, rolling_mean, zscore, "
+                "peaks_troughs)."
+            ),
+        },
+        "window": {
+            "type": "integer",
+            "description": "Rolling/z-score window in observations (default: one year).",
+        },
+        "observation_start": {
+            "type": "string",
+            "description": "Optional first date to include (YYYY-MM-DD).",
+        },
+    },
+    required=["series_id"],
+    missing_argument_message="A FRED series_id is required to compute analytics.",
+    coalesce=True,
+)
+def _fred_series_analytics(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    payload = fetch_series_analytics(
+        args["series_id"],
+        transforms=args.get("transforms") or None,
+        # 0 (or absent) selects the one-year default.
+        window=_int_arg(args, "window", 0, minimum=0) or None,
+        observation_start=args.get("observation_start"),
+    )
+    analytics_json = json.dumps(payload.get("analytics"), separators=(",", ":"))
+    return {
+        "content": f"{payload.get('message', 'Computed analytics.')}\n{analytics_json}",
+    }
+
+
+@registry.tool(
+    name="fred_series_release_schedule",
+    description=(
+        "Resolve a FRED series to its release and return upcoming release dates."
+    ),
+    parameters={
+        "series_id": {
+            "type": "string",
+            "description": "FRED series identifier (e.g. UNRATE, CPIAUCSL).",
+        }
+    },
+    missing_argument_message=(
+        "A FRED series_id is required to fetch the series release schedule."
+    ),
+    counts_toward_limit=True,
+    coalesce=True,
+)
+def _fred_series_release_schedule(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    series_id = args["series_id"]
+    payload = fetch_series_release_schedule(series_id)
+    schedule = payload.get("release_schedule", [])
+    lines = [payload.get("message", f"Retrieved release schedule for {series_id}.")]
+    if schedule:
+        lines.append(json.dumps(schedule, indent=2))
+    elif payload.get("error"):
+        lines.append(f"Error: {payload['error']}")
+    else:
+        lines.append("No release dates returned.")
+    return {"content": "\n".join(lines)}
+
+
+MAX_TABLE_DEPTH = 4
+
+
+@registry.tool(
+    name="fred_release_structure",
+    description=(
+        "Browse the table structure of a FRED release by name (e.g. H.4.1). "
+        "Returns a compact outline, one element per line: `<element_id> <name> "
+        "[series_id] +N`, where +N counts children not shown. Call again with "
+        "an element_id to drill into a subtree, or with next_offset to page."
+    ),
+    parameters={
+        "release_name": {
+            "type": "string",
+            "description": "FRED release name to inspect (e.g. H.4.1).",
+        },
+        "element_id": {
+            "type": "integer",
+            "description": "Table element to expand (default: the release root).",
+        },
+        "depth": {
+            "type": "integer",
+            "description": f"Levels below the element to show (default {DEFAULT_DEPTH}).",
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Skip this many top-level items (from next_offset).",
+        },
+    },
+    required=["release_name"],
+    missing_argument_message=(
+        "A release_name is required to fetch release structure metadata."
+    ),
+    counts_toward_limit=True,
+    coalesce=True,
+)
+def _fred_release_structure(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    release_name = args["release_name"]
+    element_id = None
+    if args.get("element_id") not in (None, ""):
+        element_id = _int_arg(args, "element_id", 0)
+    payload = fetch_release_structure_by_name(
+        release_name,
+        element_id=element_id,
+        depth=_int_arg(
+            args, "depth", DEFAULT_DEPTH, minimum=1, maximum=MAX_TABLE_DEPTH
+        ),
+        offset=_int_arg(args, "offset", 0, minimum=0),
+    )
+    message = payload.get("message", f"Retrieved release structure for {release_name}.")
+    outline = payload.pop("outline", None)
+    meta = json.dumps(
+        {k: v for k, v in payload.items() if k != "message"}, separators=(",", ":")
+    )
+    body = f"{message}\n{meta}"
+    return {"content": f"{body}\n{outline}" if outline else body}
+
+
+@registry.tool(
+    name="fraser_search_fomc_titles",
+    description=(
+        "Search the FRASER/Postgres FOMC catalog for meeting titles (e.g. 'Meeting, January 2010')."
+    ),
+    parameters={
+        "query": {
+            "type": "string",
+            "description": "Fuzzy title query, e.g. 'Meeting, January 26-27, 2010'.",
+        }
+    },
+    missing_argument_message="A query is required to search FOMC titles.",
+    coalesce=True,
+)
+async def _fraser_search_fomc_titles(
+    args: dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    query = args["query"]
+    payload = await asearch_fomc_titles(query)
+    message = payload.get("message", f"Retrieved FOMC titles for '{query}'.")
+    return {"content": f"{message}\n{json.dumps(payload, indent=2)}"}
+
+
+@registry.tool(
+    name="fred_search_series",
+    description="Search the FRED catalog for series matching a text query.",
+    parameters={
+        "query": {
+            "type": "string",
+            "description": "Search text to find FRED series.",
+        }
+    },
+    missing_argument_message="A search query is required to search FRED series.",
+    counts_toward_limit=True,
+    coalesce=True,
+)
+def _fred_search_series(args: dict[str, Any], config: RunnableConfig) -> dict[str, Any]:
+    query = args["query"]
+    payload = search_series(query)
+    message = payload.get("message", f"Retrieved search results for '{query}'.")
+    return {"content": f"{message}\n{json.dumps(payload, indent=2)}"}
+
+
+TOOL_DEFINITIONS = registry.definitions
@@ -6,8 +6,11 @@ and other common operations in project.
 Functions:
     get_message_text: Extract text content from various message formats.
     format_docs: Convert documents to an xml-formatted string.
+    cache_path: Resolve a path inside the local on-disk cache directory.
 """
 
+import os
+from pathlib import Path
 from typing import Optional
 
 from langchain.chat_models import init_chat_model
@@ -115,3 +118,18 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
         provider = ""
         model = fully_specified_name
     return init_chat_model(model, model_provider=provider)
+
+
+def cache_path(name: str) -> Path:
+    """Resolve `name` inside the local cache directory, creating parent folders.
+
+    The cache root defaults to `.cache/retrieval_graph` and can be moved with the
+    `RETRIEVAL_GRAPH_CACHE_DIR` environment variable.
+
+    Args:
+        name (str): Relative file or directory name inside the cache root.
+    """
+    root = Path(os.getenv("RETRIEVAL_GRAPH_CACHE_DIR", ".cache/retrieval_graph"))
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
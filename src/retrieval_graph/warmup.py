@@ -0,0 +1,181 @@
+"""Warm the FRED caches for the hot series set at server start.
+
+Machines scale to zero (`min_machines_running = 0`), so after every deploy or
+auto-start the first users would otherwise pay cold-fetch latency for the
+series that dominate traffic. `Warmup` preloads, for each hot series and
+with bounded concurrency:
+
+- the observation snapshot (`FredClient.get_series_snapshot`, which fills
+  the `ObservationStore`),
+- its release mapping and release dates (`ReleaseCalendar.ensure_series`),
+- the default chart (`fetch_chart`, which fills the chart and blob caches).
+
+Warm-up requests run at `Priority.BACKGROUND`, so real traffic arriving
+during warm-up goes first. The server reports ready (`GET /ready`) once every
+series is warm or `FRED_WARMUP_BUDGET_SECONDS` has elapsed, whichever comes
+first; anything still running after the budget finishes in the background.
+
+The hot set defaults to `prompts.POPULAR_SERIES` and can be replaced with a
+comma-separated `FRED_WARMUP_SERIES` (an empty value disables warm-up).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Sequence
+
+from retrieval_graph.fred_tool import CHART_HISTORY_POINTS, fetch_chart, get_fred_client
+from retrieval_graph.prompts import POPULAR_SERIES
+from retrieval_graph.rate_limiter import Priority, request_priority
+from retrieval_graph.release_calendar import get_release_calendar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_SECONDS = float(os.getenv("FRED_WARMUP_BUDGET_SECONDS", "30"))
+DEFAULT_CONCURRENCY = int(os.getenv("FRED_WARMUP_CONCURRENCY", "4"))
+WARM_CHARTS = os.getenv("FRED_WARMUP_CHARTS", "1").lower() not in {"0", "false", "no"}
+
+
+def hot_series() -> list[str]:
+    """Return the configured hot set (`FRED_WARMUP_SERIES` or `POPULAR_SERIES`)."""
+    configured = os.getenv("FRED_WARMUP_SERIES")
+    if configured is None:
+        return list(POPULAR_SERIES)
+    return [s.strip().upper() for s in configured.split(",") if s.strip()]
+
+
+def warm_series(series_id: str, *, chart: bool = WARM_CHARTS) -> None:
+    """Preload the snapshot, release mapping and (optionally) chart of a series.
+
+    Raises:
+        RuntimeError: If the chart could not be produced.
+    """
+    get_fred_client().get_series_snapshot(series_id, limit=CHART_HISTORY_POINTS)
+    get_release_calendar().ensure_series(series_id)
+    if chart:
+        result = fetch_chart(series_id)
+        if result.get("error"):
+            raise RuntimeError(result["error"])
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warm-up run."""
+
+    series: list[str]
+    started_at: float | None = None
+    ready_at: float | None = None
+    warmed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    timed_out: bool = False
+
+
+class Warmup:
+    """Concurrently warm caches for a set of series within a time budget."""
+
+    def __init__(
+        self,
+        series_ids: Sequence[str],
+        *,
+        budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        warm: Callable[[str], None] = warm_series,
+    ) -> None:
+        """Prepare a warm-up; call `start()` (background) or `run()` (blocking).
+
+        Args:
+            series_ids (Sequence[str]): Series to warm.
+            budget_seconds (float): Report ready after this long even if some
+                series are still loading.
+            concurrency (int): Series warmed at the same time.
+            warm (Callable[[str], None]): Warms one series; raises on failure.
+        """
+        self.series_ids = list(dict.fromkeys(series_ids))
+        self.budget_seconds = budget_seconds
+        self.concurrency = max(1, concurrency)
+        self.warm = warm
+        self.report = WarmupReport(series=self.series_ids)
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up finished or ran out of budget."""
+        return self._ready.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until ready; return whether it became ready within `timeout`."""
+        return self._ready.wait(timeout)
+
+    def _warm_one(self, series_id: str) -> None:
+        try:
+            with request_priority(Priority.BACKGROUND):
+                self.warm(series_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Warm-up of %s failed: %s", series_id, exc)
+            with self._lock:
+                self.report.failed[series_id] = str(exc)
+            return
+        with self._lock:
+            self.report.warmed.append(series_id)
+
+    def run(self) -> WarmupReport:
+        """Warm every series, returning once done or the budget has elapsed."""
+        self.report.started_at = time.time()
+        if self.series_ids:
+            executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="warmup"
+            )
+            futures = [executor.submit(self._warm_one, s) for s in self.series_ids]
+            _, pending = wait(futures, timeout=self.budget_seconds)
+            self.report.timed_out = bool(pending)
+            # Stragglers keep warming in the background.
+            executor.shutdown(wait=False)
+        self.report.ready_at = time.time()
+        self._ready.set()
+        logger.info(
+            "Warm-up ready in %.1fs: %d warmed, %d failed%s",
+            self.report.ready_at - self.report.started_at,
+            len(self.report.warmed),
+            len(self.report.failed),
+            " (budget elapsed)" if self.report.timed_out else "",
+        )
+        return self.report
+
+    def start(self) -> None:
+        """Run the warm-up on a daemon thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self.run, name="fred-warmup", daemon=True
+            )
+        self._thread.start()
+
+    def status(self) -> dict[str, Any]:
+        """Return readiness and progress for health endpoints."""
+        with self._lock:
+            report = self.report
+            done = set(report.warmed) | set(report.failed)
+            return {
+                "ready": self.ready,
+                "timed_out": report.timed_out,
+                "warmed": list(report.warmed),
+                "failed": dict(report.failed),
+                "pending": [s for s in report.series if s not in done],
+                "started_at": report.started_at,
+                "ready_at": report.ready_at,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_warmup() -> Warmup:
+    """Return the process-wide warm-up for the configured hot set."""
+    return Warmup(hot_series())
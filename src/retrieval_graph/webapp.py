@@ -0,0 +1,87 @@
+"""Custom routes mounted into the LangGraph server.
+
+The deployed process is `langgraph dev` serving `graph.py` (see the
+Dockerfile), not `api_server`. `langgraph.json` mounts `app` through its
+`http.app` setting, so the process that serves traffic starts the cache
+warm-up on boot and answers:
+
+- `GET /ready`: 503 with progress until the warm-up is done (fly.io health
+  check),
+- `GET /attachments/{digest}`: chart attachments by content digest,
+- `GET /stats/tools`: per-tool single-flight counters.
+
+`api_server` serves the same handlers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, FastAPI, Header, HTTPException, Response
+from fastapi.responses import FileResponse, JSONResponse
+
+from retrieval_graph.blob_store import get_blob_store, is_digest
+from retrieval_graph.tools import registry
+from retrieval_graph.warmup import get_warmup
+
+# Blobs are content-addressed, so a digest's bytes never change.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+router = APIRouter()
+
+
+async def start_warmup() -> None:
+    """Preload caches for the hot series set without delaying startup."""
+    get_warmup().start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the warm-up when the server starts."""
+    await start_warmup()
+    yield
+
+
+@router.get("/ready")
+async def ready() -> Any:
+    """Report ready once the cache warm-up has finished or used up its budget."""
+    status = get_warmup().status()
+    if not status["ready"]:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+
+@router.get("/attachments/{digest}")
+async def get_attachment(
+    digest: str, if_none_match: str | None = Header(None)
+) -> Response:
+    """Serve attachment bytes by content digest with strong, immutable caching."""
+    blob = None
+    if is_digest(digest):
+        # The lookup touches the filesystem (and scans the store on first use).
+        blob = await asyncio.to_thread(get_blob_store().get, digest)
+    if blob is None:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return FileResponse(blob.path, media_type=blob.media_type, headers=headers)
+
+
+@router.get("/stats/tools")
+async def tool_stats() -> dict[str, Any]:
+    """Report per-tool single-flight counters (calls, executions, coalesced)."""
+    return {
+        "single_flight": registry.single_flight.stats(),
+        "in_flight": registry.single_flight.in_flight(),
+    }
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(router)
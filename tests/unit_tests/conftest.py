@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from retrieval_graph.http_cache import get_response_cache
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Keep on-disk caches created by the tools out of the working tree."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    previous = os.environ.get("RETRIEVAL_GRAPH_CACHE_DIR")
+    os.environ["RETRIEVAL_GRAPH_CACHE_DIR"] = str(cache_dir)
+    # Keep the shared FRED rate limiter active but effectively unthrottled.
+    previous_rate = os.environ.get("FRED_RATE_LIMIT_PER_MINUTE")
+    os.environ["FRED_RATE_LIMIT_PER_MINUTE"] = "600000"
+    yield cache_dir
+    if previous_rate is None:
+        os.environ.pop("FRED_RATE_LIMIT_PER_MINUTE", None)
+    else:
+        os.environ["FRED_RATE_LIMIT_PER_MINUTE"] = previous_rate
+    if previous is None:
+        os.environ.pop("RETRIEVAL_GRAPH_CACHE_DIR", None)
+    else:
+        os.environ["RETRIEVAL_GRAPH_CACHE_DIR"] = previous
+
+
+@pytest.fixture(autouse=True)
+def clear_fred_response_cache(isolated_cache_dir: Path) -> None:
+    """Start every test without cached FRED responses."""
+    cache = get_response_cache()
+    if cache is not None:
+        cache.clear()
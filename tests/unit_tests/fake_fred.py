@@ -0,0 +1,72 @@
+"""Minimal stand-in for the FRED REST API used by unit tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+# A route returns the JSON payload, or `(status, payload)` to fail a request.
+Route = Callable[[dict[str, str]], "dict[str, Any] | tuple[int, dict[str, Any]]"]
+
+
+class FakeFredServer:
+    """Serve canned JSON payloads keyed by endpoint path on a local port."""
+
+    def __init__(self, routes: dict[str, Route]) -> None:
+        self.routes = routes
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.client_ports: set[int] = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                parsed = urlparse(self.path)
+                endpoint = parsed.path.removeprefix("/fred/")
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                server.requests.append((endpoint, params))
+                server.client_ports.add(self.client_address[1])
+                route = server.routes.get(endpoint)
+                if route is None:
+                    status, payload = 404, {"error_message": f"unknown {endpoint}"}
+                else:
+                    result = route(params)
+                    status, payload = (
+                        result if isinstance(result, tuple) else (200, result)
+                    )
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/fred"
+
+    def endpoint_calls(self, endpoint: str) -> int:
+        return sum(1 for name, _ in self.requests if name == endpoint)
+
+    def __enter__(self) -> "FakeFredServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
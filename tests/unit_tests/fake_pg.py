@@ -0,0 +1,94 @@
+"""Stand-in for psycopg2 connections used by unit tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class FakeCursor:
+    """Records statements on its connection and returns canned rows."""
+
+    def __init__(self, conn: FakeConnection) -> None:
+        self.conn = conn
+        self.rows: list[dict[str, Any]] = []
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        if self.conn.dead:
+            self.conn.closed = 2
+            raise ConnectionError("server closed the connection unexpectedly")
+        self.conn.queries.append(sql.strip())
+        self.conn.params.append(params)
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise self.conn.error
+        canned = [rows for key, rows in self.conn.responses.items() if key in sql]
+        if canned:
+            self.rows = list(canned[0])
+        else:
+            self.rows = list(self.conn.rows) if "fomc_items" in sql else []
+
+    def executemany(self, sql: str, seq: list[Any]) -> None:
+        for params in seq:
+            self.execute(sql, params)
+
+    def copy_expert(self, sql: str, file: Any) -> None:
+        self.conn.queries.append(sql.strip())
+        self.conn.copies.append(file.read())
+
+    def fetchone(self) -> Any:
+        return self.rows[0] if self.rows else (1,)
+
+    def fetchall(self) -> list[Any]:
+        return self.rows
+
+
+class FakeConnection:
+    """Stand-in for a psycopg2 connection."""
+
+    def __init__(self, rows: list[dict[str, Any]] | None = None) -> None:
+        self.rows = rows or []
+        self.closed = 0
+        self.dead = False
+        self.queries: list[str] = []
+        self.params: list[Any] = []
+        # Rows returned by statements containing the key (else `rows` for
+        # queries on `fomc_items`).
+        self.responses: dict[str, list[Any]] = {}
+        self.copies: list[str] = []
+        self.commits = 0
+        # Raise `error` from any statement containing `fail_on`.
+        self.fail_on: str | None = None
+        self.error: Exception = RuntimeError("statement failed")
+
+    def cursor(self, cursor_factory: Any = None) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        if self.closed:
+            raise ConnectionError("connection already closed")
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class Factory:
+    """Connection factory for `PgPool` that remembers what it made."""
+
+    def __init__(self, rows: list[dict[str, Any]] | None = None) -> None:
+        self.rows = rows
+        self.responses: dict[str, list[Any]] = {}
+        self.made: list[FakeConnection] = []
+
+    def __call__(self) -> FakeConnection:
+        conn = FakeConnection(self.rows)
+        conn.responses = self.responses
+        self.made.append(conn)
+        return conn
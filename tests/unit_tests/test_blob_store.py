@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from retrieval_graph.blob_store import BlobStore, attachment_url, is_digest
+
+
+def test_put_is_content_addressed_and_deduplicated(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path)
+
+    first = store.put(b"chart-bytes", "image/png")
+    second = store.put(b"chart-bytes", "image/png")
+
+    assert first == second and is_digest(first)
+    assert len(store) == 1
+    blob = store.get(first)
+    assert blob is not None
+    assert blob.path.suffix == ".png" and blob.media_type == "image/png"
+    assert store.read(first) == b"chart-bytes"
+    assert attachment_url(first) == f"/attachments/{first}"
+
+
+def test_evicts_least_recently_used_past_size_bound(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, max_bytes=25)
+    a = store.put(b"a" * 10, "image/png")
+    b = store.put(b"b" * 10, "image/png")
+    store.get(a)  # a is now more recently used than b
+
+    c = store.put(b"c" * 10, "image/svg+xml")
+
+    assert store.get(b) is None
+    assert store.read(a) == b"a" * 10
+    assert store.read(c) == b"c" * 10
+    assert store.total_bytes == 20
+    assert not list(tmp_path.glob(f"??/{b}*"))
+
+
+def test_reopening_indexes_existing_blobs(tmp_path: Path) -> None:
+    digest = BlobStore(tmp_path).put(b"<svg/>", "image/svg+xml")
+
+    reopened = BlobStore(tmp_path)
+
+    blob = reopened.get(digest)
+    assert blob is not None and blob.media_type == "image/svg+xml"
+    assert reopened.total_bytes == len(b"<svg/>")
+
+
+def test_attachment_route_reads_the_store_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from fastapi.testclient import TestClient
+
+    from retrieval_graph import webapp
+
+    store = BlobStore(tmp_path)
+    digest = store.put(b"chart-bytes", "image/png")
+    on_loop: list[bool] = []
+    lookup = store.get
+
+    def get(key: str) -> Any:
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return lookup(key)
+
+    monkeypatch.setattr(store, "get", get)
+    monkeypatch.setattr(webapp, "get_blob_store", lambda: store)
+    client = TestClient(webapp.app)
+
+    response = client.get(f"/attachments/{digest}")
+    assert response.content == b"chart-bytes"
+    assert response.headers["etag"] == f'"{digest}"'
+    cached = client.get(
+        f"/attachments/{digest}", headers={"If-None-Match": f'"{digest}"'}
+    )
+    assert cached.status_code == 304
+    assert client.get("/attachments/not-a-digest").status_code == 404
+    assert on_loop == [False, False]
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import threading
+import time
+from typing import Any, Iterator
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from retrieval_graph.state import State
+
+graph_module = importlib.import_module("retrieval_graph.graph")
+tools_module = importlib.import_module("retrieval_graph.tools")
+
+
+def _state_with_calls(
+    calls: list[dict[str, Any]], *, tool_call_count: int = 0
+) -> State:
+    message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": call["name"], "args": call["args"], "id": call["id"]}
+            for call in calls
+        ],
+    )
+    return State(
+        messages=[HumanMessage(content="hi"), message],
+        tool_call_count=tool_call_count,
+    )
+
+
+def test_call_tool_runs_calls_concurrently_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_fetch_recent_data(series_id: str, **kwargs: Any) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Finish in reverse order of submission.
+        time.sleep({"CPIAUCSL": 0.3, "UNRATE": 0.2, "FEDFUNDS": 0.1}[series_id])
+        with lock:
+            in_flight -= 1
+        return {
+            "message": f"data for {series_id}",
+            "series_data": [{"series_id": series_id}],
+        }
+
+    monkeypatch.setattr(tools_module, "fetch_recent_data", fake_fetch_recent_data)
+    calls = [
+        {"name": "fred_recent_data", "args": {"series_id": sid}, "id": f"call-{sid}"}
+        for sid in ("CPIAUCSL", "UNRATE", "FEDFUNDS")
+    ]
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        graph_module.call_tool(
+            _state_with_calls(calls), config={"configurable": {"user_id": "test"}}
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    assert peak == 3
+    assert elapsed < 0.55
+    assert [m.tool_call_id for m in result["messages"]] == [c["id"] for c in calls]
+    assert [b["series_id"] for b in result["series_data"]] == [
+        "CPIAUCSL",
+        "UNRATE",
+        "FEDFUNDS",
+    ]
+
+
+def test_call_tool_respects_concurrency_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_search_series(query: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return {"message": query, "results": []}
+
+    monkeypatch.setattr(tools_module, "search_series", fake_search_series)
+    monkeypatch.setattr(graph_module, "MAX_TOOL_CALLS", 10)
+    calls = [
+        {"name": "fred_search_series", "args": {"query": f"q{i}"}, "id": f"c{i}"}
+        for i in range(5)
+    ]
+
+    result = asyncio.run(
+        graph_module.call_tool(
+            _state_with_calls(calls),
+            config={
+                "configurable": {"user_id": "test", "max_concurrent_tool_calls": 2}
+            },
+        )
+    )
+
+    assert peak <= 2
+    assert result["tool_call_count"] == 5
+
+
+def test_call_tool_budget_accounting_is_exact(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        tools_module,
+        "search_series",
+        lambda query: {"message": query, "results": []},
+    )
+    monkeypatch.setattr(
+        tools_module,
+        "fetch_recent_data",
+        lambda series_id, **kwargs: {"message": series_id, "series_data": []},
+    )
+    calls = [
+        {"name": "fred_search_series", "args": {"query": "a"}, "id": "c0"},
+        {"name": "fred_recent_data", "args": {"series_id": "UNRATE"}, "id": "c1"},
+        {"name": "fred_search_series", "args": {"query": "b"}, "id": "c2"},
+        {"name": "fred_search_series", "args": {"query": "c"}, "id": "c3"},
+    ]
+
+    result = asyncio.run(
+        graph_module.call_tool(
+            _state_with_calls(calls, tool_call_count=graph_module.MAX_TOOL_CALLS - 2),
+            config={"configurable": {"user_id": "test"}},
+        )
+    )
+
+    assert result["tool_call_count"] == graph_module.MAX_TOOL_CALLS
+    ids = [m.tool_call_id for m in result["messages"]]
+    assert ids == ["c0", "c1", "c2", "c3"]
+    assert "Tool-call limit reached" in result["messages"][-1].content
+
+
+def test_tool_definitions_are_generated_from_registry() -> None:
+    names = [d["function"]["name"] for d in tools_module.TOOL_DEFINITIONS]
+    assert len(names) == len(set(names))
+    assert "fraser_search_fomc_titles" in names
+    chart = next(
+        d
+        for d in tools_module.TOOL_DEFINITIONS
+        if d["function"]["name"] == "fred_chart"
+    )
+    assert chart["function"]["parameters"]["required"] == ["series_id"]
+
+
+def test_registry_reports_missing_and_unknown_tools() -> None:
+    config = {"configurable": {"user_id": "test"}}
+    missing = asyncio.run(tools_module.registry.invoke("fred_chart", {}, config))
+    unknown = asyncio.run(tools_module.registry.invoke("nope", {}, config))
+
+    assert missing["content"] == "A FRED series_id is required for chart generation."
+    assert unknown["content"] == "Tool 'nope' is not implemented."
+
+
+def test_call_tool_coalesces_identical_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    def fake_fetch_recent_data(series_id: str, **kwargs: Any) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.1)
+        return {"message": f"data for {series_id}"}
+
+    monkeypatch.setattr(tools_module, "fetch_recent_data", fake_fetch_recent_data)
+    registry = tools_module.registry
+    registry.single_flight.reset_stats()
+    tool_calls = [
+        {"name": "fred_recent_data", "args": {"series_id": sid}, "id": f"call-{i}"}
+        for i, sid in enumerate(["PAYEMS", "payems", "PAYEMS "])
+    ]
+
+    result = asyncio.run(
+        graph_module.call_tool(
+            _state_with_calls(tool_calls),
+            config={"configurable": {"user_id": "test"}},
+        )
+    )
+
+    assert calls == 1
+    assert len({m.content for m in result["messages"]}) == 1
+    assert registry.single_flight.stats()["fred_recent_data"] == {
+        "calls": 3,
+        "executions": 1,
+        "coalesced": 2,
+    }
+
+
+def test_batch_tool_rejects_strings_and_reports_truncation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fetched: list[list[str]] = []
+    latest: list[int] = []
+
+    def fake_batch(series_ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        fetched.append(series_ids)
+        latest.append(kwargs["latest_points"])
+        return {"message": "ok", "series_data": []}
+
+    monkeypatch.setattr(tools_module, "fetch_recent_data_batch", fake_batch)
+    monkeypatch.setattr(tools_module, "MAX_BATCH_SERIES", 2)
+    config = {"configurable": {"user_id": "test"}}
+
+    rejected = asyncio.run(
+        tools_module.registry.invoke(
+            "fred_recent_data_batch", {"series_ids": "UNRATE"}, config
+        )
+    )
+    assert "JSON array" in rejected["content"]
+    assert fetched == []
+
+    outcome = asyncio.run(
+        tools_module.registry.invoke(
+            "fred_recent_data_batch", {"series_ids": ["A", "B", "C", "D"]}, config
+        )
+    )
+    assert fetched == [["A", "B"]]
+    assert outcome["truncated"] == ["C", "D"]
+    assert "not fetched: C, D" in outcome["content"]
+    assert latest == [12]
+
+
+def test_batch_tool_validates_and_clamps_latest_points(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    latest: list[int] = []
+
+    def fake_batch(series_ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        latest.append(kwargs["latest_points"])
+        return {"message": "ok", "series_data": []}
+
+    monkeypatch.setattr(tools_module, "fetch_recent_data_batch", fake_batch)
+    config = {"configurable": {"user_id": "test"}}
+
+    def invoke(latest_points: Any) -> dict[str, Any]:
+        args = {"series_ids": ["UNRATE"], "latest_points": latest_points}
+        return asyncio.run(
+            tools_module.registry.invoke("fred_recent_data_batch", args, config)
+        )
+
+    assert invoke("many")["content"] == "latest_points must be an integer."
+    invoke(10_000)
+    invoke(-3)
+    assert latest == [tools_module.DEFAULT_MAX_POINTS, 1]
+
+
+def test_retriever_is_built_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: dict[str, int] = {}
+
+    class FakeRetriever:
+        async def ainvoke(self, query: str, config: Any) -> list[Any]:
+            threads["invoke"] = threading.get_ident()
+            return []
+
+    @contextlib.contextmanager
+    def fake_make_retriever(config: Any) -> Iterator[FakeRetriever]:
+        threads["enter"] = threading.get_ident()
+        yield FakeRetriever()
+        threads["exit"] = threading.get_ident()
+
+    monkeypatch.setattr(tools_module.retrieval, "make_retriever", fake_make_retriever)
+    outcome = asyncio.run(
+        tools_module.registry.invoke(
+            "retrieve_documents",
+            {"query": "inflation"},
+            {"configurable": {"user_id": "test"}},
+        )
+    )
+
+    assert outcome["content"] == "No documents were retrieved."
+    assert threads["enter"] != threads["invoke"]
+    assert threads["exit"] != threads["invoke"]
+
+
+def test_malformed_numeric_argument_fails_only_its_own_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[int] = []
+
+    def fake_fetch_recent_data(series_id: str, **kwargs: Any) -> dict[str, Any]:
+        requested.append(kwargs["max_points"])
+        return {"message": f"data for {series_id}"}
+
+    monkeypatch.setattr(tools_module, "fetch_recent_data", fake_fetch_recent_data)
+    calls = [
+        {
+            "name": "fred_recent_data",
+            "args": {"series_id": "UNRATE", "max_points": "all"},
+            "id": "bad",
+        },
+        {
+            "name": "fred_recent_data",
+            "args": {"series_id": "PAYEMS", "max_points": "24"},
+            "id": "good",
+        },
+    ]
+
+    result = asyncio.run(
+        graph_module.call_tool(
+            _state_with_calls(calls), config={"configurable": {"user_id": "test"}}
+        )
+    )
+
+    contents = [m.content for m in result["messages"]]
+    assert contents[0] == "max_points must be an integer."
+    assert contents[1].startswith("data for PAYEMS")
+    assert requested == [24]
+
+
+def test_analytics_tool_validates_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    windows: list[int | None] = []
+
+    def fake_analytics(series_id: str, **kwargs: Any) -> dict[str, Any]:
+        windows.append(kwargs["window"])
+        return {"message": "ok", "analytics": {}}
+
+    monkeypatch.setattr(tools_module, "fetch_series_analytics", fake_analytics)
+    config = {"configurable": {"user_id": "test"}}
+
+    def invoke(window: Any) -> dict[str, Any]:
+        args = {"series_id": "CPIAUCSL", "window": window}
+        return asyncio.run(
+            tools_module.registry.invoke("fred_series_analytics", args, config)
+        )
+
+    assert invoke("a year")["content"] == "window must be an integer."
+    invoke("6")
+    invoke(None)
+    assert windows == [6, None]
+
+
+@pytest.mark.parametrize("name", ["element_id", "depth", "offset"])
+def test_release_structure_rejects_non_numeric_arguments(
+    monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    def fake_structure(release_name: str, **kwargs: Any) -> dict[str, Any]:
+        raise AssertionError("should not fetch")
+
+    monkeypatch.setattr(tools_module, "fetch_release_structure_by_name", fake_structure)
+    outcome = asyncio.run(
+        tools_module.registry.invoke(
+            "fred_release_structure",
+            {"release_name": "H.4.1", name: "top"},
+            {"configurable": {"user_id": "test"}},
+        )
+    )
+
+    assert outcome == {"content": f"{name} must be an integer."}
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from retrieval_graph import fred_api
+from retrieval_graph.catalog_crawler import (
+    AsyncRateLimiter,
+    CatalogCrawler,
+    iter_catalog_rows,
+    read_catalog,
+    seed_release_calendar,
+)
+from retrieval_graph.release_calendar import ReleaseCalendar
+from retrieval_graph.series_index import SeriesIndex
+from tests.unit_tests.fake_fred import FakeFredServer
+
+RELEASE_SERIES = {
+    "10": [
+        {"id": "CPIAUCSL", "title": "Consumer Price Index", "frequency": "Monthly"},
+        {"id": "CPILFESL", "title": "Core Consumer Price Index", "units": "Index"},
+        {"id": "CPIAUCNS", "title": "CPI Not Seasonally Adjusted"},
+    ],
+    "50": [
+        {"id": "UNRATE", "title": "Unemployment Rate", "units": "Percent"},
+        {"id": "CPIAUCSL", "title": "Consumer Price Index", "frequency": "Monthly"},
+    ],
+}
+FAILING: set[str] = set()
+
+
+def _releases(params: dict[str, str]) -> dict[str, Any]:
+    releases = [
+        {"id": 10, "name": "Consumer Price Index"},
+        {"id": 50, "name": "Employment Situation"},
+    ]
+    offset, limit = int(params["offset"]), int(params["limit"])
+    return {"count": len(releases), "releases": releases[offset : offset + limit]}
+
+
+def _release_series(params: dict[str, str]) -> Any:
+    release_id = params["release_id"]
+    if release_id in FAILING:
+        return 500, {"error_message": "upstream error"}
+    series = RELEASE_SERIES[release_id]
+    offset, limit = int(params["offset"]), int(params["limit"])
+    return {"count": len(series), "seriess": series[offset : offset + limit]}
+
+
+@pytest.fixture
+def fake_fred() -> Iterator[FakeFredServer]:
+    FAILING.clear()
+    routes = {"releases": _releases, "release/series": _release_series}
+    with FakeFredServer(routes) as server:
+        yield server
+
+
+def _crawler(server: FakeFredServer, tmp_path: Path) -> CatalogCrawler:
+    api = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+    return CatalogCrawler(
+        tmp_path / "crawl", api, concurrency=2, requests_per_second=0, page_size=2
+    )
+
+
+def test_crawl_pages_dedupes_and_writes_columnar_catalog(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    crawler = _crawler(fake_fred, tmp_path)
+
+    path = asyncio.run(crawler.arun())
+
+    columns = read_catalog(path)["columns"]
+    assert columns["series_id"] == ["CPIAUCSL", "CPILFESL", "CPIAUCNS", "UNRATE"]
+    assert columns["release_id"] == [10, 10, 10, 50]
+    # Release 10 has 3 series at page size 2: two pages.
+    assert fake_fred.endpoint_calls("release/series") == 3
+    rows = list(iter_catalog_rows(path))
+    assert rows[3]["units"] == "Percent" and rows[3]["notes"] == ""
+
+
+def test_crawl_resumes_from_checkpoint(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    FAILING.add("50")
+    with pytest.raises(RuntimeError, match="1 release"):
+        asyncio.run(_crawler(fake_fred, tmp_path).arun())
+    calls = fake_fred.endpoint_calls("release/series")
+
+    FAILING.clear()
+    resumed = _crawler(fake_fred, tmp_path)
+    path = asyncio.run(resumed.arun())
+
+    # Only the failed release is fetched again; the release list is not.
+    assert fake_fred.endpoint_calls("release/series") == calls + 1
+    assert fake_fred.endpoint_calls("releases") == 1
+    assert resumed.stats.releases_skipped == 1
+    assert len(read_catalog(path)["columns"]["series_id"]) == 4
+
+
+def test_catalog_feeds_search_index_and_release_calendar(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    path = asyncio.run(_crawler(fake_fred, tmp_path).arun())
+
+    index = SeriesIndex.from_file(path)
+    calendar = ReleaseCalendar()
+    seeded = seed_release_calendar(path, calendar)
+
+    assert index.search("unemployment")[0].series["id"] == "UNRATE"
+    assert seeded == 4
+    assert calendar.release_for("CPILFESL") == 10
+    assert calendar.release_name(50) == "Employment Situation"
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    async def acquire_all() -> float:
+        limiter = AsyncRateLimiter(20)
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        return time.monotonic() - started
+
+    assert asyncio.run(acquire_all()) >= 0.14
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from retrieval_graph.fomc_dates import DateRange, date_intent, item_dates
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Meeting, July 20, 1933", ("1933-07-20", "1933-07-20")),
+        ("Meeting, January 26-27, 2010", ("2010-01-26", "2010-01-27")),
+        ("Meeting, January 31-February 1, 2012", ("2012-01-31", "2012-02-01")),
+        ("Meeting, October 22, 23, and 24, 1935", ("1935-10-22", "1935-10-24")),
+        ("Telephone Conference, May 4, 2020", ("2020-05-04", "2020-05-04")),
+        ("Meeting, March 15, 2020 (Unscheduled)", ("2020-03-15", "2020-03-15")),
+    ],
+)
+def test_item_dates_from_title(title: str, expected: tuple[str, str]) -> None:
+    dates = item_dates({"titleInfo": [{"title": title}]})
+    assert dates == DateRange(*(date.fromisoformat(d) for d in expected))
+
+
+def test_item_dates_fall_back_to_sort_date() -> None:
+    record = {
+        "titleInfo": [{"title": "Updated Historical Forecast Errors"}],
+        "originInfo": {"sortDate": "2014-04-09"},
+    }
+    assert str(item_dates(record)) == "2014-04-09"
+    assert item_dates({"titleInfo": [{"title": "Untitled"}]}) is None
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("January 26-27, 2010 meeting", "2010-01-26..2010-01-27"),
+        ("Dec 31, 1996 - Jan 1, 1997", "1996-12-31..1997-01-01"),
+        ("FOMC minutes september 1987", "1987-09-01..1987-09-30"),
+        ("meeting on 2010-01-27", "2010-01-27"),
+        ("Memoranda of Discussion 1965", "1965-01-01..1965-12-31"),
+        ("balance sheet normalization", None),
+        ("February 30, 2010", None),
+    ],
+)
+def test_date_intent(query: str, expected: str | None) -> None:
+    dates = date_intent(query)
+    assert (str(dates) if dates else None) == expected
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from retrieval_graph import fraser_tool
+from retrieval_graph.fomc_index import FomcIndex, similarity
+
+
+def _record(item_id: int, title: str, sort_date: str = "") -> dict[str, Any]:
+    return {
+        "titleInfo": [{"title": title}],
+        "originInfo": {"sortDate": sort_date},
+        "location": {"pdfUrl": [f"https://fraser.stlouisfed.org/{item_id}.pdf"]},
+        "recordInfo": {"recordIdentifier": [item_id]},
+    }
+
+
+RECORDS = [
+    _record(1, "Meeting, January 26-27, 2010"),
+    _record(2, "Meeting, March 16, 2010"),
+    _record(3, "Telephone Conference, May 9, 2010"),
+    _record(4, "Meeting, March 15, 2020 (Unscheduled)"),
+    _record(5, "Updated Historical Forecast Errors", "2014-04-09"),
+]
+
+
+@pytest.fixture
+def index() -> FomcIndex:
+    index = FomcIndex(":memory:")
+    index.add(RECORDS)
+    return index
+
+
+def test_similarity_matches_pg_trgm() -> None:
+    # pg_trgm documentation: similarity('word', 'two words') = 0.363636
+    assert similarity("word", "two words") == pytest.approx(4 / 11)
+    assert similarity("", "anything") == 0.0
+
+
+def test_dated_query_uses_meeting_dates(index: FomcIndex) -> None:
+    rows, dates = index.search("january 2010 meeting")
+    assert str(dates) == "2010-01-01..2010-01-31"
+    assert [r["id"] for r in rows] == [1]
+    assert rows[0]["location"]["pdfUrl"] == ["https://fraser.stlouisfed.org/1.pdf"]
+
+    rows, dates = index.search("forecast errors april 9, 2014")
+    assert (str(dates), [r["id"] for r in rows]) == ("2014-04-09", [5])
+
+
+def test_title_query_ranks_by_trigram_similarity(index: FomcIndex) -> None:
+    rows, dates = index.search("unscheduled meeting")
+    assert dates is None
+    assert rows[0]["id"] == 4
+
+    # Nothing in 1999, so the dated query falls back to titles.
+    rows, dates = index.search("telephone conference 1999")
+    assert dates is None
+    assert [r["id"] for r in rows] == [3]
+
+    assert index.search("beige book", threshold=0.3) == ([], None)
+
+
+def test_add_only_rewrites_changed_items(index: FomcIndex) -> None:
+    assert index.add(RECORDS) == 0
+    renamed = _record(2, "Meeting, March 16-17, 2010")
+    assert index.add([renamed]) == 1
+    assert len(index) == len(RECORDS)
+    rows, _ = index.search("March 17, 2010")
+    assert [r["title"] for r in rows] == ["Meeting, March 16-17, 2010"]
+
+
+def test_fraser_tool_sqlite_backend(
+    index: FomcIndex, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FRASER_BACKEND", "sqlite")
+    monkeypatch.setattr(fraser_tool, "get_fomc_index", lambda: index)
+
+    payload = asyncio.run(
+        fraser_tool.asearch_fomc_titles("Meeting, January 26-27, 2010")
+    )
+    assert payload["results"] == [
+        {
+            "id": 1,
+            "title": "Meeting, January 26-27, 2010",
+            "pdf_urls": ["https://fraser.stlouisfed.org/1.pdf"],
+        }
+    ]
+    assert payload["date_range"] == "2010-01-26..2010-01-27"
+
+    monkeypatch.setattr(fraser_tool, "get_fomc_index", lambda: FomcIndex(":memory:"))
+    assert fraser_tool.search_fomc_titles("march 2010")["error"] == "empty_index"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any
+
+from retrieval_graph.fraser_ingest import (
+    COLUMNS,
+    content_hash,
+    ingest,
+    iter_title_items,
+)
+from tests.unit_tests.fake_fred import FakeFredServer
+from tests.unit_tests.fake_pg import FakeConnection
+
+
+def _record(item_id: int, title: str) -> dict[str, Any]:
+    return {
+        "titleInfo": [{"title": title}],
+        "originInfo": {"sortDate": "2010-01-27"},
+        "location": {"pdfUrl": [f"https://fraser.stlouisfed.org/{item_id}.pdf"]},
+        "recordInfo": {"recordIdentifier": [item_id]},
+    }
+
+
+RECORDS = [_record(i, f"Meeting, January {i}, 2010") for i in range(1, 6)]
+
+
+def test_iter_title_items_pages_through_the_api() -> None:
+    def items(params: dict[str, str]) -> dict[str, Any]:
+        page, limit = int(params["page"]), int(params["limit"])
+        chunk = RECORDS[(page - 1) * limit : page * limit]
+        return {"total": len(RECORDS), "page": page, "records": chunk}
+
+    with FakeFredServer({"title/677/items": items}) as fake:
+        records = list(
+            iter_title_items(677, api_key="k", page_size=2, base_url=fake.base_url)
+        )
+
+    assert records == RECORDS
+    assert [params["page"] for _, params in fake.requests] == ["1", "2", "3"]
+    assert fake.requests[0][1]["fields"] == "titleInfo!originInfo!location!recordInfo"
+
+
+def test_ingest_copies_batches_and_merges_by_hash() -> None:
+    conn = FakeConnection()
+    # Each batch: one new row, one changed row (the rest unchanged).
+    conn.responses["WITH merged"] = [(1, 1)]
+    no_id = {"titleInfo": [{"title": "Orphan"}], "recordInfo": {}}
+
+    stats = ingest(conn, [*RECORDS[:2], no_id, *RECORDS[2:]], batch_size=3)
+
+    assert (stats.seen, stats.skipped, stats.batches) == (6, 1, 2)
+    assert (stats.inserted, stats.updated, stats.unchanged) == (2, 2, 1)
+    assert conn.commits == 2
+    assert sum("TRUNCATE fomc_items_staging" in q for q in conn.queries) == 2
+
+    rows = list(csv.reader(io.StringIO(conn.copies[0])))
+    assert len(rows) == 3
+    first = dict(zip(COLUMNS, rows[0]))
+    assert first["id"] == "1"
+    assert json.loads(first["titleInfo"]) == [{"title": "Meeting, January 1, 2010"}]
+    assert (first["meeting_start"], first["meeting_end"]) == ("2010-01-01",) * 2
+    assert first["content_hash"] == content_hash(RECORDS[0])
+
+
+def test_content_hash_tracks_content_not_key_order() -> None:
+    record = RECORDS[0]
+    reordered = {key: record[key] for key in reversed(list(record))}
+    assert content_hash(reordered) == content_hash(record)
+
+    moved = {**record, "location": {"pdfUrl": ["https://example.org/new.pdf"]}}
+    assert content_hash(moved) != content_hash(record)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+
+from retrieval_graph import fraser_tool
+from retrieval_graph.fraser_schema import MIGRATIONS, apply_migrations
+from retrieval_graph.pg_pool import PgPool
+from tests.unit_tests.fake_pg import Factory, FakeConnection
+
+ROWS = [
+    {
+        "id": 7,
+        "title": "Meeting, January 26-27, 2010",
+        "location": {"pdfUrl": ["https://fraser.stlouisfed.org/x.pdf"]},
+    }
+]
+
+
+@pytest.fixture
+def factory(monkeypatch: pytest.MonkeyPatch) -> Factory:
+    factory = Factory(ROWS)
+    pool = PgPool(factory, min_size=0, max_size=1)
+    monkeypatch.setenv("FRASER_BACKEND", "postgres")
+    monkeypatch.setattr(fraser_tool, "get_pg_pool", lambda: pool)
+    return factory
+
+
+def test_title_search_uses_trigram_operators_with_threshold(factory: Factory) -> None:
+    payload = fraser_tool.search_fomc_titles("beige book meeting", limit=3)
+
+    assert [r["id"] for r in payload["results"]] == [7]
+    conn = factory.made[0]
+    set_threshold, search = conn.queries
+    assert "pg_trgm.similarity_threshold" in set_threshold
+    assert conn.params[0] == (str(fraser_tool.TITLE_SIMILARITY_THRESHOLD),)
+    # Index-friendly predicates on the stored column, not similarity() per row.
+    assert "WHERE title %% %(query)s" in search
+    assert "ORDER BY title <-> %(query)s" in search
+    assert "similarity(" not in search
+    assert conn.params[1] == {"query": "beige book meeting", "limit": 3}
+
+
+def test_dated_query_uses_meeting_date_range(factory: Factory) -> None:
+    factory.responses["meeting_start BETWEEN"] = ROWS
+
+    payload = fraser_tool.search_fomc_titles("January 26-27, 2010 meeting")
+
+    assert payload["date_range"] == "2010-01-26..2010-01-27"
+    assert [r["id"] for r in payload["results"]] == [7]
+    (lookup,) = factory.made[0].queries
+    assert "meeting_end >=" in lookup
+    params = factory.made[0].params[0]
+    assert (str(params["start"]), str(params["end"])) == ("2010-01-26", "2010-01-27")
+
+
+def test_dated_query_falls_back_to_title_similarity(factory: Factory) -> None:
+    factory.responses["meeting_start BETWEEN"] = []
+
+    payload = fraser_tool.search_fomc_titles("FOMC minutes september 1987")
+
+    assert "date_range" not in payload
+    assert [r["id"] for r in payload["results"]] == [7]
+    assert "title <->" in factory.made[0].queries[-1]
+
+
+def test_title_search_reports_missing_migration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = FakeConnection(ROWS)
+    conn.fail_on = "WHERE title"
+    conn.error = RuntimeError('column "title" does not exist')
+    pool = PgPool(lambda: conn, min_size=0, max_size=1)
+    monkeypatch.setenv("FRASER_BACKEND", "postgres")
+    monkeypatch.setattr(fraser_tool, "get_pg_pool", lambda: pool)
+
+    payload = fraser_tool.search_fomc_titles("beige book")
+
+    assert payload["results"] == []
+    assert "does not exist" in payload["error"]
+
+
+def test_apply_migrations_skips_recorded_ones() -> None:
+    conn = FakeConnection()
+    applied = apply_migrations(conn)
+    assert applied == [m.name for m in MIGRATIONS]
+    assert any("gist_trgm_ops" in q for q in conn.queries)
+
+    rerun = FakeConnection()
+    rerun.responses["FROM fraser_schema_migrations"] = [(m.name,) for m in MIGRATIONS]
+    assert apply_migrations(rerun) == []
+    assert not any("ALTER TABLE" in q for q in rerun.queries)
+
+
+def test_meeting_date_backfill() -> None:
+    conn = FakeConnection()
+    conn.responses["WHERE meeting_start IS NULL"] = [
+        (1, '[{"title": "Meeting, January 26-27, 2010"}]', "{}"),
+        (2, [{"title": "Task Force"}], {"sortDate": "1990-03-09"}),
+        (3, [{"title": "Untitled"}], {}),
+    ]
+    backfill = next(m.backfill for m in MIGRATIONS if m.backfill)
+    with conn.cursor() as cur:
+        backfill(cur)
+
+    updates = [p for q, p in zip(conn.queries, conn.params) if q.startswith("UPDATE")]
+    assert [(str(s), str(e), i) for s, e, i in updates] == [
+        ("2010-01-26", "2010-01-27", 1),
+        ("1990-03-09", "1990-03-09", 2),
+    ]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from retrieval_graph import fred_api, fred_tool
+from retrieval_graph.observation_store import ObservationStore
+from retrieval_graph.release_calendar import ReleaseCalendar
+from tests.unit_tests.fake_fred import FakeFredServer
+
+ROUTES = {
+    "series": lambda p: {
+        "seriess": [
+            {
+                "id": p["series_id"],
+                "title": "Unemployment Rate",
+                "units": "Percent",
+                "frequency": "Monthly",
+            }
+        ]
+    },
+    "series/observations": lambda p: {
+        "observations": [
+            {"date": "2024-03-01", "value": "3.9"},
+            {"date": "2024-02-01", "value": "."},
+            {"date": "2024-01-01", "value": "3.7"},
+        ]
+    },
+    "series/release": lambda p: {
+        "releases": [{"id": 50, "name": "Employment Situation"}]
+    },
+    "release/dates": lambda p: {
+        "release_dates": [
+            {"release_id": 50, "date": "2024-12-06"},
+            {"release_id": 50, "date": "2025-01-10"},
+            {"release_id": 50, "date": "2025-02-07"},
+        ]
+    },
+    "series/search": lambda p: {
+        "seriess": [{"id": "UNRATE", "title": p["search_text"]}]
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_release_caches() -> None:
+    fred_tool._search_cache.clear()
+    fred_tool._chart_cache.clear()
+
+
+@pytest.fixture
+def fake_fred(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeFredServer]:
+    with FakeFredServer(ROUTES) as server:
+        client = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+        fred_api.set_async_fred_client(client)
+        calendar = ReleaseCalendar()
+        monkeypatch.setattr(fred_tool, "get_release_calendar", lambda: calendar)
+        try:
+            yield server
+        finally:
+            fred_api.run_sync(client.aclose())
+            fred_api.set_async_fred_client(None)
+
+
+def test_series_release_schedule_keeps_payload_shape(fake_fred: FakeFredServer) -> None:
+    payload = fred_tool.fetch_series_release_schedule("UNRATE")
+
+    assert payload["release_info"] == {"id": 50, "name": "Employment Situation"}
+    assert payload["release_year"] == 2025
+    assert [d["date"] for d in payload["release_schedule"]] == [
+        "2025-01-10",
+        "2025-02-07",
+    ]
+    assert fake_fred.requests[0][1]["api_key"] == "test-key"
+
+
+def test_series_release_schedule_is_served_from_local_index(
+    fake_fred: FakeFredServer,
+) -> None:
+    fred_tool.fetch_series_release_schedule("UNRATE")
+    calls = len(fake_fred.requests)
+
+    payload = fred_tool.fetch_series_release_schedule("UNRATE")
+
+    assert len(fake_fred.requests) == calls
+    assert payload["release_schedule"][0] == {
+        "release_id": 50,
+        "release_name": "Employment Situation",
+        "date": "2025-01-10",
+    }
+
+
+def test_snapshot_skips_missing_values(fake_fred: FakeFredServer) -> None:
+    snapshot = fred_tool.FredClient().get_series_snapshot("UNRATE")
+
+    assert snapshot.title == "Unemployment Rate"
+    assert snapshot.observations == [
+        {"date": "2024-01-01", "value": 3.7},
+        {"date": "2024-03-01", "value": 3.9},
+    ]
+
+
+def test_connections_are_reused_across_calls(fake_fred: FakeFredServer) -> None:
+    for i in range(3):
+        assert fred_tool.search_series(f"jobs {i}")["results"][0]["id"] == "UNRATE"
+        fred_tool.fetch_series_release_schedule("UNRATE")
+
+    assert len(fake_fred.requests) == 5
+    assert len(fake_fred.client_ports) == 1
+
+
+def test_upstream_errors_become_error_payloads(fake_fred: FakeFredServer) -> None:
+    payload = fred_tool.fetch_release_structure_by_name("H.4.1")
+
+    assert payload["release"] is None
+    assert "404" in payload["error"]
+
+
+def test_search_results_are_cached(fake_fred: FakeFredServer) -> None:
+    first = fred_tool.search_series("Jobs  report")
+    second = fred_tool.search_series("jobs report")
+
+    assert first == second
+    assert fake_fred.endpoint_calls("series/search") == 1
+
+
+def test_batch_recent_data_is_columnar_and_served_from_store(
+    fake_fred: FakeFredServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = fred_tool.FredClient(store=ObservationStore(tmp_path / "obs.sqlite"))
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: client)
+
+    payload = fred_tool.fetch_recent_data_batch(["UNRATE", "PAYEMS"], latest_points=2)
+
+    (block,) = payload["series_data"]
+    assert block["dates"] == ["2024-01-01", "2024-03-01"]
+    assert [s["series_id"] for s in block["series"]] == ["UNRATE", "PAYEMS"]
+    assert block["series"][0]["values"] == [3.7, 3.9]
+    assert fake_fred.endpoint_calls("series/observations") == 2
+    assert len(fake_fred.client_ports) <= 2
+
+    calls = len(fake_fred.requests)
+    fred_tool.fetch_recent_data_batch(["PAYEMS", "UNRATE"])
+    assert len(fake_fred.requests) == calls
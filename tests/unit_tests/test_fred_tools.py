@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from retrieval_graph import fred_tool
+from retrieval_graph.blob_store import BlobStore
+from retrieval_graph.chart_renderer import ChartRenderer, ChartSeries, render_chart
 
 
 @dataclass
@@ -23,10 +27,19 @@ class _StubClient:
         return self.snapshot
 
 
+@pytest.fixture
+def blob_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> BlobStore:
+    store = BlobStore(tmp_path / "blobs")
+    monkeypatch.setattr(fred_tool, "get_blob_store", lambda: store)
+    return store
+
+
 @pytest.fixture(autouse=True)
 def clear_fred_client_cache() -> None:
     """Ensure cached client does not leak between tests."""
     fred_tool.get_fred_client.cache_clear()
+    fred_tool._chart_cache.clear()
+    fred_tool._search_cache.clear()
 
 
 def _make_snapshot(count: int = 6) -> fred_tool.SeriesSnapshot:
@@ -43,10 +56,13 @@ def _make_snapshot(count: int = 6) -> fred_tool.SeriesSnapshot:
     )
 
 
-def test_fetch_chart_returns_attachment(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_fetch_chart_returns_attachment(
+    monkeypatch: pytest.MonkeyPatch, blob_store: BlobStore
+) -> None:
     snapshot = _make_snapshot()
     stub = _StubClient(snapshot=snapshot)
     monkeypatch.setattr(fred_tool, "get_fred_client", lambda: stub)
+    monkeypatch.setattr(fred_tool, "CHART_BACKEND", "fred")
     monkeypatch.setattr(
         fred_tool,
         "_download_chart_image",
@@ -58,13 +74,55 @@ def test_fetch_chart_returns_attachment(monkeypatch: pytest.MonkeyPatch) -> None
     assert "message" in payload
     attachments = payload.get("attachments")
     assert isinstance(attachments, list)
-    assert attachments and attachments[0]["source"].startswith("data:image/png;base64")
+    assert attachments and attachments[0]["media_type"] == "image/png"
+    assert "source" not in attachments[0]
+    digest = attachments[0]["blob"]
+    assert attachments[0]["url"] == f"/attachments/{digest}"
+    assert blob_store.read(digest) == b"FAKE_IMAGE_BYTES"
     assert attachments[0]["series_id"] == "TEST_SERIES"
     assert attachments[0]["title"] == "Test Series"
     assert attachments[0]["chart_url"] == "https://example/chart.png"
 
 
-def test_fetch_recent_data_respects_latest_points(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_fetch_chart_renders_locally(
+    monkeypatch: pytest.MonkeyPatch, blob_store: BlobStore
+) -> None:
+    stub = _StubClient(snapshot=_make_snapshot())
+    renderer = ChartRenderer(executor=ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: stub)
+    monkeypatch.setattr(fred_tool, "CHART_BACKEND", "local")
+    monkeypatch.setattr(fred_tool, "get_chart_renderer", lambda: renderer)
+    try:
+        payload = fred_tool.fetch_chart("TEST_SERIES", observation_start="2024-03-01")
+        fred_tool._chart_cache.clear()
+        again = fred_tool.fetch_chart("TEST_SERIES", observation_start="2024-03-01")
+    finally:
+        renderer.shutdown()
+
+    attachment = payload["attachments"][0]
+    assert attachment["chart_url"] is None
+    assert blob_store.read(attachment["blob"]).startswith(b"\x89PNG")
+    # Same data and range: served from the renderer's cache, byte-identical.
+    assert again["attachments"][0]["blob"] == attachment["blob"]
+    assert len(blob_store) == 1
+    assert len(renderer._cache) == 1
+
+
+def test_render_chart_overlays_series() -> None:
+    series = [
+        ChartSeries("A", "Series A", "Index", ("2024-01-01", "2024-02-01"), (1.0, 2.0)),
+        ChartSeries("B", "Series B", "Index", ("2024-01-01", "2024-02-01"), (3.0, 1.0)),
+    ]
+
+    svg = render_chart(series, width=400, height=300, fmt="svg")
+
+    assert b"<svg" in svg
+    assert b"Series A" in svg and b"Series B" in svg
+
+
+def test_fetch_recent_data_respects_latest_points(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     snapshot = _make_snapshot(count=8)
     stub = _StubClient(snapshot=snapshot, chart_payload=None)
     monkeypatch.setattr(fred_tool, "get_fred_client", lambda: stub)
@@ -80,3 +138,147 @@ def test_fetch_recent_data_respects_latest_points(monkeypatch: pytest.MonkeyPatc
     assert len(points) == 3
     # Expect final three months in chronological order
     assert [p["date"] for p in points] == ["2024-06-01", "2024-07-01", "2024-08-01"]
+
+
+def test_columnar_datablock_aligns_dates_across_series() -> None:
+    monthly = _make_snapshot(count=3)
+    quarterly = fred_tool.SeriesSnapshot(
+        series_id="QUARTERLY",
+        title="Quarterly",
+        units="Percent",
+        frequency="Quarterly",
+        observations=[{"date": "2024-01-01", "value": 1.5}],
+    )
+
+    block = fred_tool.build_columnar_datablock([monthly, quarterly], latest_points=2)
+
+    assert block["dates"] == ["2024-01-01", "2024-02-01", "2024-03-01"]
+    assert block["series"][0]["values"] == [None, 2.0, 3.0]
+    assert block["series"][1]["values"] == [1.5, None, None]
+
+
+def test_batch_reports_per_series_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _BatchStub:
+        def get_series_snapshots(self, series_ids: list[str], *, limit: int) -> list:
+            return [_make_snapshot(), ValueError("Bad Request")]
+
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: _BatchStub())
+
+    payload = fred_tool.fetch_recent_data_batch(["TEST_SERIES", "NOPE"])
+
+    assert payload["errors"] == {"NOPE": "Bad Request"}
+    assert payload["series_data"][0]["series"][0]["series_id"] == "TEST_SERIES"
+    assert "NOPE: Bad Request" in payload["message"]
+
+
+def test_fetch_series_analytics(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub = _StubClient(snapshot=_make_snapshot(count=6))
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: stub)
+
+    payload = fred_tool.fetch_series_analytics(
+        "TEST_SERIES", transforms=["mom"], observation_start="2024-03-01"
+    )
+
+    analytics = payload["analytics"]
+    assert analytics["observations"] == 4
+    assert analytics["mom"]["latest"] == {"date": "2024-06-01", "value": 20.0}
+
+
+@pytest.mark.parametrize("window", [None, 3])
+def test_fetch_series_analytics_windowed_transforms(
+    monkeypatch: pytest.MonkeyPatch, window: int | None
+) -> None:
+    stub = _StubClient(snapshot=_make_snapshot(count=6))
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: stub)
+
+    payload = fred_tool.fetch_series_analytics("TEST_SERIES", window=window)
+
+    assert "error" not in payload, payload["message"]
+    analytics = payload["analytics"]
+    # Monthly data defaults to a 12-observation window.
+    expected = window or 12
+    assert analytics["rolling_mean"]["window"] == expected
+    assert analytics["zscore"]["window"] == expected
+    assert analytics["peaks_troughs"]["max"] == {"date": "2024-06-01", "value": 6.0}
+    if window:
+        assert analytics["rolling_mean"]["latest"] == {
+            "date": "2024-06-01",
+            "value": 5.0,
+        }
+        assert analytics["peaks_troughs"]["window_min"] == {
+            "date": "2024-04-01",
+            "value": 4.0,
+        }
+
+
+def test_snapshot_is_array_backed() -> None:
+    snapshot = fred_tool.SeriesSnapshot.from_pairs(
+        "DGS10",
+        title="10-Year Treasury",
+        units="Percent",
+        frequency="Daily",
+        pairs=[("2024-01-02", 3.95), ("2024-01-03", 3.91), ("2024-01-04", 3.99)],
+    )
+
+    assert not hasattr(snapshot, "__dict__")
+    assert snapshot.ordinals.typecode == "i" and snapshot.values.typecode == "d"
+    assert snapshot.between("2024-01-03").dates == ["2024-01-03", "2024-01-04"]
+    assert snapshot.tail(1).observations == [{"date": "2024-01-04", "value": 3.99}]
+    assert snapshot.tail(0).observations == []
+    assert snapshot.latest(2) == snapshot.between("2024-01-03", "2024-01-04").latest(5)
+
+
+def test_snapshot_accepts_observation_generator() -> None:
+    observations = ({"date": f"2024-0{m}-01", "value": float(m)} for m in (1, 2, 3))
+    snapshot = fred_tool.SeriesSnapshot(
+        "TEST", "Test", "Index", "Monthly", observations=observations
+    )
+
+    assert snapshot.dates == ["2024-01-01", "2024-02-01", "2024-03-01"]
+    assert list(snapshot.values) == [1.0, 2.0, 3.0]
+
+
+def test_fetch_recent_data_range_is_downsampled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pairs = [
+        (f"{2000 + i // 12}-{i % 12 + 1:02d}-01", float(i % 24)) for i in range(240)
+    ]
+    snapshot = fred_tool.SeriesSnapshot.from_pairs(
+        "UNRATE", "Unemployment Rate", "Percent", "Monthly", pairs
+    )
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: _StubClient(snapshot))
+
+    payload = fred_tool.fetch_recent_data(
+        "UNRATE",
+        observation_start="2005-01-01",
+        observation_end="2014-12-01",
+        max_points=40,
+    )
+
+    (block,) = payload["series_data"]
+    assert len(block["points"]) <= 40
+    assert block["points"][0]["date"] == "2005-01-01"
+    assert block["points"][-1]["date"] == "2014-12-01"
+    assert block["downsampled"] == {"method": "lttb", "original_points": 120}
+    assert max(p["value"] for p in block["points"]) == 23.0
+
+
+@pytest.mark.parametrize("max_points", [1, 2, 10_000])
+def test_fetch_recent_data_clamps_max_points(
+    monkeypatch: pytest.MonkeyPatch, max_points: int
+) -> None:
+    pairs = [(f"{2000 + i // 12}-{i % 12 + 1:02d}-01", float(i)) for i in range(300)]
+    snapshot = fred_tool.SeriesSnapshot.from_pairs(
+        "UNRATE", "Unemployment Rate", "Percent", "Monthly", pairs
+    )
+    monkeypatch.setattr(fred_tool, "get_fred_client", lambda: _StubClient(snapshot))
+
+    payload = fred_tool.fetch_recent_data(
+        "UNRATE", observation_start="2000-01-01", max_points=max_points
+    )
+
+    (block,) = payload["series_data"]
+    expected = min(max(max_points, 3), fred_tool.DEFAULT_MAX_POINTS)
+    assert len(block["points"]) == expected
+    assert block["downsampled"]["original_points"] == 300
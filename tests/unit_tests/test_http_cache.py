@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+from retrieval_graph import fred_api
+from retrieval_graph.http_cache import (
+    DegradedResponse,
+    ResponseCache,
+    record_degraded,
+    track_degraded,
+)
+from retrieval_graph.tools import ToolRegistry
+from tests.unit_tests.fake_fred import FakeFredServer
+
+DATES = {"release_dates": [{"release_id": 50, "date": "2025-01-10"}]}
+
+
+def test_cache_keys_ignore_credentials_and_evict_lru(tmp_path: Path) -> None:
+    cache = ResponseCache(
+        tmp_path / "http.sqlite",
+    )
+    key = cache.key("release/dates", {"api_key": "a", "release_id": 50})
+    assert key == cache.key("/release/dates", {"release_id": "50", "api_key": "b"})
+    assert cache.ttl_for("series/observations") is None
+
+    payload = {"notes": "a" * 100}
+    cache.put("a", "releases", payload, now=1.0)
+    entry_bytes = cache.total_bytes
+    cache.max_bytes = entry_bytes * 2 + entry_bytes // 2
+    cache.put("b", "releases", {"notes": "b" * 100}, now=2.0)
+    assert cache.get("a", now=3.0) is not None
+    cache.put("c", "releases", {"notes": "c" * 100}, now=4.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a").payload == payload  # type: ignore[union-attr]
+    assert len(cache) == 2
+
+
+def _client(server: FakeFredServer, cache: ResponseCache) -> fred_api.AsyncFredClient:
+    return fred_api.AsyncFredClient(
+        "test-key", base_url=server.base_url, response_cache=cache
+    )
+
+
+def test_fresh_hits_skip_network_and_stale_entries_revalidate(tmp_path: Path) -> None:
+    cache = ResponseCache(
+        tmp_path / "http.sqlite", ttls={"release/dates": 60}, max_stale_seconds=3600
+    )
+    with FakeFredServer({"release/dates": lambda p: DATES}) as server:
+        client = _client(server, cache)
+        key = cache.key("release/dates", {"release_id": 50})
+        old = {"release_dates": []}
+        cache.put(key, "release/dates", old, now=time.time() - 120)
+
+        async def main() -> list[dict[str, Any]]:
+            stale = await client.get_json("release/dates", release_id=50)
+            await asyncio.gather(*client._background)
+            fresh = await client.get_json("release/dates", release_id=50)
+            await client.aclose()
+            return [stale, fresh]
+
+        stale, fresh = asyncio.run(main())
+
+    assert stale == old
+    assert fresh == DATES
+    assert server.endpoint_calls("release/dates") == 1
+
+
+def test_upstream_failure_serves_flagged_stale_response(tmp_path: Path) -> None:
+    cache = ResponseCache(
+        tmp_path / "http.sqlite", ttls={"release/dates": 60}, max_stale_seconds=60
+    )
+    with FakeFredServer(
+        {"release/dates": lambda p: (503, {"error_message": "down"})}
+    ) as server:
+        client = _client(server, cache)
+        key = cache.key("release/dates", {"release_id": 50})
+        fetched_at = time.time() - 7200
+        cache.put(key, "release/dates", DATES, now=fetched_at)
+
+        async def main() -> dict[str, Any]:
+            try:
+                return await client.get_json("release/dates", release_id=50)
+            finally:
+                await client.aclose()
+
+        with track_degraded() as degraded:
+            payload = asyncio.run(main())
+
+    assert payload == DATES
+    assert [(e.endpoint, e.fetched_at) for e in degraded] == [
+        ("release/dates", fetched_at)
+    ]
+
+
+def test_registry_flags_degraded_outcomes() -> None:
+    registry = ToolRegistry(max_workers=1)
+
+    @registry.tool(
+        name="lookup",
+        description="Test tool.",
+        parameters={"q": {"type": "string"}},
+        missing_argument_message="q is required.",
+    )
+    def lookup(args: dict[str, Any], config: Any) -> dict[str, Any]:
+        record_degraded(DegradedResponse("series/search", 0.0, "503"))
+        return {"content": "results"}
+
+    outcome = asyncio.run(registry.invoke("lookup", {"q": "x"}, {}))
+
+    assert outcome["content"].startswith("[Degraded: FRED is unavailable")
+    assert outcome["content"].endswith("\nresults")
+    assert outcome["degraded"][0]["endpoint"] == "series/search"
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from retrieval_graph import fred_api, fred_tool
+from retrieval_graph.observation_store import ObservationStore, revision_window_start
+from tests.unit_tests.fake_fred import FakeFredServer
+
+UPSTREAM: dict[str, Any] = {}
+
+
+def _observations(params: dict[str, str]) -> dict[str, Any]:
+    start = params.get("observation_start", "")
+    return {"observations": [o for o in UPSTREAM["observations"] if o["date"] >= start]}
+
+
+ROUTES = {
+    "series": lambda p: {
+        "seriess": [
+            {
+                "id": p["series_id"],
+                "title": "Payrolls",
+                "units": "Thousands of Persons",
+                "frequency": "Monthly",
+                "last_updated": UPSTREAM["last_updated"],
+            }
+        ]
+    },
+    "series/observations": _observations,
+}
+
+
+@pytest.fixture
+def fake_fred() -> Iterator[FakeFredServer]:
+    UPSTREAM.update(
+        last_updated="2024-02-02 07:51:02-06",
+        observations=[
+            {"date": "2024-01-01", "value": "157000"},
+            {"date": "2024-02-01", "value": "157200"},
+        ],
+    )
+    with FakeFredServer(ROUTES) as server:
+        client = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+        fred_api.set_async_fred_client(client)
+        try:
+            yield server
+        finally:
+            fred_api.run_sync(client.aclose())
+            fred_api.set_async_fred_client(None)
+
+
+def test_store_serves_locally_and_refreshes_incrementally(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    store = ObservationStore(tmp_path / "obs.sqlite")
+    client = fred_tool.FredClient(store=store)
+
+    first = client.get_series_snapshot("PAYEMS")
+    assert [o["value"] for o in first.observations] == [157000.0, 157200.0]
+    assert fake_fred.endpoint_calls("series/observations") == 1
+
+    # Within the recheck window nothing touches the network.
+    started = time.perf_counter()
+    client.get_series_snapshot("PAYEMS", limit=1)
+    assert time.perf_counter() - started < 0.001
+    assert len(fake_fred.requests) == 2
+
+    # Unchanged last_updated: metadata check only.
+    store.invalidate("PAYEMS")
+    client.get_series_snapshot("PAYEMS")
+    assert fake_fred.endpoint_calls("series") == 2
+    assert fake_fred.endpoint_calls("series/observations") == 1
+
+    # New release: only the revision window before the last stored date
+    # onward is requested.
+    UPSTREAM["last_updated"] = "2024-03-08 07:48:03-06"
+    UPSTREAM["observations"].append({"date": "2024-03-01", "value": "157500"})
+    store.invalidate("PAYEMS")
+    latest = client.get_series_snapshot("PAYEMS", limit=2)
+    assert [o["date"] for o in latest.observations] == ["2024-02-01", "2024-03-01"]
+    assert fake_fred.requests[-1] == (
+        "series/observations",
+        {
+            "api_key": "test-key",
+            "file_type": "json",
+            "series_id": "PAYEMS",
+            "observation_start": "2023-08-01",
+        },
+    )
+
+
+def test_refresh_picks_up_revisions_to_earlier_observations(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    store = ObservationStore(tmp_path / "obs.sqlite")
+    client = fred_tool.FredClient(store=store)
+    client.get_series_snapshot("PAYEMS")
+
+    # The next release revises January and posts March.
+    UPSTREAM["last_updated"] = "2024-03-08 07:48:03-06"
+    UPSTREAM["observations"] = [
+        {"date": "2024-01-01", "value": "156900"},
+        {"date": "2024-02-01", "value": "157200"},
+        {"date": "2024-03-01", "value": "157500"},
+    ]
+    store.invalidate("PAYEMS")
+    revised = client.get_series_snapshot("PAYEMS")
+
+    assert [o["value"] for o in revised.observations] == [156900.0, 157200.0, 157500.0]
+    reopened = ObservationStore(tmp_path / "obs.sqlite").snapshot("PAYEMS")
+    assert reopened is not None
+    assert reopened.observations[0]["value"] == 156900.0
+
+
+@pytest.mark.parametrize(
+    ("last_date", "frequency", "expected"),
+    [
+        ("2024-02-01", "Monthly", "2023-08-01"),
+        ("2024-01-01", "Quarterly", "2022-07-01"),
+        ("2024-03-15", "Weekly, Ending Friday", "2024-02-02"),
+        ("2024-03-15", "Daily", "2024-03-09"),
+        (None, "Monthly", None),
+    ],
+)
+def test_revision_window_start(
+    last_date: str | None, frequency: str, expected: str | None
+) -> None:
+    assert revision_window_start(last_date, frequency) == expected
+
+
+def test_store_persists_across_instances(
+    fake_fred: FakeFredServer, tmp_path: Path
+) -> None:
+    path = tmp_path / "obs.sqlite"
+    fred_tool.FredClient(store=ObservationStore(path)).get_series_snapshot("PAYEMS")
+
+    reopened = ObservationStore(path)
+    snapshot = reopened.snapshot("PAYEMS")
+
+    assert snapshot is not None
+    assert snapshot.title == "Payrolls"
+    assert len(snapshot.observations) == 2
+    assert reopened.is_fresh("PAYEMS")
+
+
+def test_snapshot_cache_is_bounded_lru(tmp_path: Path) -> None:
+    store = ObservationStore(tmp_path / "obs.sqlite", max_snapshots=2)
+    for series_id in ("A", "B", "C"):
+        store.apply_refresh(series_id, {"title": series_id}, [("2024-01-01", 1.0)])
+
+    a = store.snapshot("A")
+    store.snapshot("B")
+    assert store.snapshot("A") is a  # A is now more recently used than B
+    store.snapshot("C")
+
+    assert list(store._snapshots) == ["A", "C"]
+    reloaded = store.snapshot("B")
+    assert reloaded is not None and len(reloaded.observations) == 1
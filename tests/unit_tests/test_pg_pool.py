@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from retrieval_graph import fraser_tool
+from retrieval_graph.pg_pool import PgPool, PoolTimeout
+from tests.unit_tests.fake_pg import Factory
+
+
+def test_connections_are_reused_and_bounded() -> None:
+    factory = Factory()
+    pool = PgPool(factory, min_size=2, max_size=3, acquire_timeout=0.05)
+
+    for _ in range(10):
+        with pool.connection():
+            pass
+    assert len(factory.made) == 2
+
+    held = [pool.getconn() for _ in range(3)]
+    assert len(factory.made) == 3
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+    # A returned connection wakes a waiting caller.
+    got: list[Any] = []
+    waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+    pool.acquire_timeout = 2
+    waiter.start()
+    pool.putconn(held[0])
+    waiter.join()
+    assert got == [held[0]]
+    assert pool.stats()["size"] == 3
+
+
+def test_health_check_replaces_dead_idle_connection() -> None:
+    factory = Factory()
+    pool = PgPool(factory, min_size=1, max_size=1, healthcheck_seconds=0)
+
+    with pool.connection() as first:
+        pass
+    first.dead = True
+
+    with pool.connection() as second:
+        assert second is not first
+    assert first.closed
+    assert pool.stats()["discarded"] == 1
+    assert len(factory.made) == 2
+
+
+@pytest.mark.parametrize("interrupt", [KeyboardInterrupt, asyncio.CancelledError])
+def test_interrupted_connection_is_discarded_not_leaked(
+    interrupt: type[BaseException],
+) -> None:
+    factory = Factory()
+    pool = PgPool(factory, min_size=0, max_size=1, acquire_timeout=0.05)
+
+    with pytest.raises(interrupt):
+        with pool.connection() as conn:
+            raise interrupt()
+
+    assert conn.closed
+    assert pool.stats()["size"] == 0
+    with pool.connection() as replacement:
+        assert replacement is not conn
+
+
+def test_connection_broken_in_use_is_discarded() -> None:
+    factory = Factory()
+    pool = PgPool(factory, min_size=0, max_size=1)
+
+    with pytest.raises(ConnectionError):
+        with pool.connection() as conn:
+            conn.dead = True
+            conn.cursor().execute("SELECT 1")
+
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert pool.stats() == {
+        "size": 1,
+        "idle": 1,
+        "created": 2,
+        "discarded": 1,
+        "waits": 0,
+    }
+
+
+def test_search_fomc_titles_uses_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        {
+            "id": 7,
+            "title": "Meeting, January 26-27, 2010",
+            "location": {"pdfUrl": ["https://fraser.stlouisfed.org/x.pdf"]},
+        }
+    ]
+    factory = Factory(rows)
+    pool = PgPool(factory, min_size=1, max_size=2)
+    monkeypatch.setenv("FRASER_BACKEND", "postgres")
+    monkeypatch.setattr(fraser_tool, "get_pg_pool", lambda: pool)
+    monkeypatch.setattr(fraser_tool, "asyncpg_available", lambda: False)
+
+    payload = asyncio.run(fraser_tool.asearch_fomc_titles("january 2010"))
+    assert payload["results"] == [
+        {
+            "id": 7,
+            "title": "Meeting, January 26-27, 2010",
+            "pdf_urls": ["https://fraser.stlouisfed.org/x.pdf"],
+        }
+    ]
+    fraser_tool.search_fomc_titles("march 2011")
+    assert len(factory.made) == 1
+
+    factory.made[0].dead = True
+    failed = fraser_tool.search_fomc_titles("june 2012")
+    assert failed["results"] == []
+    assert "closed" in failed["error"]
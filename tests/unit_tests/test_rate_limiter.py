@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from retrieval_graph import fred_api
+from retrieval_graph.rate_limiter import (
+    Priority,
+    SharedRateLimiter,
+    current_priority,
+    request_priority,
+)
+from tests.unit_tests.fake_fred import FakeFredServer
+
+
+def make_limiter(path: Path, **kwargs: float) -> SharedRateLimiter:
+    kwargs.setdefault("rate_per_minute", 60.0)
+    kwargs.setdefault("burst", 4.0)
+    return SharedRateLimiter(path, **kwargs)
+
+
+def test_bucket_is_shared_between_instances(tmp_path: Path) -> None:
+    first = make_limiter(tmp_path / "limit.sqlite")
+    second = make_limiter(tmp_path / "limit.sqlite")
+
+    now = 1000.0
+    assert first.try_acquire(Priority.INTERACTIVE, now=now) == 0.0
+    assert second.try_acquire(Priority.INTERACTIVE, now=now) == 0.0
+    assert first.try_acquire(Priority.INTERACTIVE, now=now) == 0.0
+    assert second.try_acquire(Priority.INTERACTIVE, now=now) == 0.0
+    wait = first.try_acquire(Priority.INTERACTIVE, now=now)
+    assert wait == pytest.approx(1.0)
+
+    # One token per second refills.
+    assert second.try_acquire(Priority.INTERACTIVE, now=now + 1.0) == 0.0
+
+
+def test_lower_priorities_leave_reserve(tmp_path: Path) -> None:
+    limiter = make_limiter(tmp_path / "limit.sqlite", burst=10.0)
+    now = 1000.0
+
+    crawl = 0
+    while limiter.try_acquire(Priority.CRAWL, now=now) == 0.0:
+        crawl += 1
+    background = 0
+    while limiter.try_acquire(Priority.BACKGROUND, now=now) == 0.0:
+        background += 1
+    interactive = 0
+    while limiter.try_acquire(Priority.INTERACTIVE, now=now) == 0.0:
+        interactive += 1
+
+    assert (crawl, background, interactive) == (5, 2, 3)
+
+
+def test_waiting_interactive_request_blocks_lower_classes(tmp_path: Path) -> None:
+    limiter = make_limiter(tmp_path / "limit.sqlite", burst=1.0, reserve=(0, 0, 0))
+    now = 1000.0
+    assert limiter.try_acquire(Priority.INTERACTIVE, now=now) == 0.0
+    assert limiter.try_acquire(Priority.INTERACTIVE, waiter="user", now=now) > 0
+
+    # A token refills, but the crawl must yield to the waiting user request.
+    assert limiter.try_acquire(Priority.CRAWL, now=now + 1.5) > 0
+    assert limiter.try_acquire(Priority.INTERACTIVE, waiter="user", now=now + 1.5) == 0
+    assert limiter.try_acquire(Priority.CRAWL, now=now + 3.0) == 0.0
+
+
+def test_priority_context_and_timeout(tmp_path: Path) -> None:
+    limiter = make_limiter(tmp_path / "limit.sqlite", burst=1.0, rate_per_minute=1.0)
+    assert current_priority() is Priority.INTERACTIVE
+    with request_priority(Priority.CRAWL):
+        assert current_priority() is Priority.CRAWL
+    assert current_priority() is Priority.INTERACTIVE
+
+    limiter.acquire()
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.05)
+    with pytest.raises(TimeoutError):
+        asyncio.run(limiter.aacquire(timeout=0.05))
+
+
+def test_client_backs_off_and_retries_after_429(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    attempts: list[int] = []
+
+    def series(params: dict[str, str]) -> object:
+        attempts.append(1)
+        if len(attempts) == 1:
+            return 429, {"error_message": "Too Many Requests"}
+        return {"seriess": [{"id": params["series_id"], "title": "Unemployment"}]}
+
+    monkeypatch.setattr(fred_api, "DEFAULT_RETRY_AFTER_SECONDS", 0.05)
+    limiter = make_limiter(tmp_path / "limit.sqlite", rate_per_minute=6000.0)
+    with FakeFredServer({"series": series}) as server:
+        client = fred_api.AsyncFredClient(
+            "test-key", base_url=server.base_url, rate_limiter=limiter
+        )
+
+        async def fetch() -> dict[str, object]:
+            try:
+                return await client.series("UNRATE")
+            finally:
+                await client.aclose()
+
+        record = asyncio.run(fetch())
+
+    assert record["id"] == "UNRATE"
+    assert len(attempts) == 2
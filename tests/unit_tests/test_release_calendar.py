@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from retrieval_graph import fred_api
+from retrieval_graph.release_calendar import (
+    RELEASE_RETRY_SECONDS,
+    ReleaseAwareCache,
+    ReleaseCalendar,
+    ReleaseRefresher,
+    publication_instant,
+)
+from tests.unit_tests.fake_fred import FakeFredServer
+
+ROUTES = {
+    "series/release": lambda p: {
+        "releases": [{"id": 10, "name": "Consumer Price Index"}]
+    },
+    "release/dates": lambda p: {
+        "release_dates": [
+            {"release_id": 10, "date": "2024-04-10"},
+            {"release_id": 10, "date": "2024-05-15"},
+        ]
+    },
+}
+
+APRIL = publication_instant(date(2024, 4, 10))
+MAY = publication_instant(date(2024, 5, 15))
+
+
+@pytest.fixture
+def calendar() -> Iterator[ReleaseCalendar]:
+    with FakeFredServer(ROUTES) as server:
+        client = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+        calendar = ReleaseCalendar(client)
+        calendar.resolve("CPIAUCSL")
+        try:
+            yield calendar
+        finally:
+            fred_api.run_sync(client.aclose())
+
+
+def test_values_stay_current_until_next_publication(calendar: ReleaseCalendar) -> None:
+    cached_at = APRIL + 3600
+
+    assert calendar.release_for("CPIAUCSL") == 10
+    assert calendar.is_current("CPIAUCSL", cached_at, now=MAY - 1) is True
+    assert calendar.is_current("CPIAUCSL", cached_at, now=MAY + 1) is False
+    assert calendar.is_current("UNKNOWN", cached_at, now=MAY + 1) is None
+
+
+def test_release_day_rechecks_until_data_lands(calendar: ReleaseCalendar) -> None:
+    checked_at = MAY + 60
+    now = checked_at + RELEASE_RETRY_SECONDS
+
+    assert not calendar.is_current(
+        "CPIAUCSL", checked_at, now=now, last_updated="2024-04-10 07:38:02-05"
+    )
+    assert calendar.is_current(
+        "CPIAUCSL", checked_at, now=now, last_updated="2024-05-15 07:38:02-05"
+    )
+
+
+def test_refresher_invalidates_and_rewarms_at_publication(
+    calendar: ReleaseCalendar,
+) -> None:
+    cache = ReleaseAwareCache("test", calendar=calendar)
+    reloads: list[str] = []
+    cache.put(
+        "chart", "old", ["CPIAUCSL"], loader=lambda: reloads.append("chart"), now=APRIL
+    )
+    attempts: list[float] = []
+
+    def rewarm(series_id: str, published_at: float) -> bool:
+        attempts.append(published_at)
+        return len(attempts) > 1
+
+    refresher = ReleaseRefresher(calendar, rewarm, poll_seconds=3600)
+    refresher._last_tick = MAY - 60
+    assert refresher.tick(now=MAY - 30) == pytest.approx(30)
+    assert cache.get("chart", now=MAY - 30) == "old"
+
+    # First attempt: data not posted yet, so the loader is held back and retried.
+    wait = refresher.tick(now=MAY + 5)
+    assert attempts == [MAY]
+    assert reloads == []
+    assert len(cache) == 0
+    assert wait == pytest.approx(RELEASE_RETRY_SECONDS)
+
+    refresher.tick(now=MAY + 5 + RELEASE_RETRY_SECONDS)
+    assert attempts == [MAY, MAY]
+    assert reloads == ["chart"]
+
+
+def test_date_index_queries_and_persistence(
+    calendar: ReleaseCalendar, tmp_path: Path
+) -> None:
+    assert calendar.next_release_date(10, after=date(2024, 4, 10)) == date(2024, 5, 15)
+    assert calendar.next_release_date(10, after=date(2024, 5, 15)) is None
+    assert calendar.previous_release_date(10, on_or_before=date(2024, 5, 1)) == date(
+        2024, 4, 10
+    )
+    assert calendar.release_dates_between(
+        10, date(2024, 4, 11), date(2024, 12, 31)
+    ) == [date(2024, 5, 15)]
+
+    calendar.path = tmp_path / "index.json"
+    calendar.save()
+    reloaded = ReleaseCalendar(path=calendar.path)
+
+    assert reloaded.release_for("CPIAUCSL") == 10
+    assert reloaded.release_name(10) == "Consumer Price Index"
+    assert reloaded.release_dates(10) == [date(2024, 4, 10), date(2024, 5, 15)]
+
+
+def test_refresher_requeues_series_that_fail_to_resolve(
+    calendar: ReleaseCalendar, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    resolved: list[str] = []
+
+    def flaky_resolve(series_id: str) -> int | None:
+        if series_id == "BROKEN":
+            raise RuntimeError("FRED unavailable")
+        resolved.append(series_id)
+        return 10
+
+    monkeypatch.setattr(calendar, "resolve", flaky_resolve)
+    for series_id in ("BROKEN", "PAYEMS", "UNRATE"):
+        calendar.track(series_id)
+
+    ReleaseRefresher(calendar, lambda s, p: True).tick(now=APRIL + 60)
+
+    assert resolved == ["PAYEMS", "UNRATE"]
+    assert calendar.pending() == ["BROKEN"]
+
+
+def test_refresher_only_rewarms_series_held_locally(calendar: ReleaseCalendar) -> None:
+    # Seeded from a crawled catalog: mapped to the release but never fetched.
+    calendar.seed({"CPILFESL": 10, "CUSR0000SA0": 10})
+    cache = ReleaseAwareCache("test", calendar=calendar)
+    cache.put("core", "old", ["CPILFESL"], now=APRIL)
+    rewarmed: list[str] = []
+
+    def rewarm(series_id: str, published_at: float) -> bool:
+        rewarmed.append(series_id)
+        return True
+
+    refresher = ReleaseRefresher(
+        calendar, rewarm, should_rewarm={"CPIAUCSL"}.__contains__
+    )
+    refresher._last_tick = MAY - 60
+    refresher.tick(now=MAY + 5)
+
+    assert rewarmed == ["CPIAUCSL"]
+    assert len(cache) == 0
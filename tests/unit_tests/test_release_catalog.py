@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pytest
+
+from retrieval_graph import fred_api, fred_tool, release_catalog
+from tests.unit_tests.fake_fred import FakeFredServer
+
+RELEASES = [
+    {"id": 20, "name": "H.4.1 Factors Affecting Reserve Balances"},
+    {"id": 18, "name": "H.15 Selected Interest Rates"},
+    {
+        "id": 22,
+        "name": "H.8 Assets and Liabilities of Commercial Banks in the United States",
+    },
+    {"id": 10, "name": "Consumer Price Index"},
+    {"id": 50, "name": "Employment Situation"},
+]
+
+
+def _releases(params: dict[str, str]) -> dict[str, Any]:
+    offset, limit = int(params["offset"]), int(params["limit"])
+    return {
+        "count": len(RELEASES),
+        "offset": offset,
+        "limit": limit,
+        "releases": RELEASES[offset : offset + limit],
+    }
+
+
+ROUTES = {
+    "releases": _releases,
+    "release/series": lambda p: {"count": 1500, "seriess": [{"id": "WALCL"}]},
+    "release/tables": lambda p: {"name": "H.4.1", "elements": {}},
+}
+
+
+@pytest.fixture
+def fake_fred() -> Iterator[FakeFredServer]:
+    with FakeFredServer(ROUTES) as server:
+        client = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+        fred_api.set_async_fred_client(client)
+        try:
+            yield server
+        finally:
+            fred_api.run_sync(client.aclose())
+            fred_api.set_async_fred_client(None)
+
+
+@pytest.fixture
+def catalog(fake_fred: FakeFredServer) -> release_catalog.ReleaseCatalog:
+    catalog = release_catalog.ReleaseCatalog(page_size=2)
+    catalog.ensure_loaded()
+    return catalog
+
+
+def test_catalog_pages_in_every_release(
+    fake_fred: FakeFredServer, catalog: release_catalog.ReleaseCatalog
+) -> None:
+    assert len(catalog) == len(RELEASES)
+    assert fake_fred.endpoint_calls("releases") == 3
+
+
+@pytest.mark.parametrize(
+    ("query", "release_id"),
+    [
+        ("H.4.1", 20),
+        ("H.41", 20),
+        ("h41", 20),
+        ("H.15", 18),
+        ("H.8", 22),
+        ("employment", 50),
+        ("Consumer Prices Index", 10),
+    ],
+)
+def test_catalog_ranks_release_names(
+    catalog: release_catalog.ReleaseCatalog, query: str, release_id: int
+) -> None:
+    match = catalog.best_match(query)
+
+    assert match is not None
+    assert match["id"] == release_id
+
+
+def test_release_structure_resolves_name_without_listing_releases(
+    fake_fred: FakeFredServer,
+    catalog: release_catalog.ReleaseCatalog,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fred_tool, "get_release_catalog", lambda: catalog)
+    before = fake_fred.endpoint_calls("releases")
+
+    payload = fred_tool.fetch_release_structure_by_name("H.41")
+
+    assert payload["release"]["id"] == 20
+    assert payload["total"] == 0
+    assert fake_fred.endpoint_calls("releases") == before
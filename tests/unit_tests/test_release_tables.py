@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from retrieval_graph import fred_api, fred_tool, release_catalog
+from retrieval_graph.observation_store import ObservationStore
+from retrieval_graph.release_calendar import (
+    ReleaseCalendar,
+    ReleaseRefresher,
+    publication_instant,
+)
+from retrieval_graph.release_tables import ReleaseTableTree
+from tests.unit_tests.fake_fred import FakeFredServer
+
+
+def _element(
+    element_id: int,
+    name: str,
+    parent_id: int | None,
+    line: int,
+    *,
+    series_id: str | None = None,
+    children: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    return {
+        "element_id": element_id,
+        "release_id": 20,
+        "series_id": series_id,
+        "parent_id": parent_id,
+        "line": str(line),
+        "type": "series" if series_id else "section",
+        "name": name,
+        "level": "0",
+        "children": children or [],
+    }
+
+
+NESTED = {
+    "name": "H.4.1",
+    "elements": {
+        "1": _element(
+            1,
+            "Reserve Bank credit",
+            None,
+            1,
+            children=[
+                _element(3, "Securities held outright", 1, 2, series_id="WSHOSHO"),
+                _element(
+                    2,
+                    "Loans",
+                    1,
+                    1,
+                    children=[
+                        _element(4, "Primary credit", 2, 1, series_id="WLCFLPCL")
+                    ],
+                ),
+            ],
+        ),
+        "5": _element(5, "Total assets", None, 2, series_id="WALCL"),
+    },
+}
+
+
+def test_outline_is_depth_limited_and_ordered() -> None:
+    tree = ReleaseTableTree(20)
+    tree.merge(NESTED)
+
+    assert tree.outline(depth=1).outline == (
+        "1 Reserve Bank credit +2\n5 Total assets [WALCL]"
+    )
+    assert tree.outline(depth=2).outline.splitlines() == [
+        "1 Reserve Bank credit",
+        "  2 Loans +1",
+        "  3 Securities held outright [WSHOSHO]",
+        "5 Total assets [WALCL]",
+    ]
+    subtree = tree.outline(2, depth=3)
+    assert subtree.outline == "4 Primary credit [WLCFLPCL]"
+    assert tree.unexpanded(depth=3) == []
+
+
+def test_outline_pages_top_level_items() -> None:
+    tree = ReleaseTableTree(20)
+    tree.merge(NESTED)
+
+    first = tree.outline(1, depth=1, limit=1)
+    second = tree.outline(1, depth=1, offset=first.next_offset or 0, limit=1)
+
+    assert (first.total, first.next_offset) == (2, 1)
+    assert first.outline == "2 Loans +1"
+    assert second.outline == "3 Securities held outright [WSHOSHO]"
+    assert second.next_offset is None
+    with pytest.raises(KeyError):
+        tree.outline(99)
+
+
+def test_drilled_placeholder_is_not_listed_as_a_root() -> None:
+    tree = ReleaseTableTree(20)
+    loans = NESTED["elements"]["1"]["children"][1]
+    tree.merge({"name": "Loans", "elements": loans["children"]}, element_id=2)
+
+    assert tree.children(None) == []
+
+    tree.merge(NESTED)
+    assert [n.element_id for n in tree.children(None)] == [1, 5]
+    assert tree.outline(depth=2).outline.count("2 Loans") == 1
+
+
+def test_copy_is_independent_of_the_original() -> None:
+    tree = ReleaseTableTree(20)
+    tree.merge(LEVELS[None])
+    clone = tree.copy()
+    clone.merge(LEVELS["1"], element_id=1)
+
+    assert len(tree) == 1
+    assert not tree.is_expanded(1)
+    assert tree.outline().outline == "1 Reserve Bank credit +?"
+    assert [n.element_id for n in clone.children(1)] == [2, 3]
+
+
+# FRED variant that returns one level per request.
+LEVELS = {
+    None: {
+        "name": "H.4.1",
+        "elements": {"1": _element(1, "Reserve Bank credit", None, 1)},
+    },
+    "1": {
+        "name": "Reserve Bank credit",
+        "element_id": 1,
+        "elements": {
+            "2": _element(2, "Loans", 1, 1),
+            "3": _element(3, "Securities held outright", 1, 2, series_id="WSHOSHO"),
+        },
+    },
+    "2": {
+        "name": "Loans",
+        "element_id": 2,
+        "elements": {"4": _element(4, "Primary credit", 2, 1, series_id="WLCFLPCL")},
+    },
+}
+
+
+@pytest.fixture
+def fake_fred() -> Iterator[FakeFredServer]:
+    routes = {
+        "releases": lambda p: {
+            "count": 1,
+            "releases": [
+                {"id": 20, "name": "H.4.1 Factors Affecting Reserve Balances"}
+            ],
+        },
+        "release/tables": lambda p: LEVELS[p.get("element_id")],
+    }
+    with FakeFredServer(routes) as server:
+        client = fred_api.AsyncFredClient("test-key", base_url=server.base_url)
+        fred_api.set_async_fred_client(client)
+        try:
+            yield server
+        finally:
+            fred_api.run_sync(client.aclose())
+            fred_api.set_async_fred_client(None)
+
+
+def test_structure_fetches_only_the_levels_it_shows(
+    fake_fred: FakeFredServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    catalog = release_catalog.ReleaseCatalog()
+    monkeypatch.setattr(fred_tool, "get_release_catalog", lambda: catalog)
+    fred_tool._table_cache.clear()
+
+    top = fred_tool.fetch_release_structure_by_name("H.4.1", depth=1)
+    assert top["outline"] == "1 Reserve Bank credit +?"
+    assert fake_fred.endpoint_calls("release/tables") == 1
+
+    drill = fred_tool.fetch_release_structure_by_name("H.4.1", element_id=1)
+    assert drill["outline"].splitlines() == [
+        "2 Loans",
+        "  4 Primary credit [WLCFLPCL]",
+        "3 Securities held outright [WSHOSHO]",
+    ]
+    assert "element 1 (Reserve Bank credit)" in drill["message"]
+    assert fake_fred.endpoint_calls("release/tables") == 3
+
+    fred_tool.fetch_release_structure_by_name("H.4.1", element_id=1)
+    assert fake_fred.endpoint_calls("release/tables") == 3
+
+
+def test_cached_tree_is_tagged_with_all_release_series(
+    fake_fred: FakeFredServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calendar = ReleaseCalendar()
+    monkeypatch.setattr(fred_tool, "get_release_calendar", lambda: calendar)
+    monkeypatch.setattr(fred_tool._table_cache, "calendar", calendar)
+    fred_tool._table_cache.clear()
+
+    fred_tool.get_release_table_tree(20, depth=1)
+    assert len(fred_tool._table_cache) == 0
+
+    tree = fred_tool.get_release_table_tree(20, element_id=1)
+    assert len(fred_tool._table_cache) == 1
+    # One series is left for the refresher; the others are seeded.
+    first, *rest = tree.series_ids()
+    assert calendar.pending() == [first]
+    assert rest and all(calendar.release_for(s) == 20 for s in rest)
+
+    fred_tool._table_cache.invalidate_series(rest[-1])
+    assert len(fred_tool._table_cache) == 0
+
+
+def test_publication_does_not_rewarm_table_series(
+    fake_fred: FakeFredServer, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calendar = ReleaseCalendar()
+    monkeypatch.setattr(fred_tool, "get_release_calendar", lambda: calendar)
+    monkeypatch.setattr(fred_tool._table_cache, "calendar", calendar)
+    fred_tool._table_cache.clear()
+    tree = fred_tool.get_release_table_tree(20, element_id=1)
+    # As if the refresher had resolved the one series left pending.
+    calendar.seed({calendar.pending()[0]: 20})
+    published = publication_instant(date(2024, 5, 16))
+    calendar._set_release_days(20, [date(2024, 5, 16).toordinal()], published)
+    store = ObservationStore(tmp_path / "observations.sqlite")
+    rewarmed: list[str] = []
+
+    refresher = ReleaseRefresher(
+        calendar,
+        lambda series_id, _: rewarmed.append(series_id) or True,
+        should_rewarm=store.holds,
+    )
+    refresher._last_tick = published - 60
+    refresher.tick(now=published + 5)
+
+    assert set(calendar.series_for(20)) == set(tree.series_ids())
+    assert rewarmed == []
+    assert len(fred_tool._table_cache) == 0
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from retrieval_graph.series_analytics import (
+    analyze,
+    annualized_rate,
+    calendar_change,
+    downsample_indices,
+    periods_per_year,
+    rolling_mean,
+)
+
+MONTHS = [f"{2022 + m // 12}-{m % 12 + 1:02d}-01" for m in range(25)]
+VALUES = [100.0 + m for m in range(25)]
+
+
+def test_calendar_changes_use_dates_not_positions() -> None:
+    dates = ["2023-01-01", "2023-02-01", "2024-01-01", "2024-03-01"]
+    values = np.array([100.0, 110.0, 105.0, 99.0])
+
+    yoy = calendar_change(dates, values, months=12, tolerance_days=7)
+    mom = calendar_change(dates, values, months=1, tolerance_days=3)
+
+    assert math.isnan(yoy[0]) and math.isnan(yoy[1])
+    assert yoy[2] == pytest.approx(5.0)
+    # 2024-02 is missing: no month-over-month for March, not a 2-month change.
+    assert math.isnan(mom[3])
+    assert mom[1] == pytest.approx(10.0)
+
+
+def test_rolling_mean_and_annualized_rate() -> None:
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    assert np.allclose(rolling_mean(values, 2)[1:], [1.5, 2.5, 3.5])
+    assert math.isnan(rolling_mean(values, 2)[0])
+
+    quarterly = np.array([100.0, 101.0])
+    rate = annualized_rate(quarterly, periods=1, periods_per_year=4)
+    assert rate[1] == pytest.approx((1.01**4 - 1) * 100)
+
+
+def test_analyze_summarizes_requested_transforms() -> None:
+    summary = analyze(
+        MONTHS,
+        VALUES,
+        frequency="Monthly",
+        transforms=["yoy", "zscore", "peaks_troughs", "drawdown"],
+        points=3,
+    )
+
+    assert summary["latest"] == {"date": "2024-01-01", "value": 124.0}
+    assert summary["yoy"]["latest"]["value"] == pytest.approx(round(12 / 112 * 100, 4))
+    assert len(summary["yoy"]["recent"]) == 3
+    assert summary["zscore"]["window"] == periods_per_year("Monthly") == 12
+    assert summary["peaks_troughs"]["max"]["date"] == "2024-01-01"
+    assert summary["drawdown"]["max_pct"] == 0.0
+
+
+def test_analyze_rejects_unknown_transforms() -> None:
+    with pytest.raises(ValueError, match="Unknown transform"):
+        analyze(MONTHS, VALUES, transforms=["median"])
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsampling_keeps_endpoints_and_extremes(method: str) -> None:
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50.0)
+    y[317] = 5.0
+    y[700] = -5.0
+
+    idx = downsample_indices(x, y, 50, method=method)
+
+    assert len(idx) <= 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    assert 317 in idx and 700 in idx
+
+
+def test_downsampling_short_series_is_identity() -> None:
+    assert list(downsample_indices([1, 2, 3], [1, 2, 3], 10)) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+@pytest.mark.parametrize("threshold", [0, 1, 2, 3])
+def test_tiny_downsampling_thresholds_keep_only_endpoints(
+    method: str, threshold: int
+) -> None:
+    x = np.arange(100, dtype=np.float64)
+    idx = downsample_indices(x, np.sin(x), threshold, method=method)
+    assert len(idx) <= 3
+    assert idx[0] == 0 and idx[-1] == 99
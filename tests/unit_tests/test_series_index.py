@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from retrieval_graph import fred_tool, series_index
+from retrieval_graph.series_index import SeriesIndex
+
+ROWS = [
+    {
+        "series_id": "UNRATE",
+        "title": "Unemployment Rate",
+        "frequency": "Monthly",
+        "units": "Percent",
+        "season": "Seasonally Adjusted",
+    },
+    {
+        "series_id": "CPIAUCSL",
+        "title": "Consumer Price Index for All Urban Consumers: All Items",
+        "frequency": "Monthly",
+        "units": "Index 1982-1984=100",
+        "season": "Seasonally Adjusted",
+    },
+    {
+        "series_id": "DGS10",
+        "title": "Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity",
+        "frequency": "Daily",
+        "units": "Percent",
+        "season": "Not Seasonally Adjusted",
+    },
+    {
+        "series_id": "LNU04000002",
+        "title": "Unemployment Rate - Women",
+        "frequency": "Monthly",
+        "units": "Percent",
+        "season": "Not Seasonally Adjusted",
+    },
+]
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    path = tmp_path / "series.csv"
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(ROWS[0]))
+        writer.writeheader()
+        writer.writerows(ROWS)
+    return path
+
+
+def test_bm25_ranks_and_round_trips(csv_path: Path, tmp_path: Path) -> None:
+    built = SeriesIndex.from_csv(csv_path)
+    built.save(tmp_path / "index.npz")
+    index = SeriesIndex.load(tmp_path / "index.npz")
+
+    hits = index.search("unemployment rate seasonally adjusted")
+    assert [h.series["id"] for h in hits[:2]] == ["UNRATE", "LNU04000002"]
+    assert index.search("10 year treasury yield")[0].series["id"] == "DGS10"
+    # A literal series id wins regardless of text overlap.
+    assert index.search("cpiaucsl")[0].series["id"] == "CPIAUCSL"
+    assert index.search("bitcoin") == []
+
+
+def test_search_series_prefers_local_index(
+    csv_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index = SeriesIndex.from_csv(csv_path)
+    monkeypatch.setattr(fred_tool, "get_series_index", lambda: index)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("FRED search API should not be called")
+
+    monkeypatch.setattr(fred_tool, "get_async_fred_client", fail)
+
+    payload = fred_tool.search_series("consumer price index")
+
+    assert payload["source"] == "local_index"
+    assert payload["results"][0]["id"] == "CPIAUCSL"
+    assert payload["results"][0]["units"] == "Index 1982-1984=100"
+
+
+def test_get_series_index_builds_from_csv(
+    csv_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FRED_SERIES_INDEX_PATH", str(tmp_path / "built.npz"))
+    monkeypatch.setenv("FRED_SERIES_CSV", str(csv_path))
+    series_index.get_series_index.cache_clear()
+    try:
+        index = series_index.get_series_index()
+    finally:
+        series_index.get_series_index.cache_clear()
+
+    assert index is not None and len(index) == 4
+    assert (tmp_path / "built.npz").exists()
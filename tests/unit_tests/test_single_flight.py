@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from retrieval_graph.single_flight import SingleFlight, normalize_args
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    flights = SingleFlight()
+    executions = 0
+
+    async def upstream() -> dict[str, int]:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    async def main() -> list[dict[str, int]]:
+        return await asyncio.gather(
+            *(flights.run("fred_recent_data", "payems", upstream) for _ in range(5)),
+            flights.run("fred_recent_data", "unrate", upstream),
+        )
+
+    results = asyncio.run(main())
+
+    assert executions == 2
+    assert results[0] is results[4]
+    assert flights.in_flight() == 0
+    assert flights.stats() == {
+        "fred_recent_data": {"calls": 6, "executions": 2, "coalesced": 4}
+    }
+
+    # Completed flights are not cached.
+    asyncio.run(flights.run("fred_recent_data", "payems", upstream))
+    assert executions == 3
+
+
+def test_followers_receive_the_leader_exception() -> None:
+    flights = SingleFlight()
+
+    async def failing() -> None:
+        await asyncio.sleep(0.02)
+        raise RuntimeError("upstream down")
+
+    async def main() -> list[object]:
+        return await asyncio.gather(
+            *(flights.run("fraser", "q", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flights.stats()["fraser"]["executions"] == 1
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        ({"series_id": "PAYEMS"}, {"series_id": " payems "}),
+        ({"series_id": "UNRATE", "max_points": None}, {"series_id": "UNRATE"}),
+        ({"a": 1, "b": "x"}, {"b": "x", "a": 1}),
+    ],
+)
+def test_normalize_args_is_canonical(
+    left: dict[str, object], right: dict[str, object]
+) -> None:
+    assert normalize_args(left) == normalize_args(right)
+
+
+def test_cancelling_the_leader_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+    executions = 0
+
+    async def upstream() -> str:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def main() -> list[object]:
+        leader = asyncio.ensure_future(flights.run("fred_recent_data", "k", upstream))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.ensure_future(flights.run("fred_recent_data", "k", upstream))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, *followers, return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["ok", "ok"]
+    assert executions == 1
+    assert flights.in_flight() == 0
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from retrieval_graph import warmup
+from retrieval_graph.rate_limiter import Priority, current_priority
+
+
+def test_warmup_warms_concurrently_and_records_failures() -> None:
+    seen: list[tuple[str, Priority]] = []
+    lock = threading.Lock()
+
+    def warm(series_id: str) -> None:
+        with lock:
+            seen.append((series_id, current_priority()))
+        time.sleep(0.1)
+        if series_id == "BAD":
+            raise ValueError("unknown series")
+
+    job = warmup.Warmup(["UNRATE", "GDP", "BAD", "UNRATE"], concurrency=3, warm=warm)
+    assert not job.ready
+
+    started = time.perf_counter()
+    report = job.run()
+
+    assert time.perf_counter() - started < 0.25
+    assert job.ready
+    assert sorted(report.warmed) == ["GDP", "UNRATE"]
+    assert report.failed == {"BAD": "unknown series"}
+    assert not report.timed_out
+    assert {priority for _, priority in seen} == {Priority.BACKGROUND}
+
+
+def test_warmup_reports_ready_when_budget_elapses() -> None:
+    release = threading.Event()
+
+    def warm(series_id: str) -> None:
+        if series_id == "SLOW":
+            release.wait(5)
+
+    job = warmup.Warmup(["FAST", "SLOW"], budget_seconds=0.1, warm=warm)
+    job.start()
+
+    assert job.wait(2)
+    status = job.status()
+    assert status["timed_out"] is True
+    assert status["warmed"] == ["FAST"]
+    assert status["pending"] == ["SLOW"]
+    release.set()
+
+
+def test_hot_series_is_configurable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FRED_WARMUP_SERIES", raising=False)
+    assert warmup.hot_series()[:2] == ["CPIAUCSL", "UNRATE"]
+    monkeypatch.setenv("FRED_WARMUP_SERIES", " payems, UNRATE ,")
+    assert warmup.hot_series() == ["PAYEMS", "UNRATE"]
+    monkeypatch.setenv("FRED_WARMUP_SERIES", "")
+    assert warmup.hot_series() == []
+
+
+def test_webapp_starts_warmup_and_reports_readiness(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fastapi.testclient import TestClient
+
+    from retrieval_graph import webapp
+
+    release = threading.Event()
+    job = warmup.Warmup(["SLOW"], budget_seconds=5, warm=lambda _: release.wait(5))
+    monkeypatch.setattr(webapp, "get_warmup", lambda: job)
+
+    with TestClient(webapp.app) as client:
+        pending = client.get("/ready")
+        assert pending.status_code == 503
+        assert pending.json()["pending"] == ["SLOW"]
+
+        release.set()
+        assert job.wait(2)
+        assert client.get("/ready").json()["warmed"] == ["SLOW"]